@@ -0,0 +1,74 @@
+"""
+Consumer Filtering Benchmark
+============================
+Time apply_consumer_filtering against the previous per-column loop on every
+QC'd dataset in QC/Data, and check that both give the same frame.
+
+Usage: python benchmark_consumer_filtering.py [--repeat N] [--qc-data DIR]
+"""
+
+import os
+import time
+import argparse
+import pandas as pd
+
+from consumer_export import apply_consumer_filtering, QC_DATA_DIR, read_qcd
+
+
+def apply_consumer_filtering_loop(df: pd.DataFrame) -> pd.DataFrame:
+    """Previous implementation: isin and .loc assignment per indicator column"""
+    acceptable_inds = {1, 5, 6}
+    ind_cols = [c for c in df.columns if c.startswith("ind_")]
+    for ind_col in ind_cols:
+        base_param = ind_col[len("ind_"):]
+        if base_param in df.columns:
+            mask_fail = ~df[ind_col].isin(acceptable_inds)
+            df.loc[mask_fail, base_param] = pd.NA
+    reason_cols = [c for c in df.columns if c.startswith("reason_")]
+    return df.drop(columns=ind_cols + reason_cols, errors="ignore")
+
+
+def best_time(func, df, repeat):
+    """Best-of-N time in seconds and the last result; each run gets a fresh copy"""
+    best, result = None, None
+    for _ in range(repeat):
+        frame = df.copy()
+        start = time.perf_counter()
+        result = func(frame)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark consumer QC blanking")
+    parser.add_argument('--repeat', '-r', type=int, default=5, help='Runs per dataset, best is reported (default: 5)')
+    parser.add_argument('--qc-data', '-q', default=QC_DATA_DIR, help='QC data directory (default: QC/Data)')
+    args = parser.parse_args()
+
+    files = sorted(f for f in os.listdir(args.qc_data) if f.startswith("buoy_") and f.endswith("_qcd.csv"))
+    if not files:
+        print(f"No QC data found in {args.qc_data}")
+        return
+
+    print(f"{'Dataset':<28} {'Rows':>8} {'Loop (ms)':>10} {'Mask (ms)':>10} {'Speedup':>8}")
+    print("-" * 68)
+    total_loop = total_mask = 0.0
+    for file_name in files:
+        df = read_qcd(os.path.join(args.qc_data, file_name))
+        loop_time, expected = best_time(apply_consumer_filtering_loop, df, args.repeat)
+        mask_time, result = best_time(apply_consumer_filtering, df, args.repeat)
+        pd.testing.assert_frame_equal(result, expected)
+
+        total_loop += loop_time
+        total_mask += mask_time
+        print(f"{file_name:<28} {len(df):>8,} {loop_time * 1000:>10.1f} {mask_time * 1000:>10.1f} "
+              f"{loop_time / mask_time:>7.1f}x")
+
+    print("-" * 68)
+    print(f"{'Total':<28} {'':>8} {total_loop * 1000:>10.1f} {total_mask * 1000:>10.1f} "
+          f"{total_loop / total_mask:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Consumer Format Benchmark
+=========================
+Export every QC'd dataset in QC/Data to each available consumer format in a
+temporary directory, then report the total size, the export time and the
+time a consumer takes to load the files back into DataFrames.
+
+Usage: python benchmark_consumer_formats.py [--repeat N] [--qc-data DIR]
+"""
+
+import io
+import os
+import time
+import contextlib
+import argparse
+import tempfile
+import numpy as np
+import pandas as pd
+
+from consumer_export import export_file, QC_DATA_DIR
+from consumer_formats import OUTPUT_FORMATS, missing_dependency
+
+
+def load_netcdf(path):
+    """Load a consumer NetCDF file back into a DataFrame"""
+    import netCDF4
+    with netCDF4.Dataset(path) as ds:
+        columns = {}
+        for name, var in ds.variables.items():
+            if var.dimensions != ("time",):
+                continue
+            values = np.ma.filled(var[:], np.nan) if var.dtype.kind == "f" else np.ma.getdata(var[:])
+            if name == "time":
+                values = pd.to_datetime(values, unit="s")
+            elif f"{name}_names" in ds.variables:
+                values = pd.Categorical.from_codes(values, ds[f"{name}_names"][:])
+            columns[name] = values
+    return pd.DataFrame(columns)
+
+
+def load_output(path, fmt):
+    if fmt == "parquet":
+        return pd.read_parquet(path)
+    if fmt == "nc":
+        return load_netcdf(path)
+    return pd.read_csv(path, parse_dates=["time"])
+
+
+def best_time(func, repeat):
+    """Best-of-N time in seconds"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark consumer output formats")
+    parser.add_argument('--repeat', '-r', type=int, default=3, help='Load runs per format, best is reported (default: 3)')
+    parser.add_argument('--qc-data', '-q', default=QC_DATA_DIR, help='QC data directory (default: QC/Data)')
+    args = parser.parse_args()
+
+    files = sorted(f for f in os.listdir(args.qc_data) if f.startswith("buoy_") and f.endswith("_qcd.csv"))
+    if not files:
+        print(f"No QC data found in {args.qc_data}")
+        return
+
+    formats = [fmt for fmt in OUTPUT_FORMATS if not missing_dependency(fmt)]
+    skipped = [fmt for fmt in OUTPUT_FORMATS if missing_dependency(fmt)]
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        print(f"{'Format':<10} {'Size (MB)':>10} {'Ratio':>7} {'Export (s)':>11} {'Load (s)':>9}")
+        print("-" * 51)
+        baseline = None
+        for fmt in formats:
+            paths = []
+            start = time.perf_counter()
+            for file_name in files:
+                station = file_name.split("_")[1]
+                out_base = os.path.join(out_dir, file_name.replace("_qcd.csv", "_consumer"))
+                with contextlib.redirect_stdout(io.StringIO()):
+                    out_names, _, _ = export_file(os.path.join(args.qc_data, file_name), station, {}, out_base, (fmt,))
+                paths.extend(os.path.join(out_dir, name) for name in out_names)
+            export_time = time.perf_counter() - start
+
+            size = sum(os.path.getsize(path) for path in paths)
+            baseline = baseline or size
+            load_time = best_time(lambda: [load_output(path, fmt) for path in paths], args.repeat)
+            print(f"{fmt:<10} {size / 1e6:>10.2f} {baseline / size:>6.1f}x {export_time:>11.2f} {load_time:>9.2f}")
+
+    if skipped:
+        print(f"\nSkipped (package not installed): {', '.join(skipped)}")
+
+
+if __name__ == "__main__":
+    main()
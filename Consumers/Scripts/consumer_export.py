@@ -3,148 +3,259 @@ Consumer Data Exporter
 ======================
 
 Builds consumer-ready CSVs from QC outputs with the following rules:
-- Include data from the live logger only (ignore backup logger data)
+- Include data from the live logger only (ignore backup logger data), judged
+  per record against the logger's Start/End window
 - Remove values that failed QC (keep rows; blank out failing values)
-- Exclude all indicator (ind_*) columns from outputs
+- Exclude all indicator (ind_*) and QC reason (reason_*) columns from outputs
 - Produce one CSV per buoy per year into Consumers/Data/
 
+Datasets are exported in memory by default. With --chunk-rows N each file
+is streamed instead: read N records at a time, filtered and appended to the
+output, so peak memory stays bounded however long the archive is. The
+streamed output matches the in-memory export; files whose records are not
+already in time order (which the in-memory path sorts) fall back to it.
+
+Files are independent jobs; --jobs N exports them in a process pool. Each
+output is written to a temp file and renamed into place, and console output
+is printed grouped per file in file order whatever the number of jobs.
+
+Outputs are plain CSV by default; --format selects one or more of csv,
+csv.gz, csv.zst, parquet and nc (CF NetCDF), written side by side in one
+pass (see consumer_formats.py).
+
 Usage:
-  python consumer_export.py
+  python consumer_export.py [--format FMT ...] [--jobs N] [--chunk-rows N]
 """
 
 import os
+import sys
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
-from datetime import datetime
 
 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "QC"))
+
+from qcd_store import read_qcd, read_qcd_chunks  # noqa: E402
+from logger_timeline import build_logger_timelines, filter_to_live_logger  # noqa: E402
+from logger_metadata import load_logger_info  # noqa: E402
+from worker_jobs import run_captured  # noqa: E402
+from consumer_formats import OUTPUT_FORMATS, missing_dependency, open_outputs, commit_outputs, discard_outputs  # noqa: E402
+
 QC_DATA_DIR = os.path.join(PROJECT_ROOT, "QC", "Data")
 BUOY_DATA_DIR = os.path.join(PROJECT_ROOT, "Buoy Data")
 OUTPUT_DIR = os.path.join(PROJECT_ROOT, "Consumers", "Data")
 
+# Indicators whose values are passed to consumers
+ACCEPTABLE_INDICATORS = [1, 5, 6]
+
 
 def load_logger_information(logger_csv_path: str) -> dict:
-    """Load live logger intervals per station from imdbon_log_of_loggers.csv
+    """Load logger intervals per station from imdbon_log_of_loggers.csv
 
-    Returns: dict[station] -> list of {logger_id, start_time, end_time, is_live}
+    Returns: dict[station] -> list of {logger_id, start_time, end_time, is_live, ...}
     """
-    logger_info: dict[str, list[dict]] = {}
-
     if not os.path.exists(logger_csv_path):
         print(f"Warning: Logger information file not found at {logger_csv_path}")
-        return logger_info
+        return {}
 
-    df = pd.read_csv(logger_csv_path)
+    # Shared with the QC processor and storm analyzer; cached alongside the log
+    return load_logger_info(logger_csv_path)
 
-    # Normalize and parse
-    def parse_dt(value: str):
-        if pd.isna(value):
-            return None
-        for fmt in ("%d/%m/%Y %H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M"):
-            try:
-                return datetime.strptime(str(value), fmt)
-            except Exception:
-                continue
-        # Fallback to pandas parser
-        try:
-            return pd.to_datetime(value, errors="coerce").to_pydatetime()
-        except Exception:
-            return None
 
-    for _, row in df.iterrows():
-        station = str(row.get("Buoy", "")).strip()
-        logger_id = str(row.get("Loggerid", "")).strip()
-        if not station or not logger_id:
-            continue
+def apply_consumer_filtering(df: pd.DataFrame) -> pd.DataFrame:
+    """Blank out values that failed QC, then drop indicator and reason columns.
 
-        start_time = parse_dt(row.get("Start"))
-        end_time = parse_dt(row.get("End")) if pd.notna(row.get("End")) else None
-        is_live = bool(row.get("Live", 0))
+    Passing indicators: 1 (OK), 5 (adjusted OK), 6 (Datawell Hmax OK)
+    Everything else (0, 4, 9, or missing) is treated as not acceptable for consumers.
 
-        if station not in logger_info:
-            logger_info[station] = []
-        logger_info[station].append(
-            {
-                "logger_id": logger_id,
-                "start_time": start_time,
-                "end_time": end_time,
-                "is_live": is_live,
-            }
-        )
+    All indicator columns are tested at once into one boolean acceptance
+    matrix (paired parameters x records), which masks the paired values with
+    np.where; float value columns keep their dtype. The output frame is
+    built in one step rather than assigned column by column, and df is not
+    modified.
+    """
+    # Identify indicator columns and the values they qualify
+    ind_cols = [c for c in df.columns if c.startswith("ind_")]
+    paired = [c for c in ind_cols if c[len("ind_"):] in df.columns]
+    reason_cols = [c for c in df.columns if c.startswith("reason_")]
+
+    # One row per paired parameter, so each parameter's mask is contiguous.
+    # Nullable (Int8) indicators are read with missing as NaN, which is never accepted
+    indicators = np.vstack([
+        df[c].to_numpy() if isinstance(df[c].dtype, np.dtype) else df[c].to_numpy(dtype="float64", na_value=np.nan)
+        for c in paired
+    ]) if paired else np.empty((0, len(df)))
+    accepted = np.logical_or.reduce([indicators == code for code in ACCEPTABLE_INDICATORS])
+
+    # Blank each value whose indicator is not accepted (missing stays missing)
+    masked = {}
+    for ind_col, row_accepted in zip(paired, accepted):
+        values = df[ind_col[len("ind_"):]]
+        if isinstance(values.dtype, np.dtype) and values.dtype.kind == "f":
+            masked[values.name] = np.where(row_accepted, values.to_numpy(), np.nan)
+        else:
+            masked[values.name] = values.where(row_accepted)
 
-    # Sort by start time
-    for station in logger_info:
-        logger_info[station].sort(key=lambda x: (x["start_time"] or datetime.min))
+    # Drop all indicator and QC failure reason columns from output
+    dropped = set(ind_cols + reason_cols)
+    return pd.DataFrame({c: masked.get(c, df[c]) for c in df.columns if c not in dropped}, index=df.index)
 
-    return logger_info
 
+def live_logger_timeline(df: pd.DataFrame, station: str, logger_timelines: dict):
+    """Station's logger timeline when the live-logger filter applies to df, else None
 
-def choose_live_logger_for_period(logger_info: dict, station: str, start_time: pd.Timestamp, end_time: pd.Timestamp):
-    """Pick the live logger covering the majority of [start_time, end_time]."""
-    if station not in logger_info:
-        return None
+    df is the whole dataset, or its first chunk when streaming.
+    """
+    if logger_timelines and "loggerid" in df.columns and len(df) > 0:
+        if station in logger_timelines:
+            return logger_timelines[station]
+        print("  Warning: No logger metadata for this station; skipping logger filter")
+    else:
+        print("  Logger metadata unavailable or no loggerid column; skipping logger filter")
+    return None
 
-    period_start = pd.to_datetime(start_time)
-    period_end = pd.to_datetime(end_time)
 
-    best_logger = None
-    best_coverage = 0.0
+def to_consumer_frame(df: pd.DataFrame, timeline=None):
+    """Consumer rows for a block of QC'd records, with the live logger IDs kept
 
-    for entry in logger_info[station]:
-        if not entry.get("is_live", False):
-            continue
+    Applies the live-logger filter (when a timeline is given) and consumer
+    filtering, then drops the logger identifier. Records are independent,
+    so a dataset can be converted whole or chunk by chunk.
+    """
+    live_ids = set()
+    if timeline is not None:
+        df = filter_to_live_logger(df, timeline)
+        live_ids = set(df["loggerid"].astype(str).str.strip().unique())
 
-        logger_start = entry["start_time"] or period_start.to_pydatetime()
-        logger_end = entry["end_time"] or period_end.to_pydatetime()
+    # Apply consumer filtering (blank failing values; drop indicators)
+    df = apply_consumer_filtering(df)
 
-        overlap_start = max(period_start.to_pydatetime(), logger_start)
-        overlap_end = min(period_end.to_pydatetime(), logger_end)
+    # Drop logger identifier from consumer outputs
+    drop_logger_cols = [c for c in df.columns if str(c).strip().lower() == "loggerid"]
+    if drop_logger_cols:
+        df = df.drop(columns=drop_logger_cols, errors="ignore")
 
-        if overlap_start < overlap_end:
-            overlap_seconds = (overlap_end - overlap_start).total_seconds()
-            period_seconds = max((period_end - period_start).total_seconds(), 1.0)
-            coverage = overlap_seconds / period_seconds
-            if coverage > best_coverage:
-                best_coverage = coverage
-                best_logger = entry
+    return df, live_ids
 
-    return best_logger if best_coverage > 0 else None
 
+def print_logger_filter(live_ids, before: int, after: int):
+    print(f"  Live logger(s): {', '.join(sorted(live_ids)) or 'none'} -> filtered {before} → {after} rows")
 
-def numeric_logger_token(logger_id: str) -> str:
-    """Extract a stable token used in data 'loggerid' for filtering (e.g., '8704' from '8704_CR6')."""
-    if not logger_id:
-        return ""
-    token = str(logger_id).split("_")[0].strip()
-    return token
 
+def export_file(file_path: str, station: str, logger_timelines: dict, out_base: str, formats=("csv",)):
+    """Export one QC'd dataset in memory; returns (output names, rows, columns)
 
-def apply_consumer_filtering(df: pd.DataFrame) -> pd.DataFrame:
-    """Blank out values that failed QC, then drop indicator columns.
+    Each output is written to a temp file and renamed into place, so
+    readers never see a partial file.
+    """
+    # Prefers the typed Parquet copy; time is already datetime
+    df = read_qcd(file_path)
+
+    # Sort by time for range and filtering
+    if "time" in df.columns:
+        df = df.sort_values("time", kind="stable").reset_index(drop=True)
+
+    # Filter to the logger that was live at each record's time when metadata available
+    timeline = live_logger_timeline(df, station, logger_timelines)
+    before = len(df)
+    df, live_ids = to_consumer_frame(df, timeline)
+    if timeline is not None:
+        print_logger_filter(live_ids, before, len(df))
+
+    outputs = open_outputs(out_base, formats, station)
+    try:
+        for _, writer in outputs:
+            writer.write(df)
+        out_names = commit_outputs(outputs)
+    except BaseException:
+        discard_outputs(outputs)
+        raise
+    return out_names, len(df), len(df.columns)
+
+
+def export_file_streaming(file_path: str, station: str, logger_timelines: dict, out_base: str,
+                          chunk_rows: int, formats=("csv",)):
+    """Export one QC'd dataset chunk by chunk; returns (output names, rows, columns)
+
+    Returns None when the records are not in time order (or the dataset is
+    empty), leaving the file to the in-memory export, which sorts them.
+    """
+    timeline, last_time, in_order = None, None, True
+    rows_in, rows_out, columns = 0, 0, None
+    live_ids = set()
+
+    outputs = open_outputs(out_base, formats, station)
+    try:
+        for chunk in read_qcd_chunks(file_path, chunk_rows):
+            if rows_in == 0:
+                timeline = live_logger_timeline(chunk, station, logger_timelines)
+
+            # Streaming keeps the stored order, so it must already be the sorted order
+            if "time" in chunk.columns and len(chunk) > 0:
+                times = chunk["time"]
+                if (times.isna().any() or not times.is_monotonic_increasing or
+                        (last_time is not None and times.iloc[0] < last_time)):
+                    in_order = False
+                    break
+                last_time = times.iloc[-1]
+
+            consumer, chunk_ids = to_consumer_frame(chunk, timeline)
+            for _, writer in outputs:
+                writer.write(consumer)
+            rows_in += len(chunk)
+            rows_out += len(consumer)
+            columns = len(consumer.columns)
+            live_ids |= chunk_ids
+
+        if not in_order or rows_in == 0:
+            discard_outputs(outputs)
+            if not in_order:
+                print("  Records not in time order; exporting in memory")
+            return None
 
-    Passing indicators: 1 (OK), 5 (adjusted OK), 6 (Datawell Hmax OK)
-    Everything else (0, 4, 9, or missing) is treated as not acceptable for consumers.
+        out_names = commit_outputs(outputs)
+    except BaseException:
+        discard_outputs(outputs)
+        raise
+
+    if timeline is not None:
+        print_logger_filter(live_ids, rows_in, rows_out)
+    return out_names, rows_out, columns
+
+
+def export_station_year(file_name: str, station: str, year: str, qc_data_dir: str, output_dir: str,
+                        logger_timelines: dict, chunk_rows=None, formats=("csv",)):
+    """Export one buoy_{station}_{year}_qcd.csv in each format
+
+    Returns a list of (out_name, rows, columns), one per format.
     """
-    acceptable_inds = {1, 5, 6}
+    print(f"Processing {file_name} ...")
+    file_path = os.path.join(qc_data_dir, file_name)
+    out_base = os.path.join(output_dir, f"buoy_{station}_{year}_consumer")
 
-    # Identify indicator columns
-    ind_cols = [c for c in df.columns if c.startswith("ind_")]
+    written = None
+    if chunk_rows:
+        written = export_file_streaming(file_path, station, logger_timelines, out_base, chunk_rows, formats)
+    if written is None:
+        written = export_file(file_path, station, logger_timelines, out_base, formats)
 
-    # For each indicator column, blank out the paired value when indicator is not acceptable
-    for ind_col in ind_cols:
-        base_param = ind_col[len("ind_"):]
-        if base_param in df.columns:
-            mask_fail = ~df[ind_col].isin(acceptable_inds)
-            # Preserve missing as missing; blank only those explicitly not accepted
-            df.loc[mask_fail, base_param] = pd.NA
+    out_names, rows, columns = written
+    for out_name in out_names:
+        print(f"  Wrote {out_name} with {rows:,} rows and {columns} columns")
+    return [(out_name, rows, columns) for out_name in out_names]
 
-    # Drop all indicator columns from output
-    df = df.drop(columns=ind_cols, errors="ignore")
 
-    return df
 
+def export_consumers_data(chunk_rows=None, jobs=1, formats=("csv",)):
+    """Export consumer files for every QC'd dataset in each of formats
 
-def export_consumers_data():
+    chunk_rows streams each dataset in chunks of that many records instead
+    of loading it whole. With jobs > 1 files are exported in a process
+    pool; output is still printed per file in file order.
+    """
     print("=== CONSUMER EXPORT START ===")
 
     os.makedirs(OUTPUT_DIR, exist_ok=True)
@@ -152,6 +263,7 @@ def export_consumers_data():
     # Load logger metadata
     logger_csv = os.path.join(BUOY_DATA_DIR, "imdbon_log_of_loggers.csv")
     logger_info = load_logger_information(logger_csv)
+    logger_timelines = build_logger_timelines(logger_info)
 
     # Discover QC Data files
     qc_files = [f for f in os.listdir(QC_DATA_DIR) if f.endswith("_qcd.csv") and f.startswith("buoy_")]
@@ -159,8 +271,7 @@ def export_consumers_data():
         print("No QC data found to export.")
         return 0
 
-    total_written = 0
-
+    export_jobs = []
     for file_name in sorted(qc_files):
         # Expect format: buoy_{station}_{year}_qcd.csv
         # Example: buoy_62091_2024_qcd.csv
@@ -171,64 +282,65 @@ def export_consumers_data():
         except Exception:
             print(f"Skipping unrecognized file name: {file_name}")
             continue
-
-        file_path = os.path.join(QC_DATA_DIR, file_name)
-        print(f"Processing {file_name} ...")
-
-        try:
-            df = pd.read_csv(file_path)
-        except Exception as e:
-            print(f"  Failed to read: {e}")
-            continue
-
-        # Ensure time is datetime for range and sorting
-        if "time" in df.columns:
-            df["time"] = pd.to_datetime(df["time"], errors="coerce")
-            df = df.sort_values("time").reset_index(drop=True)
-
-        # Filter to live logger only when metadata available
-        if logger_info and "loggerid" in df.columns and len(df) > 0:
-            start_time = df["time"].min() if "time" in df.columns else None
-            end_time = df["time"].max() if "time" in df.columns else None
-
-            live_logger = None
-            if start_time is not None and end_time is not None:
-                live_logger = choose_live_logger_for_period(logger_info, station, start_time, end_time)
-
-            if live_logger:
-                token = numeric_logger_token(live_logger["logger_id"])
-                if token:
-                    before = len(df)
-                    df = df[df["loggerid"].astype(str).str.contains(token, na=False)].copy()
-                    after = len(df)
-                    print(f"  Live logger: {live_logger['logger_id']} -> filtered {before} → {after} rows")
-                else:
-                    print("  Warning: Could not derive numeric token for live logger; skipping logger filter")
+        export_jobs.append((file_name, station, year, QC_DATA_DIR, OUTPUT_DIR, logger_timelines, chunk_rows, formats))
+
+    # Files are independent; fan them out when jobs > 1
+    executor = None
+    pending = {}
+    if jobs > 1 and len(export_jobs) > 1:
+        print(f"Exporting {len(export_jobs)} files with {jobs} worker processes")
+        executor = ProcessPoolExecutor(max_workers=jobs)
+        for job_args in export_jobs:
+            pending[job_args[0]] = executor.submit(run_captured, export_station_year, *job_args)
+
+    written, failures = [], {}
+    try:
+        for job_args in export_jobs:
+            file_name = job_args[0]
+            if executor is not None:
+                try:
+                    output, result, error = pending[file_name].result()
+                except Exception as e:
+                    output, result, error = '', None, f"{type(e).__name__}: {e}"
+                print(output, end='')
             else:
-                print("  Warning: Live logger not identified for this period; skipping logger filter")
-        else:
-            print("  Logger metadata unavailable or no loggerid column; skipping logger filter")
-
-        # Apply consumer filtering (blank failing values; drop indicators)
-        df = apply_consumer_filtering(df)
-
-        # Drop logger identifier from consumer outputs
-        drop_logger_cols = [c for c in df.columns if str(c).strip().lower() == "loggerid"]
-        if drop_logger_cols:
-            df = df.drop(columns=drop_logger_cols, errors="ignore")
-
-        # Write output file
-        out_name = f"buoy_{station}_{year}_consumer.csv"
-        out_path = os.path.join(OUTPUT_DIR, out_name)
-        df.to_csv(out_path, index=False)
-        print(f"  Wrote {out_name} with {len(df):,} rows and {len(df.columns)} columns")
-        total_written += 1
+                _, result, error = run_captured(export_station_year, *job_args, capture_output=False)
 
+            if error:
+                print(f"  Failed to export: {error}")
+                failures[file_name] = error
+            else:
+                written.extend(result)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    # Ordered summary
+    print(f"\n{'Output':<34} {'Rows':>10} {'Columns':>8}")
+    for out_name, rows, columns in written:
+        print(f"{out_name:<34} {rows:>10,} {columns:>8}")
+    for file_name, error in failures.items():
+        print(f"{file_name:<34} FAILED - {error}")
+
+    total_written = len(written)
     print(f"=== CONSUMER EXPORT COMPLETE: {total_written} file(s) written ===")
     return total_written
 
 
 if __name__ == "__main__":
-    export_consumers_data()
+    parser = argparse.ArgumentParser(description="Export consumer-ready CSVs from QC'd datasets")
+    parser.add_argument("--format", "-f", nargs="+", default=["csv"], choices=list(OUTPUT_FORMATS),
+                        dest="formats", help="Output format(s) written for each dataset (default: csv)")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Number of worker processes exporting files in parallel (default: 1)")
+    parser.add_argument("--chunk-rows", type=int, default=None,
+                        help="Stream each dataset in chunks of N records to bound memory (default: load whole files)")
+    args = parser.parse_args()
+
+    for fmt in args.formats:
+        if missing_dependency(fmt):
+            parser.error(f"format {fmt} needs the {missing_dependency(fmt)} package")
+
+    export_consumers_data(chunk_rows=args.chunk_rows, jobs=args.jobs, formats=tuple(dict.fromkeys(args.formats)))
 
 
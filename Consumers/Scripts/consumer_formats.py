@@ -0,0 +1,277 @@
+"""
+Consumer Output Formats
+=======================
+
+Writers for the consumer export, keyed by format name (also the file
+extension):
+- csv      plain CSV (default)
+- csv.gz   gzip-compressed CSV
+- csv.zst  Zstandard-compressed CSV (needs zstandard)
+- parquet  Parquet keeping the typed columns, zstd-compressed (needs pyarrow)
+- nc       CF-1.8 NetCDF4 time series, one variable per column (needs netCDF4);
+           text columns are indexes into a {column}_names table
+
+A writer is opened on a path, receives the consumer frame in one or more
+time-ordered blocks through write(), and is finished with close(), so the
+same writers serve the in-memory and the streaming export. Parquet fields
+and NetCDF variables carry long_name/units/standard_name from the shared
+parameter metadata. Compressed outputs are reproducible: gzip headers carry
+no name or timestamp.
+"""
+
+import io
+import os
+import gzip
+import numpy as np
+import pandas as pd
+
+from parameter_metadata import cf_attributes
+from qcd_store import PARQUET_ROW_GROUP_ROWS
+
+# Optional format backends
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+try:
+    import netCDF4
+    NETCDF_AVAILABLE = True
+except ImportError:
+    NETCDF_AVAILABLE = False
+
+# Written explicitly so every streamed block formats times the same way
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 9
+
+# Records per NetCDF chunk along the (unlimited) time dimension
+NETCDF_CHUNK_RECORDS = 4096
+NETCDF_TIME_UNITS = "seconds since 1970-01-01 00:00:00"
+
+# Position columns (including sensor duplicates such as latitude_1)
+COORDINATE_ATTRIBUTES = {
+    'latitude': {'long_name': 'Latitude', 'units': 'degrees_north', 'standard_name': 'latitude'},
+    'longitude': {'long_name': 'Longitude', 'units': 'degrees_east', 'standard_name': 'longitude'}
+}
+
+
+def column_attributes(column):
+    """CF attributes for a consumer column; empty when nothing is known"""
+    base = column.rsplit('_', 1)[0] if column[-1:].isdigit() else column
+    if base in COORDINATE_ATTRIBUTES:
+        return dict(COORDINATE_ATTRIBUTES[base])
+    return cf_attributes(column)
+
+
+def _numpy_dtype(series):
+    """numpy dtype of a column, unwrapping pandas nullable dtypes (Int8 -> int8)"""
+    return np.dtype(getattr(series.dtype, "numpy_dtype", series.dtype))
+
+
+class CSVWriter:
+    """Plain CSV, header written with the first block"""
+
+    def __init__(self, path, station):
+        self._handle = self._open(path)
+        self._header = True
+
+    def _open(self, path):
+        return open(path, "w", encoding="utf-8", newline="")
+
+    def write(self, df):
+        df.to_csv(self._handle, index=False, header=self._header, date_format=TIME_FORMAT)
+        self._header = False
+
+    def close(self):
+        self._handle.close()
+
+
+class GzipCSVWriter(CSVWriter):
+    """gzip-compressed CSV"""
+
+    def _open(self, path):
+        self._raw = open(path, "wb")
+        # No file name or mtime in the header, so identical data gives identical files
+        compressed = gzip.GzipFile(filename="", mode="wb", fileobj=self._raw, compresslevel=GZIP_LEVEL, mtime=0)
+        return io.TextIOWrapper(compressed, encoding="utf-8", newline="")
+
+    def close(self):
+        super().close()
+        self._raw.close()
+
+
+class ZstdCSVWriter(CSVWriter):
+    """Zstandard-compressed CSV"""
+
+    def _open(self, path):
+        compressed = zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(open(path, "wb"))
+        return io.TextIOWrapper(compressed, encoding="utf-8", newline="")
+
+
+class ParquetWriter:
+    """Parquet, one row group per block of up to PARQUET_ROW_GROUP_ROWS records"""
+
+    def __init__(self, path, station):
+        self._path = path
+        self._station = station
+        self._schema = None
+        self._writer = None
+
+    def _first_schema(self, table):
+        fields = []
+        for field in table.schema:
+            attrs = column_attributes(field.name)
+            fields.append(field.with_metadata(attrs) if attrs else field)
+        metadata = dict(table.schema.metadata or {})
+        metadata[b"station"] = str(self._station).encode("utf-8")
+        return pa.schema(fields, metadata=metadata)
+
+    def write(self, df):
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self._writer is None:
+            self._schema = self._first_schema(table)
+            self._writer = pq.ParquetWriter(self._path, self._schema, compression="zstd")
+        # Blocks may differ in nullability of flag columns; keep the first block's types
+        self._writer.write_table(table.cast(self._schema), row_group_size=PARQUET_ROW_GROUP_ROWS)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+class NetCDFWriter:
+    """CF-1.8 NetCDF4 time series along an unlimited time dimension"""
+
+    def __init__(self, path, station):
+        self._dataset = netCDF4.Dataset(path, "w", format="NETCDF4")
+        self._dataset.createDimension("time", None)
+        self._dataset.setncatts({
+            "Conventions": "CF-1.8",
+            "featureType": "timeSeries",
+            "title": f"Buoy {station} consumer data",
+            "source": "QC'd buoy observations; values failing QC are missing",
+            "station_id": str(station)
+        })
+        station_var = self._dataset.createVariable("station", str)
+        station_var.cf_role = "timeseries_id"
+        station_var.long_name = "Station identifier"
+        station_var[0] = str(station)
+        self._variables = None
+        self._names = {}
+        self._rows = 0
+
+    def _create_variables(self, df):
+        self._variables = {}
+        for col in df.columns:
+            series = df[col]
+            options = {"zlib": True, "complevel": 4, "chunksizes": (NETCDF_CHUNK_RECORDS,)}
+            if col == "time":
+                var = self._dataset.createVariable("time", "f8", ("time",), fill_value=np.nan, **options)
+                var.setncatts({"standard_name": "time", "long_name": "Time", "units": NETCDF_TIME_UNITS,
+                               "calendar": "standard", "axis": "T"})
+            elif pd.api.types.is_float_dtype(series):
+                var = self._dataset.createVariable(col, _numpy_dtype(series), ("time",), fill_value=np.nan, **options)
+            elif pd.api.types.is_integer_dtype(series):
+                dtype = _numpy_dtype(series)
+                fill_value = netCDF4.default_fillvals[dtype.str[1:]]
+                var = self._dataset.createVariable(col, dtype, ("time",), fill_value=fill_value, **options)
+            else:
+                # Text columns (source file names) repeat heavily; store indexes into a name table
+                self._dataset.createDimension(f"{col}_names", None)
+                self._names[col] = (self._dataset.createVariable(f"{col}_names", str, (f"{col}_names",)), {})
+                var = self._dataset.createVariable(col, "i4", ("time",), fill_value=-1, **options)
+                var.comment = f"Index into {col}_names"
+            if col != "time":
+                var.setncatts(column_attributes(col))
+            self._variables[col] = var
+
+    def _values(self, col, series):
+        var = self._variables[col]
+        if col == "time":
+            epoch_seconds = (series - pd.Timestamp("1970-01-01")) / pd.Timedelta(seconds=1)
+            return epoch_seconds.to_numpy(dtype="float64", na_value=np.nan)
+        if col in self._names:
+            names, codes = self._names[col]
+            for name in pd.unique(series.dropna().astype(str)):
+                if name not in codes:
+                    codes[name] = len(codes)
+                    names[codes[name]] = name
+            return series.astype(object).map(codes).to_numpy(dtype="int32", na_value=-1)
+        if np.issubdtype(var.dtype, np.integer):
+            return series.to_numpy(dtype=var.dtype, na_value=var._FillValue)
+        return series.to_numpy(dtype=var.dtype, na_value=np.nan)
+
+    def write(self, df):
+        if self._variables is None:
+            self._create_variables(df)
+        block = slice(self._rows, self._rows + len(df))
+        for col, series in df.items():
+            self._variables[col][block] = self._values(col, series)
+        self._rows += len(df)
+
+    def close(self):
+        self._dataset.close()
+
+
+# Format name -> (writer, available, optional dependency)
+OUTPUT_FORMATS = {
+    "csv": (CSVWriter, True, None),
+    "csv.gz": (GzipCSVWriter, True, None),
+    "csv.zst": (ZstdCSVWriter, ZSTD_AVAILABLE, "zstandard"),
+    "parquet": (ParquetWriter, PARQUET_AVAILABLE, "pyarrow"),
+    "nc": (NetCDFWriter, NETCDF_AVAILABLE, "netCDF4")
+}
+
+
+def missing_dependency(fmt):
+    """Package a format needs but is not installed, or None"""
+    _, available, dependency = OUTPUT_FORMATS[fmt]
+    return None if available else dependency
+
+
+def open_outputs(out_base, formats, station):
+    """Open one writer per format on a temp file beside out_base.{format}
+
+    Returns a list of (out_path, writer); pass it to commit_outputs or
+    discard_outputs.
+    """
+    outputs = []
+    try:
+        for fmt in formats:
+            out_path = f"{out_base}.{fmt}"
+            writer_class = OUTPUT_FORMATS[fmt][0]
+            outputs.append((out_path, writer_class(out_path + ".tmp", station)))
+    except BaseException:
+        discard_outputs(outputs)
+        raise
+    return outputs
+
+
+def commit_outputs(outputs):
+    """Finish every writer and rename its temp file into place"""
+    for _, writer in outputs:
+        writer.close()
+    for out_path, _ in outputs:
+        os.replace(out_path + ".tmp", out_path)
+    return [os.path.basename(out_path) for out_path, _ in outputs]
+
+
+def discard_outputs(outputs):
+    """Close writers and remove their temp files, leaving existing outputs untouched"""
+    for out_path, writer in outputs:
+        try:
+            writer.close()
+        except Exception:
+            pass
+        if os.path.exists(out_path + ".tmp"):
+            os.remove(out_path + ".tmp")
@@ -0,0 +1,66 @@
+"""
+Import Time Benchmark
+=====================
+Time cold imports of the QC and storm modules, each in a fresh interpreter,
+to check that limit lookups do not pull in the plotting and PDF stacks.
+
+Usage: python benchmark_imports.py [--repeat N]
+"""
+
+import os
+import sys
+import argparse
+import subprocess
+
+QC_DIR = os.path.dirname(os.path.abspath(__file__))
+STORMS_DIR = os.path.join(os.path.dirname(QC_DIR), "Storms")
+
+# (label, statement) pairs; pandas and the render stack are shown for reference
+IMPORTS = [
+    ("pandas (baseline)", "import pandas"),
+    ("qc_config", "import qc_config"),
+    ("buoy_qc_processor", "import buoy_qc_processor"),
+    ("storm_analyzer", "import storm_analyzer"),
+    ("matplotlib.pyplot + reportlab", "import matplotlib.pyplot, reportlab.platypus"),
+]
+
+HEAVY_MODULES = ["matplotlib", "seaborn", "plotly", "reportlab", "markdown"]
+
+TIMER = """
+import sys, time
+sys.path[:0] = {paths!r}
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(elapsed, ','.join(heavy))
+"""
+
+
+def time_import(statement, repeat=3):
+    """Best-of-N cold import time in seconds and heavy modules it loaded"""
+    script = TIMER.format(paths=[QC_DIR, STORMS_DIR], statement=statement, heavy=HEAVY_MODULES)
+    best, heavy = None, ''
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                                cwd=QC_DIR).stdout.split()
+        elapsed = float(output[0])
+        heavy = output[1] if len(output) > 1 else ''
+        best = elapsed if best is None else min(best, elapsed)
+    return best, heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold import time of the QC and storm modules")
+    parser.add_argument('--repeat', '-r', type=int, default=3, help='Runs per import, best is reported (default: 3)')
+    args = parser.parse_args()
+
+    print(f"{'Import':<32} {'Time (ms)':>10}  Plotting/PDF modules loaded")
+    print("-" * 75)
+    for label, statement in IMPORTS:
+        elapsed, heavy = time_import(statement, args.repeat)
+        print(f"{label:<32} {elapsed * 1000:>10.0f}  {heavy.replace(',', ', ') or '-'}")
+
+
+if __name__ == "__main__":
+    main()
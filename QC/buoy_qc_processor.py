@@ -12,362 +12,62 @@ Based on the QC framework from readme.md with indicators:
 - 5: QC performed, raw data not OK but value adjusted/interpolated
 - 6: QC performed, data OK (Datawell Hmax sensor specific)
 - 9: Data missing
+
+Each tested parameter also gets a reason_* column recording which
+automatic test failed it:
+- 0: Not failed
+- 1: Range failure
+- 2: Spike failure
+- 3: Flat line failure
+- 9: Data missing
 """
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
 import os
+import json
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 import warnings
-import markdown
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-import base64
+from qc_checks import run_qc_kernel, LIMIT_FIELDS, FLAT_LINE_MIN_RUN, REASON_LABELS
+from qcd_store import write_qcd, read_qcd
+from raw_schema import read_raw_file
+from logger_timeline import filter_to_live_logger
+from qc_config import QCConfig
+from report_model import Report, write_markdown, build_story, sample_styles
+from plot_decimation import envelope_bands, DEFAULT_PLOT_MAX_POINTS
+from figure_cache import figure_key, is_cached, png_metadata
+from worker_jobs import run_captured
 warnings.filterwarnings('ignore')
 
-class BuoyQCProcessor:
-    def __init__(self, input_dir="../Buoy Data", output_dir="../QC/Data", scripts_dir="../QC"):
-        self.input_dir = input_dir
+# Bump when a change to the QC logic should invalidate previous outputs
+MANIFEST_VERSION = 2
+
+# Bump when a change to the overview figure should invalidate cached images
+OVERVIEW_FIGURE_VERSION = 1
+
+# Parameters drawn in the overview panels
+OVERVIEW_PARAMETERS = ['airpressure', 'airtemp', 'windsp', 'hm0', 'winddir']
+
+class BuoyQCProcessor(QCConfig):
+    def __init__(self, input_dir="../Buoy Data", output_dir="../QC/Data", scripts_dir="../QC",
+                 plot_max_points=DEFAULT_PLOT_MAX_POINTS, figure_cache=True):
         self.output_dir = output_dir
         self.scripts_dir = scripts_dir
         
-        # Load QC limits from CSV file
-        self.default_qc_limits = {}
-        self.station_qc_limits = {}
-        self.load_qc_limits_from_csv()
-        
-        # Load logger information to determine which logger was live
-        self.logger_info = {}
-        self.load_logger_information()
-        
-        # Key parameters for visualization
-        self.key_parameters = [
-            'airpressure', 'airtemp', 'humidity', 'windsp', 'windgust', 'winddir', 
-            'hm0', 'hmax', 'tp', 'mdir', 'seatemp_aa'
-        ]
-    
-    def load_qc_limits_from_csv(self):
-        """Load QC limits from CSV file in Buoy Data folder"""
-        qc_limits_file = os.path.join(self.input_dir, "qc_limits.csv")
-        
-        try:
-            if not os.path.exists(qc_limits_file):
-                print(f"Warning: QC limits file not found at {qc_limits_file}")
-                print("Using fallback hardcoded limits...")
-                self._load_fallback_limits()
-                return
-            
-            print(f"Loading QC limits from {qc_limits_file}...")
-            df = pd.read_csv(qc_limits_file)
-            
-            # Initialize dictionaries
-            self.default_qc_limits = {}
-            self.station_qc_limits = {}
-            
-            # Process each row
-            for _, row in df.iterrows():
-                param = row['parameter']
-                station = row['station']
-                min_val = float(row['min_value']) if pd.notna(row['min_value']) else None
-                max_val = float(row['max_value']) if pd.notna(row['max_value']) else None
-                spike_threshold = float(row['spike_threshold']) if pd.notna(row['spike_threshold']) else None
-                
-                # Build limits dictionary for this parameter
-                limits = {}
-                if min_val is not None:
-                    limits['min'] = min_val
-                if max_val is not None:
-                    limits['max'] = max_val
-                if spike_threshold is not None:
-                    limits['spike_threshold'] = spike_threshold
-                
-                # Store in appropriate dictionary
-                if station == 'default':
-                    self.default_qc_limits[param] = limits
-                else:
-                    if station not in self.station_qc_limits:
-                        self.station_qc_limits[station] = {}
-                    self.station_qc_limits[station][param] = limits
-            
-            print(f"Loaded QC limits: {len(self.default_qc_limits)} default parameters, "
-                  f"{len(self.station_qc_limits)} stations with custom limits")
-            
-        except Exception as e:
-            print(f"Error loading QC limits from CSV: {e}")
-            print("Using fallback hardcoded limits...")
-            self._load_fallback_limits()
-    
-    def _load_fallback_limits(self):
-        """Load fallback hardcoded QC limits if CSV loading fails"""
-        print("Loading fallback hardcoded QC limits...")
-        
-        # Default limits applied to all stations unless overridden
-        self.default_qc_limits = {
-            'airpressure': {'min': 950.0, 'max': 1050.0, 'spike_threshold': 10.0},
-            'airtemp': {'min': -20.0, 'max': 40.0, 'spike_threshold': 5.0},
-            'humidity': {'min': 0.0, 'max': 100.0, 'spike_threshold': 20.0},
-            'seatemp_16': {'min': -2.0, 'max': 30.0, 'spike_threshold': 3.0},
-            'seatemp_aa': {'min': -2.0, 'max': 30.0, 'spike_threshold': 3.0},
-            'windsp': {'min': 0.0, 'max': 50.0, 'spike_threshold': 15.0},
-            'windgust': {'min': 0.0, 'max': 60.0, 'spike_threshold': 20.0},
-            'winddir': {'min': 0.0, 'max': 360.0, 'spike_threshold': 180.0},
-            'hm0': {'min': 0.0, 'max': 15.0, 'spike_threshold': 3.0},
-            'hmax': {'min': 0.0, 'max': 25.0, 'spike_threshold': 5.0},
-            'tp': {'min': 1.0, 'max': 25.0, 'spike_threshold': 10.0},
-            'mdir': {'min': 0.0, 'max': 360.0, 'spike_threshold': 180.0},
-            'salinity_16': {'min': 20.0, 'max': 40.0, 'spike_threshold': 5.0}
-        }
-        
-        # Station-specific QC limits (overrides defaults where specified)
-        self.station_qc_limits = {
-            '62091': {  # More exposed Atlantic location
-                'hm0': {'min': 0.0, 'max': 18.0, 'spike_threshold': 4.0},
-                'hmax': {'min': 0.0, 'max': 30.0, 'spike_threshold': 6.0},
-                'windsp': {'min': 0.0, 'max': 60.0, 'spike_threshold': 20.0},
-                'windgust': {'min': 0.0, 'max': 80.0, 'spike_threshold': 25.0},
-                'seatemp_aa': {'min': 4.0, 'max': 18.0, 'spike_threshold': 2.0}
-            },
-            '62092': {  # Coastal/sheltered location
-                'hm0': {'min': 0.0, 'max': 12.0, 'spike_threshold': 2.5},
-                'hmax': {'min': 0.0, 'max': 20.0, 'spike_threshold': 4.0},
-                'seatemp_aa': {'min': 6.0, 'max': 20.0, 'spike_threshold': 2.5},
-                'salinity_16': {'min': 25.0, 'max': 35.0, 'spike_threshold': 3.0}
-            },
-            '62093': {  # Intermediate exposure
-                'hm0': {'min': 0.0, 'max': 15.0, 'spike_threshold': 3.5},
-                'hmax': {'min': 0.0, 'max': 25.0, 'spike_threshold': 5.0},
-                'seatemp_aa': {'min': 5.0, 'max': 19.0, 'spike_threshold': 2.5}
-            },
-            '62094': {  # Similar to 62093 but slightly different conditions
-                'hm0': {'min': 0.0, 'max': 16.0, 'spike_threshold': 3.5},
-                'hmax': {'min': 0.0, 'max': 26.0, 'spike_threshold': 5.5},
-                'windsp': {'min': 0.0, 'max': 55.0, 'spike_threshold': 18.0},
-                'seatemp_aa': {'min': 4.5, 'max': 18.5, 'spike_threshold': 2.5}
-            },
-            '62095': {  # Unique location with specific characteristics
-                'airtemp': {'min': -15.0, 'max': 35.0, 'spike_threshold': 4.0},
-                'hm0': {'min': 0.0, 'max': 14.0, 'spike_threshold': 3.0},
-                'hmax': {'min': 0.0, 'max': 22.0, 'spike_threshold': 4.5},
-                'seatemp_aa': {'min': 6.0, 'max': 19.0, 'spike_threshold': 2.0}
-            }
-        }
-        
-        print("Fallback limits loaded successfully")
-    
-    def load_logger_information(self):
-        """Load logger information from imdbon_log_of_loggers.csv to determine live loggers"""
-        logger_file = os.path.join(self.input_dir, "imdbon_log_of_loggers.csv")
-        
-        try:
-            if not os.path.exists(logger_file):
-                print(f"Warning: Logger information file not found at {logger_file}")
-                print("Will process all data without logger filtering...")
-                return
-            
-            print(f"Loading logger information from {logger_file}...")
-            df = pd.read_csv(logger_file)
-            
-            # Process each logger entry
-            for _, row in df.iterrows():
-                station = str(row['Buoy'])
-                logger_id = str(row['Loggerid']).strip()
-                start_time = pd.to_datetime(row['Start'], format='%d/%m/%Y %H:%M', errors='coerce')
-                end_time = pd.to_datetime(row['End'], format='%d/%m/%Y %H:%M', errors='coerce') if pd.notna(row['End']) else None
-                is_live = bool(row['Live'])
-                live_wave = bool(row['Live_wave']) if pd.notna(row['Live_wave']) else False
-                
-                if pd.isna(start_time):
-                    print(f"Warning: Invalid start time for {station} - {logger_id}")
-                    continue
-                
-                # Initialize station entry if not exists
-                if station not in self.logger_info:
-                    self.logger_info[station] = []
-                
-                # Add logger entry
-                logger_entry = {
-                    'logger_id': logger_id,
-                    'start_time': start_time,
-                    'end_time': end_time,
-                    'is_live': is_live,
-                    'live_wave': live_wave,
-                    'comment': str(row['Comment']) if pd.notna(row['Comment']) else ''
-                }
-                
-                self.logger_info[station].append(logger_entry)
-            
-            # Sort each station's loggers by start time
-            for station in self.logger_info:
-                self.logger_info[station].sort(key=lambda x: x['start_time'])
-            
-            print(f"Loaded logger information for {len(self.logger_info)} stations")
-            
-        except Exception as e:
-            print(f"Error loading logger information: {e}")
-            print("Will process all data without logger filtering...")
-    
-    def get_live_logger_for_time(self, station, target_time):
-        """Get the logger that was live for a specific station and time"""
-        if station not in self.logger_info:
-            return None
-        
-        target_time = pd.to_datetime(target_time)
-        
-        for logger_entry in self.logger_info[station]:
-            start_time = logger_entry['start_time']
-            end_time = logger_entry['end_time']
-            
-            # Check if target time falls within this logger's active period
-            if target_time >= start_time:
-                if end_time is None or target_time <= end_time:
-                    if logger_entry['is_live']:
-                        return logger_entry
-        
-        return None
-    
-    def get_live_loggers_for_period(self, station, start_time, end_time):
-        """Get ALL live loggers that overlap with a time period"""
-        if station not in self.logger_info:
-            return []
-        
-        start_time = pd.to_datetime(start_time)
-        end_time = pd.to_datetime(end_time)
-        
-        live_loggers = []
-        
-        for logger_entry in self.logger_info[station]:
-            if not logger_entry['is_live']:
-                continue
-                
-            logger_start = logger_entry['start_time']
-            logger_end = logger_entry['end_time'] if logger_entry['end_time'] is not None else end_time
-            
-            # Check if there's any overlap
-            overlap_start = max(start_time, logger_start)
-            overlap_end = min(end_time, logger_end)
-            
-            if overlap_start < overlap_end:
-                live_loggers.append(logger_entry)
-        
-        return live_loggers
-    
-    def get_live_logger_for_period(self, station, start_time, end_time):
-        """Get the logger that was live for the majority of a time period"""
-        if station not in self.logger_info:
-            return None
-        
-        start_time = pd.to_datetime(start_time)
-        end_time = pd.to_datetime(end_time)
-        
-        # Find logger that covers the majority of the time period
-        best_logger = None
-        best_coverage = 0
-        
-        for logger_entry in self.logger_info[station]:
-            if not logger_entry['is_live']:
-                continue
-                
-            logger_start = logger_entry['start_time']
-            logger_end = logger_entry['end_time'] if logger_entry['end_time'] is not None else end_time
-            
-            # Calculate overlap
-            overlap_start = max(start_time, logger_start)
-            overlap_end = min(end_time, logger_end)
-            
-            if overlap_start < overlap_end:
-                overlap_duration = (overlap_end - overlap_start).total_seconds()
-                period_duration = (end_time - start_time).total_seconds()
-                coverage = overlap_duration / period_duration
-                
-                if coverage > best_coverage:
-                    best_coverage = coverage
-                    best_logger = logger_entry
+        # Upper bound on good-data points drawn per plot panel (None = no limit)
+        self.plot_max_points = plot_max_points
         
-        return best_logger if best_coverage > 0.5 else None
-    
-    def save_qc_limits_to_csv(self, output_file=None):
-        """Save current QC limits back to CSV file"""
-        if output_file is None:
-            output_file = os.path.join(self.input_dir, "qc_limits.csv")
+        # Reuse overview PNGs whose plotted data and configuration are unchanged
+        self.figure_cache = figure_cache
+        self.manifest_file = os.path.join(self.output_dir, "qc_manifest.json")
         
-        try:
-            # Prepare data for CSV
-            csv_data = []
-            
-            # Add default limits
-            for param, limits in self.default_qc_limits.items():
-                row = {
-                    'parameter': param,
-                    'station': 'default',
-                    'min_value': limits.get('min', ''),
-                    'max_value': limits.get('max', ''),
-                    'spike_threshold': limits.get('spike_threshold', ''),
-                    'notes': f'Default limits for {param}'
-                }
-                csv_data.append(row)
-            
-            # Add station-specific limits
-            for station, station_limits in self.station_qc_limits.items():
-                for param, limits in station_limits.items():
-                    row = {
-                        'parameter': param,
-                        'station': station,
-                        'min_value': limits.get('min', ''),
-                        'max_value': limits.get('max', ''),
-                        'spike_threshold': limits.get('spike_threshold', ''),
-                        'notes': f'Station {station} specific limits for {param}'
-                    }
-                    csv_data.append(row)
-            
-            # Create DataFrame and save
-            df = pd.DataFrame(csv_data)
-            df.to_csv(output_file, index=False)
-            print(f"QC limits saved to {output_file}")
-            return True
-            
-        except Exception as e:
-            print(f"Error saving QC limits to CSV: {e}")
-            return False
+        # QC limits, logger information and key parameters
+        super().__init__(input_dir)
     
-    def display_qc_limits(self):
-        """Display current QC limits for verification"""
-        print("\n=== CURRENT QC LIMITS ===")
-        print("\nDefault Limits:")
-        for param, limits in self.default_qc_limits.items():
-            min_val = limits.get('min', 'N/A')
-            max_val = limits.get('max', 'N/A')
-            spike_val = limits.get('spike_threshold', 'N/A')
-            print(f"  {param}: min={min_val}, max={max_val}, spike_threshold={spike_val}")
-        
-        print("\nStation-Specific Limits:")
-        for station, station_limits in self.station_qc_limits.items():
-            print(f"  Station {station}:")
-            for param, limits in station_limits.items():
-                min_val = limits.get('min', 'N/A')
-                max_val = limits.get('max', 'N/A')
-                spike_val = limits.get('spike_threshold', 'N/A')
-                print(f"    {param}: min={min_val}, max={max_val}, spike_threshold={spike_val}")
-        print("=" * 30)
-        
-        # Display logger information if available
-        if self.logger_info:
-            print(f"\nLogger Information:")
-            for station, loggers in self.logger_info.items():
-                live_loggers = [lg for lg in loggers if lg['is_live']]
-                if live_loggers:
-                    print(f"  Station {station}: {len(live_loggers)} live loggers")
-                    for logger in live_loggers:
-                        end_str = logger['end_time'].strftime('%Y-%m-%d') if logger['end_time'] else 'Present'
-                        print(f"    {logger['logger_id']}: {logger['start_time'].strftime('%Y-%m-%d')} to {end_str}")
-        
     def get_buoy_files_by_year(self):
         """Get all buoy data files grouped by station and year"""
         files = [f for f in os.listdir(self.input_dir) if f.endswith('.csv') and 'zzqc_fugrobuoy' in f]
@@ -389,8 +89,12 @@ class BuoyQCProcessor:
         
         return buoy_year_groups
     
-    def load_buoy_year_data(self, station, year, files):
-        """Load data for a specific buoy station and year, filtered by live logger"""
+    def load_buoy_year_data(self, station, year, files, columns=None):
+        """Load data for a specific buoy station and year, filtered by live logger
+
+        Files are read with the dtypes declared in raw_schema. Pass columns
+        (e.g. raw_schema.qc_columns(self.key_parameters)) to load only those.
+        """
         print(f"  Processing {station} - {year}...")
         
         combined_data = []
@@ -399,7 +103,7 @@ class BuoyQCProcessor:
             print(f"    Loading {file}...")
             
             try:
-                df = pd.read_csv(file_path)
+                df = read_raw_file(file_path, qc_parameters=self.key_parameters, columns=columns)
                 df['source_file'] = file
                 combined_data.append(df)
             except Exception as e:
@@ -409,18 +113,15 @@ class BuoyQCProcessor:
         if not combined_data:
             return None
             
-        # Combine all data for this year
+        # Combine all data for this year (time already parsed by read_raw_file)
         combined_df = pd.concat(combined_data, ignore_index=True)
         
-        # Convert time column to datetime
-        combined_df['time'] = pd.to_datetime(combined_df['time'], errors='coerce')
-        
         # Sort by time
         combined_df = combined_df.sort_values('time').reset_index(drop=True)
         
         print(f"    Combined: {len(combined_df):,} records from {combined_df['time'].min()} to {combined_df['time'].max()}")
         
-        # Filter data to only include records from ALL live loggers
+        # Filter data to records written by the logger that was live at each record's time
         if self.logger_info and station in self.logger_info:
             live_loggers = self.get_live_loggers_for_period(station, combined_df['time'].min(), combined_df['time'].max())
             
@@ -428,14 +129,9 @@ class BuoyQCProcessor:
                 logger_names = [logger['logger_id'] for logger in live_loggers]
                 print(f"    Live loggers for period: {', '.join(logger_names)}")
                 
-                # Filter data to include records from ANY of the live loggers
+                # Keep each record only if its logger was live at the record's time
                 if 'loggerid' in combined_df.columns:
-                    # Create filter for all live loggers
-                    live_logger_ids = [logger['logger_id'].split('_')[0] for logger in live_loggers]  # Extract numeric parts
-                    
-                    # Filter by any of the live logger IDs
-                    mask = combined_df['loggerid'].str.contains('|'.join(live_logger_ids), na=False, regex=True)
-                    filtered_df = combined_df[mask]
+                    filtered_df = filter_to_live_logger(combined_df, self.logger_timelines[station])
                     
                     if len(filtered_df) > 0:
                         print(f"    Filtered to live logger data: {len(filtered_df):,} records from {len(live_loggers)} logger(s)")
@@ -451,18 +147,6 @@ class BuoyQCProcessor:
         
         return combined_df
     
-    def get_station_qc_limits(self, station, param):
-        """Get QC limits for a specific station and parameter"""
-        # Start with default limits
-        limits = self.default_qc_limits.get(param, {}).copy()
-        
-        # Override with station-specific limits if available
-        if station in self.station_qc_limits:
-            station_limits = self.station_qc_limits[station].get(param, {})
-            limits.update(station_limits)
-        
-        return limits
-    
     def apply_basic_qc(self, df, station):
         """Apply basic QC tests to the data"""
         print("    Applying basic QC tests...")
@@ -476,88 +160,47 @@ class BuoyQCProcessor:
         # Create QC'd copy of dataframe
         df_qc = df.copy()
         
-        for param in self.key_parameters:
-            if param not in df.columns:
-                continue
-                
-            ind_col = f'ind_{param}'
-            if ind_col not in df.columns:
-                continue
-                
+        # Parameters present with their indicator columns
+        params = [p for p in self.key_parameters if p in df.columns and f'ind_{p}' in df.columns]
+        ind_cols = [f'ind_{p}' for p in params]
+        limits = [self.get_station_qc_limits(station, p) for p in params]
+        
+        # Run all tests for all parameters in one vectorized pass
+        values = df[params].to_numpy(dtype=float, na_value=np.nan)
+        limits_matrix = np.array([[lim.get(field, np.nan) for field in LIMIT_FIELDS] for lim in limits], dtype=float)
+        indicators, reasons, masks = run_qc_kernel(values, df[ind_cols].to_numpy(), limits_matrix)
+        
+        df_qc[ind_cols] = indicators
+        
+        # Persist failure reason codes (int8) alongside the indicators
+        for i, param in enumerate(params):
+            df_qc[f'reason_{param}'] = reasons[:, i]
+        
+        counts = {name: mask.sum(axis=0) for name, mask in masks.items()}
+        for i, param in enumerate(params):
+            param_limits = limits[i]
             param_results = {
                 'total_values': len(df),
-                'missing_values': 0,
-                'range_failures': 0,
-                'spike_failures': 0,
-                'flat_line_failures': 0,
-                'values_passed': 0
+                'missing_values': int(counts['missing'][i]),
+                'range_failures': int(counts['range'][i]),
+                'spike_failures': int(counts['spike'][i]),
+                'flat_line_failures': int(counts['flatline'][i]),
+                'values_passed': int(counts['passed'][i])
             }
             
-            # Get parameter limits (station-specific if available, otherwise default)
-            limits = self.get_station_qc_limits(station, param)
-            
-            # 1. Missing data test (already flagged as 9)
-            missing_mask = df[ind_col] == 9
-            param_results['missing_values'] = missing_mask.sum()
-            
-            # 2. Range test
-            if 'min' in limits and 'max' in limits:
-                valid_data_mask = ~missing_mask
-                range_fail_mask = (
-                    (df[param] < limits['min']) | 
-                    (df[param] > limits['max'])
-                ) & valid_data_mask
-                
-                param_results['range_failures'] = range_fail_mask.sum()
-                df_qc.loc[range_fail_mask, ind_col] = 4  # Mark as not OK
-                
-                if range_fail_mask.sum() > 0:
-                    qc_results['issues_found'].append(
-                        f"{param}: {range_fail_mask.sum()} values outside range [{limits['min']}-{limits['max']}]"
-                    )
-            
-            # 3. Spike test
-            if 'spike_threshold' in limits and len(df) > 1:
-                valid_data = df.loc[~missing_mask, param]
-                if len(valid_data) > 2:
-                    # Calculate rolling differences
-                    diff = valid_data.diff().abs()
-                    spike_mask = diff > limits['spike_threshold']
-                    
-                    # Map back to original dataframe indices
-                    spike_indices = valid_data[spike_mask].index
-                    param_results['spike_failures'] = len(spike_indices)
-                    df_qc.loc[spike_indices, ind_col] = 4  # Mark as not OK
-                    
-                    if len(spike_indices) > 0:
-                        qc_results['issues_found'].append(
-                            f"{param}: {len(spike_indices)} spike values (>{limits['spike_threshold']} change)"
-                        )
-            
-            # 4. Flat line test (5+ consecutive identical values)
-            if len(df) > 5:
-                valid_data = df.loc[~missing_mask, param]
-                if len(valid_data) > 5:
-                    # Find consecutive identical values
-                    flat_line_mask = pd.Series(False, index=df.index)
-                    for i in range(len(valid_data) - 4):
-                        window = valid_data.iloc[i:i+5]
-                        if len(window.unique()) == 1:  # All values identical
-                            flat_line_mask.iloc[i:i+5] = True
-                    
-                    flat_line_indices = df[flat_line_mask].index
-                    param_results['flat_line_failures'] = len(flat_line_indices)
-                    df_qc.loc[flat_line_indices, ind_col] = 4  # Mark as not OK
-                    
-                    if len(flat_line_indices) > 0:
-                        qc_results['issues_found'].append(
-                            f"{param}: {len(flat_line_indices)} flat line values (5+ consecutive identical)"
-                        )
-            
-            # 5. Mark good data as QC'd (indicator = 1)
-            good_data_mask = (df_qc[ind_col] == 0) & ~missing_mask
-            param_results['values_passed'] = good_data_mask.sum()
-            df_qc.loc[good_data_mask, ind_col] = 1  # Mark as OK
+            if param_results['range_failures'] > 0:
+                qc_results['issues_found'].append(
+                    f"{param}: {param_results['range_failures']} values outside range [{param_limits['min']}-{param_limits['max']}]"
+                )
+            if param_results['spike_failures'] > 0:
+                qc_results['issues_found'].append(
+                    f"{param}: {param_results['spike_failures']} spike values (>{param_limits['spike_threshold']} change)"
+                )
+            if param_results['flat_line_failures'] > 0:
+                min_run = int(param_limits.get('flatline_count', FLAT_LINE_MIN_RUN))
+                qc_results['issues_found'].append(
+                    f"{param}: {param_results['flat_line_failures']} flat line values ({min_run}+ consecutive identical)"
+                )
             
             qc_results['qc_summary'][param] = param_results
         
@@ -574,58 +217,10 @@ class BuoyQCProcessor:
         
         return df_qc, qc_results
     
-    def add_qc_failure_reasons(self, df, station):
-        """Add columns indicating the reason for QC failures for visualization"""
-        df_viz = df.copy()
-        
-        for param in self.key_parameters:
-            if param not in df.columns:
-                continue
-                
-            ind_col = f'ind_{param}'
-            if ind_col not in df.columns:
-                continue
-            
-            # Create failure reason column
-            failure_reason_col = f'{param}_failure_reason'
-            df_viz[failure_reason_col] = 'good'  # Default to good
-            
-            # Get parameter limits for this station
-            limits = self.get_station_qc_limits(station, param)
-            
-            # Identify different failure types
-            failed_mask = df_viz[ind_col] == 4
-            
-            if failed_mask.sum() > 0:
-                # Range failures
-                if 'min' in limits and 'max' in limits:
-                    range_fail_mask = (
-                        (df_viz[param] < limits['min']) | 
-                        (df_viz[param] > limits['max'])
-                    ) & failed_mask
-                    df_viz.loc[range_fail_mask, failure_reason_col] = 'range'
-                
-                # Spike failures (need to recalculate)
-                if 'spike_threshold' in limits and len(df_viz) > 1:
-                    missing_mask = df_viz[ind_col] == 9
-                    valid_data = df_viz.loc[~missing_mask, param]
-                    if len(valid_data) > 2:
-                        diff = valid_data.diff().abs()
-                        spike_mask = diff > limits['spike_threshold']
-                        spike_indices = valid_data[spike_mask].index
-                        spike_fail_mask = df_viz.index.isin(spike_indices) & failed_mask
-                        df_viz.loc[spike_fail_mask, failure_reason_col] = 'spike'
-                
-                # Flat line failures (remaining failures that aren't range or spike)
-                remaining_failures = failed_mask & (df_viz[failure_reason_col] == 'good')
-                df_viz.loc[remaining_failures, failure_reason_col] = 'flatline'
-        
-        return df_viz
-    
     def plot_parameter_with_qc_colors(self, ax, df, param, title, ylabel):
         """Plot a parameter with different colors for different QC failure types"""
         ind_col = f'ind_{param}'
-        failure_reason_col = f'{param}_failure_reason'
+        reason_col = f'reason_{param}'
         
         if param not in df.columns or ind_col not in df.columns:
             return
@@ -645,16 +240,21 @@ class BuoyQCProcessor:
             'flatline': 'Flat line failure'
         }
         
-        # Plot good data first (as background)
+        # Plot good data first (as background); too dense to resolve, draw its min/max envelope
         good_data = df[df[ind_col] == 1]
-        if len(good_data) > 0:
+        bands = envelope_bands(good_data, 'time', param, self.plot_max_points)
+        if bands is not None:
+            ax.vlines(bands['x'], bands['ymin'], bands['ymax'],
+                      color=colors['good'], linewidth=0.5, alpha=0.6, label=labels['good'])
+        elif len(good_data) > 0:
             ax.plot(good_data['time'], good_data[param], '.', 
                    color=colors['good'], markersize=1, alpha=0.6, label=labels['good'])
         
         # Plot different failure types with different colors
-        if failure_reason_col in df.columns:
+        if reason_col in df.columns:
+            reason_labels = df[reason_col].map(REASON_LABELS)
             for reason in ['range', 'spike', 'flatline']:
-                failure_data = df[(df[ind_col] == 4) & (df[failure_reason_col] == reason)]
+                failure_data = df[(df[ind_col] == 4) & (reason_labels == reason)]
                 if len(failure_data) > 0:
                     ax.scatter(failure_data['time'], failure_data[param], 
                              c=colors[reason], s=15, label=labels[reason], 
@@ -666,14 +266,12 @@ class BuoyQCProcessor:
         ax.grid(True, alpha=0.3)
     
     def create_yearly_visualization(self, df, station, year, qc_results):
-        """Create visualization plots for the buoy data for a specific year"""
-        print(f"    Creating visualizations for station {station} - {year}...")
-        
-        # Set up the plotting style
-        plt.style.use('seaborn-v0_8')
+        """Create visualization plots for the buoy data for a specific year
         
-        # Create subplots for different parameter groups
-        fig, axes = plt.subplots(3, 2, figsize=(15, 12))
+        The figure is keyed on the plotted columns, QC summary, limits and
+        plot settings; an existing PNG with the same key is reused as is.
+        """
+        plot_file, _, _ = self.get_report_files(station, year)
         
         # Create title with logger information
         title = f'Buoy {station} - {year} Data Overview and QC Results'
@@ -682,14 +280,37 @@ class BuoyQCProcessor:
             if live_logger:
                 title += f'\nLive Logger: {live_logger["logger_id"]}'
         
+        plotted_columns = ['time'] + [col for param in OVERVIEW_PARAMETERS
+                                      for col in (param, f'ind_{param}', f'reason_{param}') if col in df.columns]
+        key = figure_key([df[plotted_columns]], {
+            'version': OVERVIEW_FIGURE_VERSION,
+            'title': title,
+            'plot_max_points': self.plot_max_points,
+            'limits': {param: self.get_station_qc_limits(station, param) for param in OVERVIEW_PARAMETERS},
+            'qc_summary': qc_results['qc_summary']
+        })
+        if self.figure_cache and is_cached(plot_file, key):
+            print(f"    Overview plot unchanged, reusing {plot_file}")
+            return plot_file
+        
+        print(f"    Creating visualizations for station {station} - {year}...")
+        
+        # Plotting stack is only imported by the render stage
+        import matplotlib
+        matplotlib.use('Agg')  # Figures are only saved to file, also from worker processes
+        import matplotlib.pyplot as plt
+        
+        # Set up the plotting style
+        plt.style.use('seaborn-v0_8')
+        
+        # Create subplots for different parameter groups
+        fig, axes = plt.subplots(3, 2, figsize=(15, 12))
+        
         fig.suptitle(title, fontsize=16, fontweight='bold')
         
         # Convert time for plotting
         df['time'] = pd.to_datetime(df['time'])
         
-        # Add QC failure reason columns for visualization
-        df = self.add_qc_failure_reasons(df, station)
-        
         # 1. Air pressure
         self.plot_parameter_with_qc_colors(axes[0, 0], df, 'airpressure', 'Air Pressure (hPa)', 'Pressure (hPa)')
         
@@ -763,333 +384,174 @@ class BuoyQCProcessor:
         
         plt.tight_layout()
         
-        # Save plot
-        plot_file = os.path.join(self.output_dir, f'buoy_{station}_{year}_qc_overview.png')
-        plt.savefig(plot_file, dpi=300, bbox_inches='tight')
+        # Save plot, recording the key it was drawn from
+        plt.savefig(plot_file, dpi=300, bbox_inches='tight', metadata=png_metadata(key))
         plt.close()
         
         return plot_file
     
-    def generate_yearly_qc_report(self, station, year, df, qc_results, plot_file):
-        """Generate markdown QC report for a buoy station and year"""
+    def build_yearly_qc_report(self, station, year, df, qc_results, plot_file):
+        """Build the QC report model for a buoy station and year"""
         print(f"    Generating QC report for station {station} - {year}...")
         
-        report_file = os.path.join(self.output_dir, f'buoy_{station}_{year}_qc_report.md')
+        report = Report(f"Buoy {station} - {year} Quality Control Report")
+        report.paragraph(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        
+        # Data overview
+        report.heading("Data Overview")
+        overview = [
+            f"**Station ID:** {station}",
+            f"**Year:** {year}",
+            f"**Total Records:** {len(df):,}",
+            f"**Time Range:** {df['time'].min()} to {df['time'].max()}",
+            f"**Duration:** {(df['time'].max() - df['time'].min()).days} days"
+        ]
         
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(f"# Buoy {station} - {year} Quality Control Report\n\n")
-            f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            
-            # Data overview
-            f.write("## Data Overview\n\n")
-            f.write(f"- **Station ID:** {station}\n")
-            f.write(f"- **Year:** {year}\n")
-            f.write(f"- **Total Records:** {len(df):,}\n")
-            f.write(f"- **Time Range:** {df['time'].min()} to {df['time'].max()}\n")
-            f.write(f"- **Duration:** {(df['time'].max() - df['time'].min()).days} days\n")
-            
-            # Sensor information
-            loggers = df['loggerid'].value_counts()
-            f.write(f"- **Sensors/Loggers:** {len(loggers)} active\n")
-            for logger, count in loggers.items():
-                pct = (count/len(df))*100
-                f.write(f"  - {logger.strip()}: {count:,} records ({pct:.1f}%)\n")
-            
-            # Logger information
-            if self.logger_info and station in self.logger_info:
-                live_logger = self.get_live_logger_for_period(station, df['time'].min(), df['time'].max())
-                if live_logger:
-                    f.write(f"- **Live Logger Used:** {live_logger['logger_id']}\n")
-                    f.write(f"  - Active Period: {live_logger['start_time'].strftime('%Y-%m-%d %H:%M')} to ")
-                    if live_logger['end_time']:
-                        f.write(f"{live_logger['end_time'].strftime('%Y-%m-%d %H:%M')}\n")
-                    else:
-                        f.write("Present\n")
-                    f.write(f"  - Wave Data Available: {'Yes' if live_logger['live_wave'] else 'No'}\n")
-                    if live_logger['comment']:
-                        f.write(f"  - Notes: {live_logger['comment']}\n")
-                else:
-                    f.write("- **Live Logger:** None identified for this time period\n")
-            else:
-                f.write("- **Live Logger:** Information not available\n")
-            
-            f.write("\n")
-            
-            # QC Results Summary
-            f.write("## Quality Control Results\n\n")
-            
-            # Overall QC status
-            qc_status = df['qc_ind'].value_counts()
-            f.write("### Record-Level QC Status\n\n")
-            for status, count in qc_status.items():
-                pct = (count/len(df))*100
-                status_desc = {0: 'No QC performed', 1: 'QC complete', 4: 'QC failed'}.get(status, f'Status {status}')
-                f.write(f"- **{status_desc}:** {count:,} records ({pct:.1f}%)\n")
-            
-            f.write("\n### Parameter-Level QC Results\n\n")
-            f.write("| Parameter | Total | Missing | Range Fail | Spike Fail | Flat Line Fail | Passed | Pass Rate |\n")
-            f.write("|-----------|--------|---------|------------|------------|----------------|--------|-----------|\n")
-            
-            for param, results in qc_results['qc_summary'].items():
-                total = results['total_values']
-                missing = results['missing_values']
-                range_fail = results['range_failures']
-                spike_fail = results['spike_failures']
-                flat_fail = results['flat_line_failures']
-                passed = results['values_passed']
-                pass_rate = (passed / total * 100) if total > 0 else 0
-                
-                f.write(f"| {param} | {total:,} | {missing:,} | {range_fail:,} | {spike_fail:,} | {flat_fail:,} | {passed:,} | {pass_rate:.1f}% |\n")
-            
-            # Issues found
-            if qc_results['issues_found']:
-                f.write("\n### Issues Identified\n\n")
-                for issue in qc_results['issues_found']:
-                    f.write(f"- {issue}\n")
-            
-            # QC Limits Used
-            f.write(f"\n## QC Limits Applied\n\n")
-            f.write("Station-specific QC limits used for this analysis:\n\n")
-            f.write("| Parameter | Min Value | Max Value | Spike Threshold | Notes |\n")
-            f.write("|-----------|-----------|-----------|-----------------|-------|\n")
-            
-            for param in self.key_parameters:
-                if param in df.columns:
-                    limits = self.get_station_qc_limits(station, param)
-                    min_val = limits.get('min', 'N/A')
-                    max_val = limits.get('max', 'N/A')
-                    spike_val = limits.get('spike_threshold', 'N/A')
-                    
-                    # Check if station-specific limits were used
-                    is_custom = (station in self.station_qc_limits and 
-                               param in self.station_qc_limits[station])
-                    note = "Station-specific" if is_custom else "Default"
-                    
-                    f.write(f"| {param} | {min_val} | {max_val} | {spike_val} | {note} |\n")
-            
-            # Data visualization
-            f.write(f"\n## Data Visualization\n\n")
-            f.write(f"![QC Overview](buoy_{station}_{year}_qc_overview.png)\n\n")
-            
-            # Color coding explanation
-            f.write("### QC Failure Color Coding\n\n")
-            f.write("The visualization uses different colors to distinguish QC failure types:\n\n")
-            f.write("- **Blue dots**: Good data (passed all QC tests)\n")
-            f.write("- **Red dots**: Range failures (values outside physical limits)\n")
-            f.write("- **Orange dots**: Spike failures (unrealistic sudden changes)\n")
-            f.write("- **Purple dots**: Flat line failures (sensor stuck/malfunctioning)\n\n")
-            f.write("The bottom-right panel shows a stacked bar chart with the percentage breakdown of each QC result type per parameter.\n\n")
-            
-            # Recommendations
-            f.write("## Recommendations\n\n")
-            
-            # Check for critical issues
-            critical_issues = []
-            for param, results in qc_results['qc_summary'].items():
-                missing_pct = (results['missing_values'] / results['total_values'] * 100) if results['total_values'] > 0 else 0
-                if missing_pct > 50:
-                    critical_issues.append(f"**{param}**: {missing_pct:.1f}% missing data - sensor failure likely")
-                elif results['range_failures'] + results['spike_failures'] > results['total_values'] * 0.1:
-                    critical_issues.append(f"**{param}**: High failure rate - investigate sensor calibration")
-            
-            if critical_issues:
-                f.write("### Critical Issues\n\n")
-                for issue in critical_issues:
-                    f.write(f"- {issue}\n")
-                f.write("\n")
-            
-            # Standard recommendations
-            f.write("### Manual QC Actions Needed\n\n")
-            f.write("1. **Review flagged extreme values** - validate against weather events\n")
-            f.write("2. **Investigate sensor failures** - replace/repair faulty sensors\n") 
-            f.write("3. **Cross-validate between loggers** - compare duplicate measurements\n")
-            f.write("4. **Apply sensor hierarchy** - prioritize Wavesense for hm0, Datawell for hmax\n")
-            f.write("5. **Transfer to production** - move QC'd data to irish_buoys_fugro table\n\n")
-            
-            # Next steps
-            f.write("### Next Steps\n\n")
-            f.write("1. Execute parameter-level QC SQL commands from readme.md\n")
-            f.write("2. Perform individual value corrections for flagged data\n")
-            f.write("3. Complete record-level QC marking\n")
-            f.write("4. Transfer approved data to production table\n")
+        # Sensor information
+        loggers = df['loggerid'].astype(str).value_counts()
+        overview.append((f"**Sensors/Loggers:** {len(loggers)} active",
+                         [f"{logger.strip()}: {count:,} records ({count / len(df) * 100:.1f}%)"
+                          for logger, count in loggers.items()]))
         
-        return report_file
+        # Logger information
+        if self.logger_info and station in self.logger_info:
+            live_logger = self.get_live_logger_for_period(station, df['time'].min(), df['time'].max())
+            if live_logger:
+                end_str = live_logger['end_time'].strftime('%Y-%m-%d %H:%M') if live_logger['end_time'] else 'Present'
+                details = [
+                    f"Active Period: {live_logger['start_time'].strftime('%Y-%m-%d %H:%M')} to {end_str}",
+                    f"Wave Data Available: {'Yes' if live_logger['live_wave'] else 'No'}"
+                ]
+                if live_logger['comment']:
+                    details.append(f"Notes: {live_logger['comment']}")
+                overview.append((f"**Live Logger Used:** {live_logger['logger_id']}", details))
+            else:
+                overview.append("**Live Logger:** None identified for this time period")
+        else:
+            overview.append("**Live Logger:** Information not available")
+        report.bullets(overview)
+        
+        # QC Results Summary
+        report.heading("Quality Control Results")
+        
+        # Overall QC status
+        report.heading("Record-Level QC Status", level=3)
+        status_items = []
+        for status, count in df['qc_ind'].value_counts().items():
+            status_desc = {0: 'No QC performed', 1: 'QC complete', 4: 'QC failed'}.get(status, f'Status {status}')
+            status_items.append(f"**{status_desc}:** {count:,} records ({count / len(df) * 100:.1f}%)")
+        report.bullets(status_items)
+        
+        report.heading("Parameter-Level QC Results", level=3)
+        rows = []
+        for param, results in qc_results['qc_summary'].items():
+            total = results['total_values']
+            passed = results['values_passed']
+            pass_rate = (passed / total * 100) if total > 0 else 0
+            rows.append([param, f"{total:,}", f"{results['missing_values']:,}", f"{results['range_failures']:,}",
+                         f"{results['spike_failures']:,}", f"{results['flat_line_failures']:,}", f"{passed:,}",
+                         f"{pass_rate:.1f}%"])
+        report.table(["Parameter", "Total", "Missing", "Range Fail", "Spike Fail", "Flat Line Fail", "Passed",
+                      "Pass Rate"], rows)
+        
+        # Issues found
+        if qc_results['issues_found']:
+            report.heading("Issues Identified", level=3)
+            report.bullets(qc_results['issues_found'])
+        
+        # QC Limits Used
+        report.heading("QC Limits Applied")
+        report.paragraph("Station-specific QC limits used for this analysis:")
+        rows = []
+        for param in self.key_parameters:
+            if param in df.columns:
+                limits = self.get_station_qc_limits(station, param)
+                
+                # Check if station-specific limits were used
+                is_custom = (station in self.station_qc_limits and 
+                           param in self.station_qc_limits[station])
+                rows.append([param, limits.get('min', 'N/A'), limits.get('max', 'N/A'),
+                             limits.get('spike_threshold', 'N/A'), "Station-specific" if is_custom else "Default"])
+        report.table(["Parameter", "Min Value", "Max Value", "Spike Threshold", "Notes"], rows)
+        
+        # Data visualization
+        report.heading("Data Visualization")
+        report.image(plot_file, alt="QC Overview")
+        
+        # Color coding explanation
+        report.heading("QC Failure Color Coding", level=3)
+        report.paragraph("The visualization uses different colors to distinguish QC failure types:")
+        report.bullets([
+            "**Blue dots**: Good data (passed all QC tests)",
+            "**Red dots**: Range failures (values outside physical limits)",
+            "**Orange dots**: Spike failures (unrealistic sudden changes)",
+            "**Purple dots**: Flat line failures (sensor stuck/malfunctioning)"
+        ])
+        report.paragraph("The bottom-right panel shows a stacked bar chart with the percentage breakdown of each QC "
+                         "result type per parameter.")
+        
+        # Recommendations
+        report.heading("Recommendations")
+        
+        # Check for critical issues
+        critical_issues = []
+        for param, results in qc_results['qc_summary'].items():
+            missing_pct = (results['missing_values'] / results['total_values'] * 100) if results['total_values'] > 0 else 0
+            if missing_pct > 50:
+                critical_issues.append(f"**{param}**: {missing_pct:.1f}% missing data - sensor failure likely")
+            elif results['range_failures'] + results['spike_failures'] > results['total_values'] * 0.1:
+                critical_issues.append(f"**{param}**: High failure rate - investigate sensor calibration")
+        
+        if critical_issues:
+            report.heading("Critical Issues", level=3)
+            report.bullets(critical_issues)
+        
+        # Standard recommendations
+        report.heading("Manual QC Actions Needed", level=3)
+        report.numbered([
+            "**Review flagged extreme values** - validate against weather events",
+            "**Investigate sensor failures** - replace/repair faulty sensors",
+            "**Cross-validate between loggers** - compare duplicate measurements",
+            "**Apply sensor hierarchy** - prioritize Wavesense for hm0, Datawell for hmax",
+            "**Transfer to production** - move QC'd data to irish_buoys_fugro table"
+        ])
+        
+        # Next steps
+        report.heading("Next Steps", level=3)
+        report.numbered([
+            "Execute parameter-level QC SQL commands from readme.md",
+            "Perform individual value corrections for flagged data",
+            "Complete record-level QC marking",
+            "Transfer approved data to production table"
+        ])
+        
+        return report
+    
+    def write_yearly_qc_markdown(self, report, station, year):
+        """Write the markdown QC report for a buoy station and year"""
+        _, report_file, _ = self.get_report_files(station, year)
+        return write_markdown(report, report_file)
     
-    def convert_markdown_to_pdf(self, markdown_file, station, year):
-        """Convert markdown QC report to a comprehensive PDF with all information"""
+    def write_yearly_qc_pdf(self, report, station, year):
+        """Render the QC report model to PDF"""
         print(f"    Converting report to PDF for station {station} - {year}...")
         
         try:
-            # Read the markdown file
-            with open(markdown_file, 'r', encoding='utf-8') as f:
-                markdown_content = f.read()
+            from reportlab.lib.pagesizes import A4
+            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+            from reportlab.lib.units import inch
             
-            # Generate PDF
-            pdf_file = os.path.join(self.output_dir, f'buoy_{station}_{year}_qc_report.pdf')
+            _, _, pdf_file = self.get_report_files(station, year)
             
             # Create PDF document
             doc = SimpleDocTemplate(pdf_file, pagesize=A4, 
                                   rightMargin=72, leftMargin=72,
                                   topMargin=72, bottomMargin=18)
             
-            # Get styles
-            styles = getSampleStyleSheet()
-            
-            # Custom styles
-            title_style = ParagraphStyle('CustomTitle', parent=styles['Heading1'],
-                                       fontSize=18, spaceAfter=30, textColor=colors.HexColor('#2c3e50'))
-            
-            heading_style = ParagraphStyle('CustomHeading', parent=styles['Heading2'],
-                                         fontSize=14, spaceAfter=12, textColor=colors.HexColor('#34495e'))
-            
-            subheading_style = ParagraphStyle('CustomSubHeading', parent=styles['Heading3'],
-                                            fontSize=12, spaceAfter=8, textColor=colors.HexColor('#2980b9'))
-            
-            # Build PDF content
-            story = []
-            
-            # Title
-            story.append(Paragraph(f"Buoy {station} - {year} Quality Control Report", title_style))
-            story.append(Spacer(1, 12))
-            
-            # Generated timestamp
-            story.append(Paragraph(f"<b>Generated:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal']))
-            story.append(Spacer(1, 20))
-            
-            # Parse markdown content comprehensively
-            lines = markdown_content.split('\n')
-            current_section = None
-            table_data = []
-            in_table = False
-            
-            for i, line in enumerate(lines):
-                line = line.strip()
-                
-                # Handle section headers
-                if line.startswith('## '):
-                    current_section = line.replace('## ', '')
-                    story.append(Paragraph(current_section, heading_style))
-                    continue
-                elif line.startswith('### '):
-                    subsection = line.replace('### ', '')
-                    story.append(Paragraph(subsection, subheading_style))
-                    continue
-                
-                # Handle data overview bullet points
-                if line.startswith('- **') and current_section == 'Data Overview':
-                    clean_line = line.replace('- **', '• ').replace('**:', ':').replace('**', '')
-                    story.append(Paragraph(clean_line, styles['Normal']))
-                
-                # Handle QC status bullet points
-                elif line.startswith('- **') and 'QC Status' in current_section:
-                    clean_line = line.replace('- **', '• ').replace('**:', ':').replace('**', '')
-                    story.append(Paragraph(clean_line, styles['Normal']))
-                
-                # Handle issues identified
-                elif line.startswith('- ') and current_section == 'Issues Identified':
-                    clean_line = line.replace('- ', '• ')
-                    story.append(Paragraph(clean_line, styles['Normal']))
-                
-                # Handle tables
-                elif line.startswith('|') and '|' in line:
-                    if not in_table:
-                        in_table = True
-                        table_data = []
-                    
-                    # Parse table row
-                    cells = [cell.strip() for cell in line.split('|')[1:-1]]  # Remove empty first/last
-                    if cells and not all(cell.startswith('-') for cell in cells):  # Skip separator rows
-                        table_data.append(cells)
-                
-                elif in_table and not line.startswith('|'):
-                    # End of table - add it to story
-                    if table_data:
-                        # Create table
-                        table = Table(table_data)
-                        table.setStyle(TableStyle([
-                            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f8f9fa')),
-                            ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#2c3e50')),
-                            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                            ('FONTSIZE', (0, 0), (-1, 0), 10),
-                            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                            ('FONTSIZE', (0, 1), (-1, -1), 9),
-                            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')])
-                        ]))
-                        story.append(table)
-                        story.append(Spacer(1, 15))
-                    
-                    table_data = []
-                    in_table = False
-                
-                # Handle regular text
-                elif line and not line.startswith('#') and not line.startswith('!['):
-                    if line.startswith('**') and line.endswith('**'):
-                        # Bold text
-                        clean_line = line.replace('**', '')
-                        story.append(Paragraph(f"<b>{clean_line}</b>", styles['Normal']))
-                    elif line:
-                        story.append(Paragraph(line, styles['Normal']))
-            
-            # Add final table if we ended while in one
-            if in_table and table_data:
-                table = Table(table_data)
-                table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f8f9fa')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#2c3e50')),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 10),
-                    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 1), (-1, -1), 9),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')])
-                ]))
-                story.append(table)
-            
-            # Add logger information
-            if self.logger_info and station in self.logger_info:
-                live_logger = self.get_live_logger_for_period(station, df['time'].min(), df['time'].max())
-                if live_logger:
-                    story.append(Spacer(1, 20))
-                    story.append(Paragraph("Live Logger Information", heading_style))
-                    
-                    logger_text = f"• <b>Logger ID:</b> {live_logger['logger_id']}<br/>"
-                    logger_text += f"• <b>Active Period:</b> {live_logger['start_time'].strftime('%Y-%m-%d %H:%M')} to "
-                    if live_logger['end_time']:
-                        logger_text += f"{live_logger['end_time'].strftime('%Y-%m-%d %H:%M')}"
-                    else:
-                        logger_text += "Present"
-                    logger_text += f"<br/>• <b>Wave Data:</b> {'Available' if live_logger['live_wave'] else 'Not Available'}"
-                    
-                    if live_logger['comment']:
-                        logger_text += f"<br/>• <b>Notes:</b> {live_logger['comment']}"
-                    
-                    story.append(Paragraph(logger_text, styles['Normal']))
-            
-            # Add visualization image if it exists
-            plot_file = os.path.join(self.output_dir, f'buoy_{station}_{year}_qc_overview.png')
-            if os.path.exists(plot_file):
-                story.append(Spacer(1, 20))
-                story.append(Paragraph("Data Visualization", heading_style))
-                
-                # Add image with proper sizing
-                img = Image(plot_file, width=7*inch, height=5.6*inch)
-                story.append(img)
-                story.append(Spacer(1, 15))
-                
-                # Add color coding explanation
-                story.append(Paragraph("QC Failure Color Coding", subheading_style))
-                story.append(Paragraph("• <font color='blue'>Blue dots</font>: Good data (passed all QC tests)", styles['Normal']))
-                story.append(Paragraph("• <font color='red'>Red dots</font>: Range failures (values outside physical limits)", styles['Normal']))
-                story.append(Paragraph("• <font color='orange'>Orange dots</font>: Spike failures (unrealistic sudden changes)", styles['Normal']))
-                story.append(Paragraph("• <font color='purple'>Purple dots</font>: Flat line failures (sensor stuck/malfunctioning)", styles['Normal']))
-                story.append(Paragraph("The bottom-right panel shows a stacked bar chart with percentage breakdown of each QC result type per parameter.", styles['Normal']))
+            # Build PDF content in one pass over the report model
+            styles = _qc_pdf_styles()
+            story = [Paragraph(report.title, styles['title']), Spacer(1, 12)]
+            story.extend(build_story(report, styles, max_image_size=(7 * inch, 5.6 * inch)))
             
             # Build PDF
             doc.build(story)
@@ -1101,11 +563,93 @@ class BuoyQCProcessor:
             print(f"    Warning: Could not generate PDF - {e}")
             return None
     
-    def process_all_buoys_by_year(self):
-        """Main processing function - process all buoy stations by year"""
+    def get_station_year_fingerprint(self, station, year, files):
+        """Fingerprint everything a station-year's QC output depends on
+        
+        Combines content hashes of the raw input files, the resolved QC limits
+        for each key parameter and the station's logger intervals.
+        """
+        input_hashes = {}
+        for file in sorted(files):
+            digest = hashlib.sha256()
+            with open(os.path.join(self.input_dir, file), 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(chunk)
+            input_hashes[file] = digest.hexdigest()
+        
+        limits = {param: self.get_station_qc_limits(station, param) for param in self.key_parameters}
+        
+        loggers = [
+            {
+                'logger_id': entry['logger_id'],
+                'start_time': entry['start_time'].isoformat(),
+                'end_time': entry['end_time'].isoformat() if entry['end_time'] is not None else None,
+                'is_live': entry['is_live'],
+                'live_wave': entry['live_wave']
+            }
+            for entry in self.logger_info.get(station, [])
+        ]
+        
+        components = {
+            'manifest_version': MANIFEST_VERSION,
+            'inputs': input_hashes,
+            'limits': limits,
+            'loggers': loggers
+        }
+        fingerprint = hashlib.sha256(json.dumps(components, sort_keys=True).encode('utf-8')).hexdigest()
+        return fingerprint, input_hashes
+    
+    def load_build_manifest(self):
+        """Load the build manifest recording the inputs of previous QC runs"""
+        if not os.path.exists(self.manifest_file):
+            return {}
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                return json.load(f).get('station_years', {})
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read build manifest {self.manifest_file}: {e}")
+            return {}
+    
+    def save_build_manifest(self, entries):
+        """Write the build manifest atomically"""
+        manifest = {
+            'manifest_version': MANIFEST_VERSION,
+            'updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'station_years': entries
+        }
+        temp_file = self.manifest_file + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(temp_file, self.manifest_file)
+    
+    def process_all_buoys_by_year(self, workers=1, force=False, render_workers=None,
+                                  data_only=False, render_only=False):
+        """Main processing function - process all buoy stations by year
+        
+        Runs in two stages. The QC stage writes each station-year's QC'd
+        dataset and a compact results JSON; the render stage then builds the
+        overview PNG, markdown report and PDF from those artifacts in its own
+        worker pool. data_only skips the render stage, render_only rebuilds
+        reports from existing artifacts without re-running QC. Besides the
+        station-years rebuilt by the QC stage, the render stage picks up any
+        whose reports are missing or older than their results (e.g. after a
+        data-only run or a failed render).
+        
+        With workers > 1 station-year jobs run in a process pool; console
+        output is still printed grouped per job in station/year order.
+        Station-years whose fingerprint matches the build manifest are
+        skipped unless force is set.
+        """
         print("Starting Buoy QC Processing by Year...")
         print("=" * 50)
         
+        if render_only:
+            render_keys = self.find_rendered_station_years()
+            print(f"Render only: {len(render_keys)} station-years with QC results")
+            render_failures = self.run_render_stage(render_keys, render_workers or workers)
+            self.print_render_summary(len(render_keys), render_failures)
+            return []
+        
         # Display QC limits source and current values
         qc_limits_file = os.path.join(self.input_dir, "qc_limits.csv")
         if os.path.exists(qc_limits_file):
@@ -1128,63 +672,21 @@ class BuoyQCProcessor:
         else:
             print(f"\nNo logger information available")
         
-        # Get all buoy files grouped by station and year
-        buoy_year_groups = self.get_buoy_files_by_year()
-        print(f"Found {len(buoy_year_groups)} buoy stations")
-        
-        processing_summary = []
+        processing_summary, processed_keys = self.run_qc_stage(workers, force)
         
-        for station in sorted(buoy_year_groups.keys()):
-            years = buoy_year_groups[station]
-            print(f"\n{'='*20} STATION {station} {'='*20}")
-            print(f"Years available: {sorted(years.keys())}")
-            
-            station_summary = {
-                'station': station,
-                'years': {},
-                'total_records': 0,
-                'total_qc_complete': 0
-            }
-            
-            for year in sorted(years.keys()):
-                files = years[year]
-                
-                # Load data for this station-year combination
-                year_df = self.load_buoy_year_data(station, year, files)
-                if year_df is None:
-                    print(f"    Skipping {station} - {year} - no valid data")
-                    continue
-                
-                # Apply QC
-                qc_df, qc_results = self.apply_basic_qc(year_df, station)
-                
-                # Create visualizations
-                plot_file = self.create_yearly_visualization(qc_df, station, year, qc_results)
-                
-                # Generate report
-                report_file = self.generate_yearly_qc_report(station, year, qc_df, qc_results, plot_file)
-                
-                # Convert report to PDF
-                pdf_file = self.convert_markdown_to_pdf(report_file, station, year)
-                
-                # Save QC'd data
-                output_file = os.path.join(self.output_dir, f'buoy_{station}_{year}_qcd.csv')
-                qc_df.to_csv(output_file, index=False)
-                print(f"    Saved QC'd data: {output_file}")
-                
-                # Track summary statistics
-                qc_complete = (qc_df['qc_ind'] == 1).sum()
-                station_summary['years'][year] = {
-                    'records': len(qc_df),
-                    'qc_complete': qc_complete,
-                    'qc_percentage': (qc_complete / len(qc_df) * 100),
-                    'output_file': output_file,
-                    'report_file': report_file
-                }
-                station_summary['total_records'] += len(qc_df)
-                station_summary['total_qc_complete'] += qc_complete
-            
-            processing_summary.append(station_summary)
+        # Reports for the station-years whose datasets were just rebuilt, and
+        # for unchanged ones whose reports were never (successfully) rendered
+        if data_only:
+            print(f"\nRender stage skipped (data only); run with --render-only to build reports")
+        else:
+            processed = set(processed_keys)
+            render_keys = [key for key in self.find_rendered_station_years()
+                           if key in processed or self.report_needs_render(*key)]
+            stale = len(render_keys) - len(processed)
+            if stale:
+                print(f"\n{stale} unchanged station-years have missing or outdated reports")
+            render_failures = self.run_render_stage(render_keys, render_workers or workers)
+            self.print_render_summary(len(render_keys), render_failures)
         
         # Print summary
         print(f"\n{'='*20} PROCESSING COMPLETE {'='*20}")
@@ -1197,9 +699,298 @@ class BuoyQCProcessor:
             print(f"\nStation {station} - Overall: {total_records:,} records, {overall_qc_pct:.1f}% QC complete")
             for year, year_data in station_summary['years'].items():
                 print(f"  {year}: {year_data['records']:,} records, {year_data['qc_percentage']:.1f}% QC complete")
+            for year, error in station_summary['failed_years'].items():
+                print(f"  {year}: FAILED - {error}")
         
         return processing_summary
+    
+    def run_qc_stage(self, workers=1, force=False):
+        """QC stage: write QC'd datasets and results JSON for changed station-years
+        
+        Returns (processing_summary, processed_keys) where processed_keys are
+        the (station, year) pairs whose artifacts were rebuilt in this run.
+        """
+        # Get all buoy files grouped by station and year
+        buoy_year_groups = self.get_buoy_files_by_year()
+        print(f"Found {len(buoy_year_groups)} buoy stations")
+        
+        # Skip station-years whose inputs are unchanged since the last run
+        manifest = self.load_build_manifest()
+        fingerprints = {}
+        jobs = []
+        for station in sorted(buoy_year_groups.keys()):
+            for year, files in sorted(buoy_year_groups[station].items()):
+                key = f"{station}_{year}"
+                fingerprints[key] = self.get_station_year_fingerprint(station, year, files)
+                entry = manifest.get(key, {})
+                unchanged = (entry.get('fingerprint') == fingerprints[key][0] and
+                             self.qc_outputs_exist(station, year, entry))
+                if force or not unchanged:
+                    jobs.append((station, year, files))
+        
+        total_jobs = sum(len(years) for years in buoy_year_groups.values())
+        print(f"{len(jobs)} of {total_jobs} station-years need processing" +
+              (" (forced)" if force else ""))
+        
+        # Station-year jobs are independent; fan them out when workers > 1
+        executor = None
+        pending = {}
+        if workers > 1 and jobs:
+            print(f"Processing {len(jobs)} station-years with {workers} worker processes")
+            executor = ProcessPoolExecutor(max_workers=workers)
+            for station, year, files in jobs:
+                pending[(station, year)] = executor.submit(run_captured, self.process_station_year, station, year, files)
+        job_keys = {(station, year) for station, year, _ in jobs}
+        
+        processing_summary = []
+        processed_keys = []
+        
+        try:
+            for station in sorted(buoy_year_groups.keys()):
+                years = buoy_year_groups[station]
+                print(f"\n{'='*20} STATION {station} {'='*20}")
+                print(f"Years available: {sorted(years.keys())}")
+                
+                station_summary = {
+                    'station': station,
+                    'years': {},
+                    'failed_years': {},
+                    'total_records': 0,
+                    'total_qc_complete': 0
+                }
+                
+                for year in sorted(years.keys()):
+                    key = f"{station}_{year}"
+                    if (station, year) not in job_keys:
+                        print(f"  Skipping {station} - {year} - inputs unchanged since last run")
+                        year_summary = manifest[key]['summary']
+                        station_summary['years'][year] = year_summary
+                        station_summary['total_records'] += year_summary['records']
+                        station_summary['total_qc_complete'] += year_summary['qc_complete']
+                        continue
+                    
+                    if executor is not None:
+                        # Print each job's captured output in submission order
+                        try:
+                            output, year_summary, error = pending[(station, year)].result()
+                        except Exception as e:
+                            output, year_summary, error = '', None, f"{type(e).__name__}: {e}"
+                        print(output, end='')
+                    else:
+                        output, year_summary, error = run_captured(
+                            self.process_station_year, station, year, years[year], capture_output=False
+                        )
+                    
+                    if error:
+                        print(f"    Error processing {station} - {year}: {error}")
+                        station_summary['failed_years'][year] = error
+                        manifest.pop(key, None)
+                        continue
+                    if year_summary is None:
+                        manifest.pop(key, None)
+                        continue
+                    
+                    fingerprint, input_hashes = fingerprints[key]
+                    manifest[key] = {
+                        'fingerprint': fingerprint,
+                        'inputs': input_hashes,
+                        'processed': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                        'summary': year_summary
+                    }
+                    station_summary['years'][year] = year_summary
+                    station_summary['total_records'] += year_summary['records']
+                    station_summary['total_qc_complete'] += year_summary['qc_complete']
+                    processed_keys.append((station, year))
+                
+                processing_summary.append(station_summary)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            self.save_build_manifest(manifest)
+        
+        return processing_summary, processed_keys
+    
+    def run_render_stage(self, keys, workers=1):
+        """Render stage: build PNG/MD/PDF reports from QC stage artifacts
+        
+        Returns {(station, year): error} for reports that failed to render.
+        """
+        if not keys:
+            return {}
+        
+        print(f"\n{'='*20} RENDER STAGE {'='*20}")
+        executor = None
+        pending = {}
+        if workers > 1:
+            print(f"Rendering {len(keys)} station-year reports with {workers} worker processes")
+            executor = ProcessPoolExecutor(max_workers=workers)
+            for station, year in keys:
+                pending[(station, year)] = executor.submit(run_captured, self.render_station_year, station, year)
+        
+        failures = {}
+        try:
+            for station, year in keys:
+                if executor is not None:
+                    try:
+                        output, _, error = pending[(station, year)].result()
+                    except Exception as e:
+                        output, error = '', f"{type(e).__name__}: {e}"
+                    print(output, end='')
+                else:
+                    _, _, error = run_captured(self.render_station_year, station, year, capture_output=False)
+                
+                if error:
+                    print(f"    Error rendering {station} - {year}: {error}")
+                    failures[(station, year)] = error
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        
+        return failures
+    
+    def print_render_summary(self, total, failures):
+        """Report how many station-year reports were rendered"""
+        print(f"\nRendered {total - len(failures)} of {total} station-year reports")
+        for (station, year), error in failures.items():
+            print(f"  {station} - {year}: REPORT FAILED - {error}")
+    
+    def get_results_file(self, station, year):
+        """Path of the QC results JSON written by the QC stage"""
+        return os.path.join(self.output_dir, f'buoy_{station}_{year}_qc_results.json')
+    
+    def qc_outputs_exist(self, station, year, entry):
+        """True when a manifest entry's QC'd dataset and results JSON are both on disk"""
+        output_file = entry.get('summary', {}).get('output_file')
+        return (output_file is not None and os.path.exists(output_file) and
+                os.path.exists(self.get_results_file(station, year)))
+    
+    def get_report_files(self, station, year):
+        """Overview PNG, markdown and PDF paths written by the render stage"""
+        prefix = os.path.join(self.output_dir, f'buoy_{station}_{year}')
+        return f'{prefix}_qc_overview.png', f'{prefix}_qc_report.md', f'{prefix}_qc_report.pdf'
+    
+    def report_needs_render(self, station, year):
+        """True when any report file is missing or older than the results JSON
+        
+        The overview PNG is only checked for presence: the figure cache
+        reuses an unchanged image without rewriting it.
+        """
+        results_time = os.path.getmtime(self.get_results_file(station, year))
+        plot_file, report_file, pdf_file = self.get_report_files(station, year)
+        if not os.path.exists(plot_file):
+            return True
+        return any(not os.path.exists(path) or os.path.getmtime(path) < results_time
+                   for path in (report_file, pdf_file))
+    
+    def find_rendered_station_years(self):
+        """(station, year) pairs with QC stage artifacts available for rendering"""
+        keys = []
+        for file_name in sorted(os.listdir(self.output_dir)):
+            if file_name.startswith('buoy_') and file_name.endswith('_qc_results.json'):
+                parts = file_name.split('_')
+                keys.append((parts[1], parts[2]))
+        return keys
+    
+    def process_station_year(self, station, year, files):
+        """QC stage for a single station-year: load, QC and save artifacts
+        
+        Writes the QC'd dataset and a results JSON (QC summary, issues and
+        year summary) for the render stage. Returns the year summary dict,
+        or None if there was no valid data.
+        """
+        # Load data for this station-year combination
+        year_df = self.load_buoy_year_data(station, year, files)
+        if year_df is None:
+            print(f"    Skipping {station} - {year} - no valid data")
+            return None
+        
+        # Apply QC
+        qc_df, qc_results = self.apply_basic_qc(year_df, station)
+        
+        # Save QC'd data (CSV export plus typed Parquet copy)
+        output_file = os.path.join(self.output_dir, f'buoy_{station}_{year}_qcd.csv')
+        write_qcd(qc_df, output_file)
+        print(f"    Saved QC'd data: {output_file}")
+        
+        # Track summary statistics
+        qc_complete = int((qc_df['qc_ind'] == 1).sum())
+        year_summary = {
+            'records': len(qc_df),
+            'qc_complete': qc_complete,
+            'qc_percentage': (qc_complete / len(qc_df) * 100),
+            'output_file': output_file
+        }
+        
+        # Compact results for the render stage
+        results_file = self.get_results_file(station, year)
+        temp_file = results_file + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({'station': station, 'year': year, 'summary': year_summary,
+                       'qc_results': qc_results}, f, indent=2)
+        os.replace(temp_file, results_file)
+        
+        return year_summary
+    
+    def render_station_year(self, station, year):
+        """Render stage for a single station-year: overview PNG, report and PDF"""
+        print(f"  Rendering {station} - {year}...")
+        
+        with open(self.get_results_file(station, year), 'r', encoding='utf-8') as f:
+            results = json.load(f)
+        qc_results = results['qc_results']
+        qc_df = read_qcd(results['summary']['output_file'])
+        
+        # Create visualizations
+        plot_file = self.create_yearly_visualization(qc_df, station, year, qc_results)
+        
+        # Build the report once, then write markdown and PDF from it
+        report = self.build_yearly_qc_report(station, year, qc_df, qc_results, plot_file)
+        report_file = self.write_yearly_qc_markdown(report, station, year)
+        self.write_yearly_qc_pdf(report, station, year)
+        
+        return report_file
+
+
+@lru_cache(maxsize=None)
+def _qc_pdf_styles():
+    """Paragraph styles for the yearly QC PDFs, created once per process"""
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.lib import colors
+    
+    styles = sample_styles()
+    return {
+        'title': ParagraphStyle('CustomTitle', parent=styles['Heading1'],
+                                fontSize=18, spaceAfter=30, textColor=colors.HexColor('#2c3e50')),
+        'heading2': ParagraphStyle('CustomHeading', parent=styles['Heading2'],
+                                   fontSize=14, spaceAfter=12, textColor=colors.HexColor('#34495e')),
+        'heading3': ParagraphStyle('CustomSubHeading', parent=styles['Heading3'],
+                                   fontSize=12, spaceAfter=8, textColor=colors.HexColor('#2980b9')),
+        'body': styles['Normal'],
+        'bullet': styles['Normal']
+    }
+
+
 
 if __name__ == "__main__":
-    processor = BuoyQCProcessor()
-    results = processor.process_all_buoys_by_year()
+    parser = argparse.ArgumentParser(description="Buoy QC processing by station and year")
+    parser.add_argument('--workers', '-w', type=int, default=1,
+                        help='Number of worker processes for station-year jobs (default: 1)')
+    parser.add_argument('--render-workers', type=int, default=None,
+                        help='Number of worker processes for the render stage (default: --workers)')
+    parser.add_argument('--force', '-f', action='store_true',
+                        help='Reprocess every station-year even if its inputs are unchanged')
+    parser.add_argument('--plot-max-points', type=int, default=DEFAULT_PLOT_MAX_POINTS,
+                        help=f'Maximum good-data points drawn per plot panel, 0 for all (default: {DEFAULT_PLOT_MAX_POINTS})')
+    parser.add_argument('--no-figure-cache', action='store_true',
+                        help='Redraw overview plots even when their data and settings are unchanged')
+    stage = parser.add_mutually_exclusive_group()
+    stage.add_argument('--data-only', action='store_true',
+                       help='Run the QC stage only (datasets and results JSON, no reports)')
+    stage.add_argument('--render-only', action='store_true',
+                       help='Rebuild PNG/MD/PDF reports from existing QC results without re-running QC')
+    args = parser.parse_args()
+    
+    processor = BuoyQCProcessor(plot_max_points=args.plot_max_points, figure_cache=not args.no_figure_cache)
+    results = processor.process_all_buoys_by_year(workers=args.workers, force=args.force,
+                                                  render_workers=args.render_workers,
+                                                  data_only=args.data_only, render_only=args.render_only)
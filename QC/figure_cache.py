@@ -0,0 +1,73 @@
+"""
+Figure Cache
+============
+
+Content-addressed reuse of rendered figures, shared by the QC overview
+plots and the storm analyzer.
+
+A figure's key is a SHA-256 over exactly what it draws: the plotted data
+frames (values, QC indicators and reason codes, hashed with pandas' row
+hashing), the caller's plot configuration (title, limits, decimation
+budget, layout version) and the installed matplotlib version. The key is
+written into the PNG itself as a text chunk (savefig metadata), so the
+image and its key are always saved together. When the next render
+computes the same key as the existing image carries, the caller reuses
+the image without importing or running matplotlib.
+
+Callers bump their own figure version constant when the drawing code
+changes in a way that should invalidate cached images.
+"""
+
+import json
+import hashlib
+import pandas as pd
+
+# Bump when the key layout changes
+CACHE_VERSION = 1
+
+# PNG text chunk holding the key
+KEY_FIELD = 'Figure key'
+
+
+def _matplotlib_version():
+    # Read from the package metadata so a cache hit never imports matplotlib
+    try:
+        from importlib.metadata import version
+        return version('matplotlib')
+    except Exception:
+        return None
+
+
+def figure_key(frames, config):
+    """Hash of the frames a figure draws plus its plot configuration
+
+    frames is a sequence of DataFrames (None entries are skipped); config
+    is any JSON-serialisable description of everything else that affects
+    the image.
+    """
+    digest = hashlib.sha256()
+    header = {'cache_version': CACHE_VERSION, 'matplotlib': _matplotlib_version(), 'config': config}
+    digest.update(json.dumps(header, sort_keys=True, default=str).encode('utf-8'))
+
+    for frame in frames:
+        if frame is None:
+            continue
+        digest.update(json.dumps([list(map(str, frame.columns)), len(frame)]).encode('utf-8'))
+        if len(frame):
+            digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def png_metadata(key):
+    """savefig metadata recording the key in the rendered PNG"""
+    return {KEY_FIELD: key}
+
+
+def is_cached(figure_file, key):
+    """True when figure_file exists and was rendered from inputs with this key"""
+    try:
+        from PIL import Image
+        with Image.open(str(figure_file)) as im:
+            return im.info.get(KEY_FIELD) == key  # text chunks precede the pixel data
+    except (OSError, ImportError):
+        return False
@@ -0,0 +1,142 @@
+"""
+Logger Metadata Loader
+======================
+
+Single loader for Buoy Data/imdbon_log_of_loggers.csv, shared by the QC
+processor, the consumer export and the storm analyzer.
+
+The log is compiled once into a typed table (one row per deployment:
+station, logger_id, start_time, end_time, is_live, live_wave, comment) plus
+the per-station entry lists built from it, and pickled next to the CSV,
+keyed on the file's modification time and SHA-256 hash. Later runs load
+the pickle instead of re-parsing, and an edited log is recompiled
+automatically.
+
+Entries returned by load_logger_info() are dicts with those fields:
+logger_id stripped of padding, start/end as Timestamps (end None while
+still deployed), is_live and live_wave as bools.
+"""
+
+import os
+import hashlib
+import pickle
+import pandas as pd
+
+LOG_DATE_FORMAT = '%d/%m/%Y %H:%M'
+
+# Bump when the compiled layout changes
+CACHE_VERSION = 1
+
+
+def cache_path(logger_file):
+    """Compiled cache stored alongside the logger log"""
+    directory, name = os.path.split(logger_file)
+    return os.path.join(directory, f".{os.path.splitext(name)[0]}.cache.pkl")
+
+
+def _file_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _parse_log_times(values):
+    """Parse DD/MM/YYYY HH:MM times, falling back to flexible day-first parsing"""
+    times = pd.to_datetime(values, format=LOG_DATE_FORMAT, errors='coerce')
+    retry = times.isna() & values.notna()
+    if retry.any():
+        times[retry] = pd.to_datetime(values[retry], format='mixed', dayfirst=True, errors='coerce')
+    return times
+
+
+def compile_logger_log(logger_file):
+    """Parse the logger log into a typed table, one row per deployment"""
+    df = pd.read_csv(logger_file)
+
+    table = pd.DataFrame({
+        'station': df['Buoy'].astype(str).str.strip(),
+        'logger_id': df['Loggerid'].astype(str).str.strip(),
+        'start_time': _parse_log_times(df['Start']),
+        'end_time': _parse_log_times(df['End']),
+        'is_live': df['Live'].fillna(0).astype(bool),
+        'live_wave': df['Live_wave'].fillna(0).astype(bool),
+        'comment': df['Comment'].fillna('').astype(str) if 'Comment' in df.columns else ''
+    })
+
+    invalid = table['start_time'].isna()
+    for row in table[invalid].itertuples():
+        print(f"Warning: Invalid start time for {row.station} - {row.logger_id}")
+
+    return table[~invalid].reset_index(drop=True)
+
+
+def _read_cache(cache_file):
+    try:
+        with open(cache_file, 'rb') as f:
+            cached = pickle.load(f)
+        return cached if cached.get('version') == CACHE_VERSION else None
+    except Exception:
+        return None
+
+
+def _write_cache(cache_file, cached):
+    # Cache is an optimisation only; a read-only data directory just skips it
+    try:
+        temp_file = cache_file + '.tmp'
+        with open(temp_file, 'wb') as f:
+            pickle.dump(cached, f)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        pass
+
+
+def _load_compiled(logger_file, use_cache=True):
+    """Compiled {'table', 'logger_info'}, from the cache when the log is unchanged"""
+    stat = os.stat(logger_file)
+    cache_file = cache_path(logger_file)
+    cached = _read_cache(cache_file) if use_cache else None
+
+    if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+        return cached
+
+    digest = _file_hash(logger_file)
+    if cached and cached['sha256'] == digest:
+        table = cached['table']  # touched but unchanged
+    else:
+        table = compile_logger_log(logger_file)
+
+    compiled = {
+        'version': CACHE_VERSION,
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'sha256': digest,
+        'table': table,
+        'logger_info': logger_info_from_table(table)
+    }
+    if use_cache:
+        _write_cache(cache_file, compiled)
+    return compiled
+
+
+def logger_info_from_table(table):
+    """{station: [entry, ...]} with each station's entries sorted by start time"""
+    logger_info = {}
+    for station, group in table.groupby('station', sort=False):
+        logger_info[station] = [{
+            'logger_id': row.logger_id,
+            'start_time': row.start_time,
+            'end_time': row.end_time if pd.notna(row.end_time) else None,
+            'is_live': bool(row.is_live),
+            'live_wave': bool(row.live_wave),
+            'comment': row.comment
+        } for row in group.sort_values('start_time', kind='stable').itertuples()]
+    return logger_info
+
+
+def load_logger_table(logger_file, use_cache=True):
+    """Typed logger table (one row per deployment)"""
+    return _load_compiled(logger_file, use_cache)['table']
+
+
+def load_logger_info(logger_file, use_cache=True):
+    """Load the logger log as {station: [entry, ...]}"""
+    return _load_compiled(logger_file, use_cache)['logger_info']
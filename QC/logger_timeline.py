@@ -0,0 +1,178 @@
+"""
+Logger Timeline Index
+=====================
+
+Interval index over a station's logger deployments from
+imdbon_log_of_loggers.csv, shared by the QC processor, the consumer export
+and the storm analyzer.
+
+Each station's entries are held as sorted start/end arrays, so point and
+range queries are binary searches rather than scans of the logger list,
+and live_logger_index_at() attributes the live logger to every timestamp
+of a record array in one call. filter_to_live_logger() builds on it to keep
+only the records written by the logger that was live at each record's time.
+
+Entries are the loaders' own logger dicts; only 'start_time', 'end_time'
+and the live flag are read. A missing end time means the logger is still
+deployed, a missing start time that it has been since records began.
+Where live deployments overlap, the entry listed first wins.
+"""
+
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+import pandas as pd
+
+OPEN_START = np.iinfo(np.int64).min
+OPEN_END = np.iinfo(np.int64).max
+
+
+def _to_ns(values):
+    """datetime-like values -> (int64 nanoseconds, missing mask)"""
+    if not isinstance(values, (pd.Series, pd.Index, np.ndarray, list)):
+        values = list(values)
+    times = pd.DatetimeIndex(pd.to_datetime(values, errors='coerce')).as_unit('ns')
+    return times.asi8.copy(), times.isna()
+
+
+def _timestamp_ns(value):
+    return pd.Timestamp(value).value
+
+
+def normalise_logger_id(logger_id):
+    """Logger IDs are space-padded in both the logger log and the data files"""
+    return str(logger_id).strip()
+
+
+class LoggerTimeline:
+    """Sorted interval index over one station's logger entries"""
+
+    def __init__(self, entries, live_key='is_live'):
+        self.entries = list(entries)
+        self.live = np.array([pd.notna(e.get(live_key)) and bool(e.get(live_key)) for e in self.entries], dtype=bool)
+
+        starts, no_start = _to_ns(e.get('start_time') for e in self.entries)
+        ends, no_end = _to_ns(e.get('end_time') for e in self.entries)
+        self.starts = np.where(no_start, OPEN_START, starts)
+        self.ends = np.where(no_end, OPEN_END, ends)
+
+        # Range queries: binary search on start times
+        self._order = np.argsort(self.starts, kind='stable')
+        self._sorted_starts = self.starts[self._order].tolist()
+
+        self._build_live_segments()
+
+    def _build_live_segments(self):
+        """Split time at every live start/end so each segment has one owner"""
+        live = np.flatnonzero(self.live)
+
+        # Inclusive end times -> half-open [start, end + 1ns)
+        stops = np.where(self.ends[live] == OPEN_END, OPEN_END, self.ends[live] + 1)
+        bounds = np.unique(np.concatenate([self.starts[live], stops]))
+        owners = np.full(len(bounds), -1, dtype=np.int64)
+
+        # Assign in reverse so the earliest-listed live logger wins
+        for i, stop in zip(live[::-1], stops[::-1]):
+            owners[(bounds >= self.starts[i]) & (bounds < stop)] = i
+
+        self._bounds = bounds
+        self._owners = owners
+        self._bounds_list = bounds.tolist()
+
+    def live_logger_index_at(self, times):
+        """Index into entries of the live logger at each timestamp (-1 if none)"""
+        t, missing = _to_ns(times)
+        if len(self._bounds) == 0:
+            return np.full(len(t), -1, dtype=np.int64)
+
+        segment = np.searchsorted(self._bounds, t, side='right') - 1
+        index = np.where(segment >= 0, self._owners[np.maximum(segment, 0)], -1)
+        index[missing] = -1
+        return index
+
+    def live_logger_ids_at(self, times):
+        """Logger ID of the live logger at each timestamp (None if none)"""
+        logger_ids = np.array([e.get('logger_id') for e in self.entries] + [None], dtype=object)
+        return logger_ids[self.live_logger_index_at(times)]
+
+    def live_logger_mask(self, times, logger_ids):
+        """True where a record's logger was the live logger at the record's time
+
+        An as-of join of records onto the live deployments followed by an ID
+        comparison. IDs are normalised once per distinct value and compared
+        as categorical codes rather than string-matched per record.
+        """
+        live_index = self.live_logger_index_at(times)
+        records = pd.Categorical(logger_ids)
+
+        # Code each distinct normalised ID; -1 = no live logger, -2 = unknown ID
+        codes = {}
+        entry_codes = np.array([codes.setdefault(normalise_logger_id(e.get('logger_id')), len(codes))
+                                for e in self.entries] + [-1], dtype=np.int64)
+        category_codes = np.array([codes.get(normalise_logger_id(c), -2) for c in records.categories] + [-2],
+                                  dtype=np.int64)
+
+        return category_codes[records.codes] == entry_codes[live_index]
+
+    def live_logger_at(self, time):
+        """Live logger entry at a single timestamp, or None"""
+        if pd.isna(time) or len(self._bounds) == 0:
+            return None
+        segment = bisect_right(self._bounds_list, _timestamp_ns(time)) - 1
+        index = self._owners[segment] if segment >= 0 else -1
+        return self.entries[index] if index >= 0 else None
+
+    def _overlapping_indices(self, start, end, live_only=False, inclusive=False):
+        start, end = _timestamp_ns(start), _timestamp_ns(end)
+        if not inclusive and start >= end:
+            return np.array([], dtype=np.int64)
+
+        # Only entries starting before the period ends can overlap it
+        k = (bisect_right if inclusive else bisect_left)(self._sorted_starts, end)
+        candidates = np.sort(self._order[:k])
+
+        ends = self.ends[candidates]
+        if inclusive:
+            hit = ends >= start
+        else:
+            hit = (ends > start) & (self.starts[candidates] < ends)
+        if live_only:
+            hit &= self.live[candidates]
+        return candidates[hit]
+
+    def overlapping(self, start, end, live_only=False, inclusive=False):
+        """Entries whose deployment overlaps [start, end], in entry order
+
+        With inclusive=False the overlap must have positive length; with
+        inclusive=True deployments that only touch the period also count.
+        """
+        return [self.entries[i] for i in self._overlapping_indices(start, end, live_only, inclusive)]
+
+    def majority_live_logger(self, start, end, min_coverage=0.5):
+        """Live logger covering the largest share of [start, end]
+
+        Returns (entry, coverage); entry is None unless coverage exceeds
+        min_coverage. Ties go to the earliest-listed entry.
+        """
+        candidates = self._overlapping_indices(start, end, live_only=True)
+        if len(candidates) == 0:
+            return None, 0.0
+
+        start, end = _timestamp_ns(start), _timestamp_ns(end)
+        overlap = np.minimum(self.ends[candidates], end) - np.maximum(self.starts[candidates], start)
+        coverage = overlap / (end - start)
+        best = int(np.argmax(coverage))
+
+        if coverage[best] > min_coverage:
+            return self.entries[candidates[best]], float(coverage[best])
+        return None, float(coverage[best])
+
+
+def filter_to_live_logger(df, timeline, time_column='time', logger_column='loggerid'):
+    """Rows of df recorded by the logger that was live at each row's time"""
+    return df[timeline.live_logger_mask(df[time_column], df[logger_column])]
+
+
+def build_logger_timelines(logger_info, live_key='is_live'):
+    """One LoggerTimeline per station from a {station: [entry, ...]} dict"""
+    return {station: LoggerTimeline(entries, live_key) for station, entries in logger_info.items()}
@@ -35,11 +35,14 @@ def view_qc_limits(csv_file="../Buoy Data/qc_limits.csv"):
             print(f"  {param}:")
             print(f"    Range: {min_val} to {max_val}")
             print(f"    Spike threshold: {spike_val}")
+            if pd.notna(row.get('flatline_count')):
+                print(f"    Flat line: {int(row['flatline_count'])}+ values within {row.get('flatline_tolerance', 0.0)}")
             print(f"    Notes: {notes}")
             print()
 
 def add_qc_limit(csv_file="../Buoy Data/qc_limits.csv", parameter=None, station=None, 
-                 min_value=None, max_value=None, spike_threshold=None, notes=""):
+                 min_value=None, max_value=None, spike_threshold=None, notes="",
+                 flatline_count=None, flatline_tolerance=None):
     """Add a new QC limit to the CSV file"""
     if not os.path.exists(csv_file):
         print(f"QC limits file not found: {csv_file}")
@@ -61,6 +64,8 @@ def add_qc_limit(csv_file="../Buoy Data/qc_limits.csv", parameter=None, station=
         'min_value': min_value,
         'max_value': max_value,
         'spike_threshold': spike_threshold,
+        'flatline_count': flatline_count,
+        'flatline_tolerance': flatline_tolerance,
         'notes': notes
     }
     
@@ -72,7 +77,8 @@ def add_qc_limit(csv_file="../Buoy Data/qc_limits.csv", parameter=None, station=
     return True
 
 def update_qc_limit(csv_file="../Buoy Data/qc_limits.csv", parameter=None, station=None,
-                    min_value=None, max_value=None, spike_threshold=None, notes=None):
+                    min_value=None, max_value=None, spike_threshold=None, notes=None,
+                    flatline_count=None, flatline_tolerance=None):
     """Update an existing QC limit in the CSV file"""
     if not os.path.exists(csv_file):
         print(f"QC limits file not found: {csv_file}")
@@ -94,6 +100,10 @@ def update_qc_limit(csv_file="../Buoy Data/qc_limits.csv", parameter=None, stati
         df.loc[mask, 'max_value'] = max_value
     if spike_threshold is not None:
         df.loc[mask, 'spike_threshold'] = spike_threshold
+    if flatline_count is not None:
+        df.loc[mask, 'flatline_count'] = flatline_count
+    if flatline_tolerance is not None:
+        df.loc[mask, 'flatline_tolerance'] = flatline_tolerance
     if notes is not None:
         df.loc[mask, 'notes'] = notes
     
@@ -0,0 +1,81 @@
+"""
+Parameter Metadata
+==================
+
+Display names, units and types of the QC'd buoy parameters. This is the
+mapping the web app's setup_qc_data command loads into QCParameter, kept
+here so exports that label variables use the same units.
+
+cf_attributes() translates an entry into CF-convention variable attributes
+(long_name, UDUNITS units, standard_name). Sensor duplicates such as
+airtemp_1 or seatemp_aa_2 take the attributes of their base parameter.
+"""
+
+import re
+
+PARAMETER_METADATA = {
+    'airpressure': {'display_name': 'Air Pressure', 'unit': 'hPa', 'type': 'environmental'},
+    'airtemp': {'display_name': 'Air Temperature', 'unit': '°C', 'type': 'environmental'},
+    'humidity': {'display_name': 'Humidity', 'unit': '%', 'type': 'environmental'},
+    'seatemp_16': {'display_name': 'Sea Temperature (16)', 'unit': '°C', 'type': 'water'},
+    'seatemp_aa': {'display_name': 'Sea Temperature (AA)', 'unit': '°C', 'type': 'water'},
+    'windsp': {'display_name': 'Wind Speed', 'unit': 'knots', 'type': 'environmental'},
+    'windgust': {'display_name': 'Wind Gust', 'unit': 'm/s', 'type': 'environmental'},
+    'winddir': {'display_name': 'Wind Direction', 'unit': '°', 'type': 'environmental'},
+    'hm0': {'display_name': 'Significant Wave Height', 'unit': 'm', 'type': 'wave'},
+    'hmax': {'display_name': 'Maximum Wave Height', 'unit': 'm', 'type': 'wave'},
+    'tp': {'display_name': 'Wave Period', 'unit': 's', 'type': 'wave'},
+    'mdir': {'display_name': 'Mean Wave Direction', 'unit': '°', 'type': 'wave'},
+    'salinity_16': {'display_name': 'Salinity', 'unit': 'ppt', 'type': 'water'}
+}
+
+# Display units that are not valid UDUNITS strings
+CF_UNITS = {
+    '°C': 'degC',
+    '°': 'degree',
+    '%': 'percent',
+    'knots': 'knot',
+    'm/s': 'm s-1',
+    'ppt': '1e-3'
+}
+
+CF_STANDARD_NAMES = {
+    'airpressure': 'air_pressure',
+    'airtemp': 'air_temperature',
+    'humidity': 'relative_humidity',
+    'seatemp_16': 'sea_water_temperature',
+    'seatemp_aa': 'sea_water_temperature',
+    'windsp': 'wind_speed',
+    'windgust': 'wind_speed_of_gust',
+    'winddir': 'wind_from_direction',
+    'hm0': 'sea_surface_wave_significant_height',
+    'hmax': 'sea_surface_wave_maximum_height',
+    'tp': 'sea_surface_wave_period_at_variance_spectral_density_maximum',
+    'mdir': 'sea_surface_wave_from_direction',
+    'salinity_16': 'sea_water_salinity'
+}
+
+_SENSOR_SUFFIX = re.compile(r'_\d$')
+
+
+def base_parameter(column):
+    """Parameter whose metadata applies to column, or None if it has none"""
+    if column in PARAMETER_METADATA:
+        return column
+    base = _SENSOR_SUFFIX.sub('', column)
+    return base if base in PARAMETER_METADATA else None
+
+
+def cf_attributes(column):
+    """CF variable attributes for column; empty when it has no metadata"""
+    param = base_parameter(column)
+    if param is None:
+        return {}
+    info = PARAMETER_METADATA[param]
+    attrs = {
+        'long_name': info['display_name'],
+        'units': CF_UNITS.get(info['unit'], info['unit'])
+    }
+    if param in CF_STANDARD_NAMES:
+        attrs['standard_name'] = CF_STANDARD_NAMES[param]
+    return attrs
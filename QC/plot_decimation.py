@@ -0,0 +1,100 @@
+"""
+Plot Decimation
+===============
+
+Min/max envelope decimation for dense time series plots, shared by the QC
+overview figures and the storm analyzer.
+
+The x range is split into equal-width buckets (roughly one per pixel column
+at the default figure size). decimate() keeps the first, last, minimum and
+maximum sample of each bucket for line plots; envelope_bands() reduces a
+dense marker cloud to one min-max band per bucket. At the plotted
+resolution either is indistinguishable from the full series, peaks and
+troughs are never lost, and the number of points drawn per series is
+bounded by plot_max_points regardless of record count.
+
+Only good data should be decimated; QC failures are plotted in full by the
+callers so every flagged point stays visible.
+"""
+
+import numpy as np
+import pandas as pd
+
+# A few points per pixel column of a half-width 15in panel at 300 dpi; a
+# leap year of hourly records (8,784) is still drawn point by point
+DEFAULT_PLOT_MAX_POINTS = 10000
+
+
+def _buckets(x, y, n_buckets):
+    """(positions of drawable samples, equal-width x bucket of each)"""
+    x = pd.Series(x).to_numpy()
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype('datetime64[ns]').astype(np.int64)
+    x = x.astype(float)
+    y = np.asarray(y, dtype=float)
+
+    # Samples that cannot be drawn do not take part in the envelope
+    valid = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+    xv = x[valid]
+    span = xv.max() - xv.min() if len(xv) else 0
+    if span > 0:
+        buckets = np.minimum(((xv - xv.min()) / span * n_buckets).astype(np.int64), n_buckets - 1)
+    else:
+        buckets = np.zeros(len(xv), dtype=np.int64)
+    return valid, buckets
+
+
+def envelope_indices(x, y, max_points):
+    """Positions of the samples kept by min/max-per-bucket decimation
+
+    x and y are equal-length array-likes (x numeric or datetime). Returns
+    sorted positional indices; all positions when no decimation is needed.
+    """
+    n = len(y)
+    if not max_points or n <= max_points:
+        return np.arange(n)
+
+    # Four samples per bucket (first, last, min, max)
+    valid, buckets = _buckets(x, y, max(max_points // 4, 1))
+    if len(valid) <= max_points:
+        return valid
+    yv = np.asarray(y, dtype=float)[valid]
+
+    # Within each bucket: order by position for first/last, by value for min/max
+    by_position = np.argsort(buckets, kind='stable')
+    by_value = np.lexsort((yv, buckets))
+    group_start = np.flatnonzero(np.r_[True, np.diff(buckets[by_position]) != 0])
+    group_end = np.r_[group_start[1:], len(buckets)] - 1
+
+    keep = np.concatenate([by_position[group_start], by_position[group_end],
+                           by_value[group_start], by_value[group_end]])
+    return valid[np.unique(keep)]
+
+
+def decimate(df, x_column, y_column, max_points=DEFAULT_PLOT_MAX_POINTS):
+    """Rows of df kept by min/max envelope decimation of y_column against x_column
+
+    Suited to line plots, where joining each bucket's extremes redraws the
+    full series at pixel resolution.
+    """
+    if not max_points or len(df) <= max_points:
+        return df
+    return df.iloc[envelope_indices(df[x_column], df[y_column], max_points)]
+
+
+def envelope_bands(df, x_column, y_column, max_points=DEFAULT_PLOT_MAX_POINTS):
+    """Per-bucket (x, ymin, ymax) envelope of a dense point cloud, or None
+
+    Suited to marker plots, where a cloud too dense to resolve is drawn as
+    one vertical min-max band per bucket (two points each) instead of its
+    individual samples. x is the bucket's first sample. Returns None when
+    the series is small enough to plot in full.
+    """
+    if not max_points or len(df) <= max_points:
+        return None
+
+    valid, buckets = _buckets(df[x_column], df[y_column], max(max_points // 2, 1))
+    rows = df.iloc[valid]
+    grouped = pd.DataFrame({'x': rows[x_column].to_numpy(), 'y': rows[y_column].to_numpy(dtype=float),
+                            'bucket': buckets}).groupby('bucket', sort=True)
+    return pd.DataFrame({'x': grouped['x'].first(), 'ymin': grouped['y'].min(), 'ymax': grouped['y'].max()})
@@ -0,0 +1,188 @@
+"""
+Vectorized QC Checks
+====================
+
+NumPy implementations of the automatic QC tests used by BuoyQCProcessor.
+Each check works on whole columns at once instead of looping per row.
+
+run_qc_kernel applies the range, spike and flat line tests to a
+(time x parameter) value matrix in a single pass and returns the updated
+indicator matrix together with a failure reason code for every cell.
+"""
+
+import numpy as np
+
+# Default flat-line settings used when qc_limits.csv does not override them
+FLAT_LINE_MIN_RUN = 5
+FLAT_LINE_TOLERANCE = 0.0
+
+# Failure reason codes (int8), one per value
+REASON_NONE = 0      # Not failed by an automatic test
+REASON_RANGE = 1     # Outside physical limits
+REASON_SPIKE = 2     # Unrealistic change from previous valid value
+REASON_FLATLINE = 3  # Part of a run of identical values
+REASON_MISSING = 9   # Missing (indicator already 9)
+
+REASON_LABELS = {
+    REASON_NONE: 'good',
+    REASON_RANGE: 'range',
+    REASON_SPIKE: 'spike',
+    REASON_FLATLINE: 'flatline',
+    REASON_MISSING: 'missing'
+}
+
+# Column order of the limits matrix passed to run_qc_kernel
+LIMIT_FIELDS = ['min', 'max', 'spike_threshold', 'flatline_count', 'flatline_tolerance']
+
+
+def _previous_valid_index(valid):
+    """Row index of the previous valid value in each column (-1 if none)"""
+    rows = np.arange(valid.shape[0])[:, None]
+    last_valid = np.maximum.accumulate(np.where(valid, rows, -1), axis=0)
+    previous = np.full(valid.shape, -1, dtype=np.int64)
+    previous[1:] = last_valid[:-1]
+    return previous
+
+
+def _drift_run_starts(column_values, run_starts, min_run, tolerance):
+    """Extra run starts that keep each run within tolerance of itself
+
+    Adjacent values within tolerance can still drift (e.g. a slow pressure
+    fall). Candidate runs long enough to be flagged but spanning more than
+    tolerance are walked in order, and a value starts a new run when it
+    takes the run's max - min above tolerance.
+    """
+    starts = np.flatnonzero(run_starts)
+    ends = np.append(starts[1:], len(column_values))
+    long_runs = ends - starts >= min_run
+    split = np.zeros(len(column_values), dtype=bool)
+    for start, end in zip(starts[long_runs], ends[long_runs]):
+        run = column_values[start:end]
+        if not np.ptp(run) > tolerance:
+            continue
+        low = high = run[0]
+        for offset in range(1, len(run)):
+            low, high = min(low, run[offset]), max(high, run[offset])
+            if high - low > tolerance:
+                split[start + offset] = True
+                low = high = run[offset]
+    return split
+
+
+def _flat_line_matrix(values, valid, previous, min_run, tolerance):
+    """Run-length encoded flat line test over the valid values of each column
+
+    A run is a sequence of consecutive valid values whose max - min stays
+    within tolerance; with tolerance 0 that is exact equality.
+    """
+    n_rows, n_cols = values.shape
+    has_previous = previous >= 0
+    previous_values = np.take_along_axis(values, np.where(has_previous, previous, 0), axis=0)
+
+    # Adjacent NaNs count as identical, matching pandas' unique() behaviour
+    with np.errstate(invalid='ignore'):
+        same = np.abs(values - previous_values) <= tolerance
+    same |= np.isnan(values) & np.isnan(previous_values)
+    same &= has_previous
+
+    # Each valid value that differs from its predecessor starts a new run,
+    # as does one that drifts out of tolerance of its run; offset run ids
+    # per column so one bincount covers the whole matrix
+    run_starts = valid & ~same
+    min_run = np.broadcast_to(min_run, n_cols)
+    tolerance = np.broadcast_to(tolerance, n_cols)
+    for col in np.flatnonzero(tolerance > 0):
+        rows = np.flatnonzero(valid[:, col])
+        run_starts[rows, col] |= _drift_run_starts(values[rows, col], run_starts[rows, col],
+                                                   min_run[col], tolerance[col])
+    run_ids = np.cumsum(run_starts, axis=0) + np.arange(n_cols) * (n_rows + 1)
+    run_lengths = np.bincount(run_ids[valid], minlength=n_cols * (n_rows + 1))
+
+    return valid & (run_lengths[run_ids] >= min_run)
+
+
+def flat_line_mask(values, min_run=FLAT_LINE_MIN_RUN, tolerance=FLAT_LINE_TOLERANCE):
+    """Flag samples belonging to a run of min_run+ consecutive identical values
+
+    Consecutive values belong to one run while the run's max - min stays
+    within tolerance (0.0 means exact equality), so a slow drift is not
+    flat. Adjacent NaNs count as identical, matching pandas' unique()
+    behaviour in the original window test.
+
+    Returns a boolean array the same length as values.
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    if n < min_run or min_run < 1:
+        return np.zeros(n, dtype=bool)
+
+    column = values.reshape(-1, 1)
+    valid = np.ones(column.shape, dtype=bool)
+    return _flat_line_matrix(column, valid, _previous_valid_index(valid), min_run, tolerance)[:, 0]
+
+
+def run_qc_kernel(values, indicators, limits):
+    """Apply range, spike and flat line tests to all parameters at once
+
+    Args:
+        values: (n_records, n_params) float array of parameter values
+        indicators: (n_records, n_params) int array of incoming ind_* flags
+        limits: (n_params, len(LIMIT_FIELDS)) float array, NaN where a limit
+            is not configured for that parameter
+
+    Returns:
+        (indicators, reasons, masks) where indicators is the updated
+        indicator matrix, reasons the int8 failure reason code matrix and
+        masks a dict of boolean matrices ('missing', 'range', 'spike',
+        'flatline', 'passed') used for the per-parameter summaries.
+    """
+    values = np.asarray(values, dtype=float)
+    indicators = np.asarray(indicators)
+    limits = np.asarray(limits, dtype=float).reshape(-1, len(LIMIT_FIELDS))
+    n_rows = values.shape[0]
+
+    min_val, max_val, spike_threshold, flatline_count, flatline_tolerance = limits.T
+    flatline_count = np.where(np.isnan(flatline_count), FLAT_LINE_MIN_RUN, flatline_count)
+    flatline_tolerance = np.where(np.isnan(flatline_tolerance), FLAT_LINE_TOLERANCE, flatline_tolerance)
+
+    # 1. Missing data test (already flagged as 9)
+    missing = indicators == 9
+    valid = ~missing
+    valid_count = valid.sum(axis=0)
+
+    with np.errstate(invalid='ignore'):
+        # 2. Range test (only where both limits are configured)
+        has_range = ~np.isnan(min_val) & ~np.isnan(max_val)
+        range_fail = ((values < min_val) | (values > max_val)) & valid & has_range
+
+        # 3. Spike test: change from the previous valid value
+        previous = _previous_valid_index(valid)
+        previous_values = np.take_along_axis(values, np.where(previous >= 0, previous, 0), axis=0)
+        spike_enabled = ~np.isnan(spike_threshold) & (n_rows > 1) & (valid_count > 2)
+        spike_fail = (np.abs(values - previous_values) > spike_threshold) & (previous >= 0) & valid & spike_enabled
+
+    # 4. Flat line test
+    flat_enabled = (n_rows > flatline_count) & (valid_count > flatline_count)
+    flat_fail = _flat_line_matrix(values, valid, previous, flatline_count, flatline_tolerance) & flat_enabled
+
+    # Update indicators: failures -> 4, untouched valid values -> 1
+    failed = range_fail | spike_fail | flat_fail
+    qc_indicators = np.where(failed, 4, indicators)
+    passed = (qc_indicators == 0) & valid
+    qc_indicators = np.where(passed, 1, qc_indicators)
+
+    # Reason codes; spike takes precedence over range, range over flat line
+    reasons = np.full(values.shape, REASON_NONE, dtype=np.int8)
+    reasons[flat_fail] = REASON_FLATLINE
+    reasons[range_fail] = REASON_RANGE
+    reasons[spike_fail] = REASON_SPIKE
+    reasons[missing] = REASON_MISSING
+
+    masks = {
+        'missing': missing,
+        'range': range_fail,
+        'spike': spike_fail,
+        'flatline': flat_fail,
+        'passed': passed
+    }
+    return qc_indicators, reasons, masks
@@ -0,0 +1,300 @@
+"""
+QC Configuration Core
+=====================
+
+Lightweight part of the QC processor: QC limits from Buoy Data/qc_limits.csv
+and live logger lookups from imdbon_log_of_loggers.csv. It imports no
+plotting or PDF libraries, so the web server and limit utilities can look
+up limits without paying for the rendering stack.
+
+BuoyQCProcessor extends QCConfig with data loading, QC and reporting.
+"""
+
+import os
+import numpy as np
+import pandas as pd
+from logger_timeline import build_logger_timelines
+from logger_metadata import load_logger_info
+
+
+class QCConfig:
+    def __init__(self, input_dir="../Buoy Data"):
+        self.input_dir = input_dir
+        
+        # Load QC limits from CSV file
+        self.default_qc_limits = {}
+        self.station_qc_limits = {}
+        self.load_qc_limits_from_csv()
+        
+        # Load logger information to determine which logger was live
+        self.logger_info = {}
+        self.logger_timelines = {}
+        self.load_logger_information()
+        
+        # Key parameters for visualization
+        self.key_parameters = [
+            'airpressure', 'airtemp', 'humidity', 'windsp', 'windgust', 'winddir', 
+            'hm0', 'hmax', 'tp', 'mdir', 'seatemp_aa'
+        ]
+    
+    def load_qc_limits_from_csv(self):
+        """Load QC limits from CSV file in Buoy Data folder"""
+        qc_limits_file = os.path.join(self.input_dir, "qc_limits.csv")
+        
+        try:
+            if not os.path.exists(qc_limits_file):
+                print(f"Warning: QC limits file not found at {qc_limits_file}")
+                print("Using fallback hardcoded limits...")
+                self._load_fallback_limits()
+                return
+            
+            print(f"Loading QC limits from {qc_limits_file}...")
+            df = pd.read_csv(qc_limits_file)
+            
+            # Initialize dictionaries
+            self.default_qc_limits = {}
+            self.station_qc_limits = {}
+            
+            # Process each row
+            for _, row in df.iterrows():
+                param = row['parameter']
+                station = row['station']
+                min_val = float(row['min_value']) if pd.notna(row['min_value']) else None
+                max_val = float(row['max_value']) if pd.notna(row['max_value']) else None
+                spike_threshold = float(row['spike_threshold']) if pd.notna(row['spike_threshold']) else None
+                
+                # Flat-line settings are optional columns
+                flatline_count = row.get('flatline_count')
+                flatline_count = int(flatline_count) if pd.notna(flatline_count) else None
+                flatline_tolerance = row.get('flatline_tolerance')
+                flatline_tolerance = float(flatline_tolerance) if pd.notna(flatline_tolerance) else None
+                
+                # Build limits dictionary for this parameter
+                limits = {}
+                if min_val is not None:
+                    limits['min'] = min_val
+                if max_val is not None:
+                    limits['max'] = max_val
+                if spike_threshold is not None:
+                    limits['spike_threshold'] = spike_threshold
+                if flatline_count is not None:
+                    limits['flatline_count'] = flatline_count
+                if flatline_tolerance is not None:
+                    limits['flatline_tolerance'] = flatline_tolerance
+                
+                # Store in appropriate dictionary
+                if station == 'default':
+                    self.default_qc_limits[param] = limits
+                else:
+                    if station not in self.station_qc_limits:
+                        self.station_qc_limits[station] = {}
+                    self.station_qc_limits[station][param] = limits
+            
+            print(f"Loaded QC limits: {len(self.default_qc_limits)} default parameters, "
+                  f"{len(self.station_qc_limits)} stations with custom limits")
+            
+        except Exception as e:
+            print(f"Error loading QC limits from CSV: {e}")
+            print("Using fallback hardcoded limits...")
+            self._load_fallback_limits()
+    
+    def _load_fallback_limits(self):
+        """Load fallback hardcoded QC limits if CSV loading fails"""
+        print("Loading fallback hardcoded QC limits...")
+        
+        # Default limits applied to all stations unless overridden
+        self.default_qc_limits = {
+            'airpressure': {'min': 950.0, 'max': 1050.0, 'spike_threshold': 10.0},
+            'airtemp': {'min': -20.0, 'max': 40.0, 'spike_threshold': 5.0},
+            'humidity': {'min': 0.0, 'max': 100.0, 'spike_threshold': 20.0},
+            'seatemp_16': {'min': -2.0, 'max': 30.0, 'spike_threshold': 3.0},
+            'seatemp_aa': {'min': -2.0, 'max': 30.0, 'spike_threshold': 3.0},
+            'windsp': {'min': 0.0, 'max': 50.0, 'spike_threshold': 15.0},
+            'windgust': {'min': 0.0, 'max': 60.0, 'spike_threshold': 20.0},
+            'winddir': {'min': 0.0, 'max': 360.0, 'spike_threshold': 180.0},
+            'hm0': {'min': 0.0, 'max': 15.0, 'spike_threshold': 3.0},
+            'hmax': {'min': 0.0, 'max': 25.0, 'spike_threshold': 5.0},
+            'tp': {'min': 1.0, 'max': 25.0, 'spike_threshold': 10.0},
+            'mdir': {'min': 0.0, 'max': 360.0, 'spike_threshold': 180.0},
+            'salinity_16': {'min': 20.0, 'max': 40.0, 'spike_threshold': 5.0}
+        }
+        
+        # Station-specific QC limits (overrides defaults where specified)
+        self.station_qc_limits = {
+            '62091': {  # More exposed Atlantic location
+                'hm0': {'min': 0.0, 'max': 18.0, 'spike_threshold': 4.0},
+                'hmax': {'min': 0.0, 'max': 30.0, 'spike_threshold': 6.0},
+                'windsp': {'min': 0.0, 'max': 60.0, 'spike_threshold': 20.0},
+                'windgust': {'min': 0.0, 'max': 80.0, 'spike_threshold': 25.0},
+                'seatemp_aa': {'min': 4.0, 'max': 18.0, 'spike_threshold': 2.0}
+            },
+            '62092': {  # Coastal/sheltered location
+                'hm0': {'min': 0.0, 'max': 12.0, 'spike_threshold': 2.5},
+                'hmax': {'min': 0.0, 'max': 20.0, 'spike_threshold': 4.0},
+                'seatemp_aa': {'min': 6.0, 'max': 20.0, 'spike_threshold': 2.5},
+                'salinity_16': {'min': 25.0, 'max': 35.0, 'spike_threshold': 3.0}
+            },
+            '62093': {  # Intermediate exposure
+                'hm0': {'min': 0.0, 'max': 15.0, 'spike_threshold': 3.5},
+                'hmax': {'min': 0.0, 'max': 25.0, 'spike_threshold': 5.0},
+                'seatemp_aa': {'min': 5.0, 'max': 19.0, 'spike_threshold': 2.5}
+            },
+            '62094': {  # Similar to 62093 but slightly different conditions
+                'hm0': {'min': 0.0, 'max': 16.0, 'spike_threshold': 3.5},
+                'hmax': {'min': 0.0, 'max': 26.0, 'spike_threshold': 5.5},
+                'windsp': {'min': 0.0, 'max': 55.0, 'spike_threshold': 18.0},
+                'seatemp_aa': {'min': 4.5, 'max': 18.5, 'spike_threshold': 2.5}
+            },
+            '62095': {  # Unique location with specific characteristics
+                'airtemp': {'min': -15.0, 'max': 35.0, 'spike_threshold': 4.0},
+                'hm0': {'min': 0.0, 'max': 14.0, 'spike_threshold': 3.0},
+                'hmax': {'min': 0.0, 'max': 22.0, 'spike_threshold': 4.5},
+                'seatemp_aa': {'min': 6.0, 'max': 19.0, 'spike_threshold': 2.0}
+            }
+        }
+        
+        print("Fallback limits loaded successfully")
+    
+    def load_logger_information(self):
+        """Load logger information from imdbon_log_of_loggers.csv to determine live loggers"""
+        logger_file = os.path.join(self.input_dir, "imdbon_log_of_loggers.csv")
+        
+        try:
+            if not os.path.exists(logger_file):
+                print(f"Warning: Logger information file not found at {logger_file}")
+                print("Will process all data without logger filtering...")
+                return
+            
+            print(f"Loading logger information from {logger_file}...")
+            
+            # Compiled once and cached alongside the log (see logger_metadata)
+            self.logger_info = load_logger_info(logger_file)
+            
+            # Interval index per station for live logger lookups
+            self.logger_timelines = build_logger_timelines(self.logger_info)
+            
+            print(f"Loaded logger information for {len(self.logger_info)} stations")
+            
+        except Exception as e:
+            print(f"Error loading logger information: {e}")
+            print("Will process all data without logger filtering...")
+    
+    def get_live_logger_for_time(self, station, target_time):
+        """Get the logger that was live for a specific station and time"""
+        if station not in self.logger_timelines:
+            return None
+        
+        return self.logger_timelines[station].live_logger_at(target_time)
+    
+    def get_live_logger_ids_for_times(self, station, times):
+        """Get the live logger ID for each timestamp (None where no logger was live)"""
+        if station not in self.logger_timelines:
+            return np.full(len(times), None, dtype=object)
+        
+        return self.logger_timelines[station].live_logger_ids_at(times)
+    
+    def get_live_loggers_for_period(self, station, start_time, end_time):
+        """Get ALL live loggers that overlap with a time period"""
+        if station not in self.logger_timelines:
+            return []
+        
+        return self.logger_timelines[station].overlapping(start_time, end_time, live_only=True)
+    
+    def get_live_logger_for_period(self, station, start_time, end_time):
+        """Get the logger that was live for the majority of a time period"""
+        if station not in self.logger_timelines:
+            return None
+        
+        best_logger, _ = self.logger_timelines[station].majority_live_logger(start_time, end_time, min_coverage=0.5)
+        return best_logger
+    
+    def save_qc_limits_to_csv(self, output_file=None):
+        """Save current QC limits back to CSV file"""
+        if output_file is None:
+            output_file = os.path.join(self.input_dir, "qc_limits.csv")
+        
+        try:
+            # Prepare data for CSV
+            csv_data = []
+            
+            # Add default limits
+            for param, limits in self.default_qc_limits.items():
+                row = {
+                    'parameter': param,
+                    'station': 'default',
+                    'min_value': limits.get('min', ''),
+                    'max_value': limits.get('max', ''),
+                    'spike_threshold': limits.get('spike_threshold', ''),
+                    'flatline_count': limits.get('flatline_count', ''),
+                    'flatline_tolerance': limits.get('flatline_tolerance', ''),
+                    'notes': f'Default limits for {param}'
+                }
+                csv_data.append(row)
+            
+            # Add station-specific limits
+            for station, station_limits in self.station_qc_limits.items():
+                for param, limits in station_limits.items():
+                    row = {
+                        'parameter': param,
+                        'station': station,
+                        'min_value': limits.get('min', ''),
+                        'max_value': limits.get('max', ''),
+                        'spike_threshold': limits.get('spike_threshold', ''),
+                        'flatline_count': limits.get('flatline_count', ''),
+                        'flatline_tolerance': limits.get('flatline_tolerance', ''),
+                        'notes': f'Station {station} specific limits for {param}'
+                    }
+                    csv_data.append(row)
+            
+            # Create DataFrame and save
+            df = pd.DataFrame(csv_data)
+            df.to_csv(output_file, index=False)
+            print(f"QC limits saved to {output_file}")
+            return True
+            
+        except Exception as e:
+            print(f"Error saving QC limits to CSV: {e}")
+            return False
+    
+    def display_qc_limits(self):
+        """Display current QC limits for verification"""
+        print("\n=== CURRENT QC LIMITS ===")
+        print("\nDefault Limits:")
+        for param, limits in self.default_qc_limits.items():
+            min_val = limits.get('min', 'N/A')
+            max_val = limits.get('max', 'N/A')
+            spike_val = limits.get('spike_threshold', 'N/A')
+            print(f"  {param}: min={min_val}, max={max_val}, spike_threshold={spike_val}")
+        
+        print("\nStation-Specific Limits:")
+        for station, station_limits in self.station_qc_limits.items():
+            print(f"  Station {station}:")
+            for param, limits in station_limits.items():
+                min_val = limits.get('min', 'N/A')
+                max_val = limits.get('max', 'N/A')
+                spike_val = limits.get('spike_threshold', 'N/A')
+                print(f"    {param}: min={min_val}, max={max_val}, spike_threshold={spike_val}")
+        print("=" * 30)
+        
+        # Display logger information if available
+        if self.logger_info:
+            print(f"\nLogger Information:")
+            for station, loggers in self.logger_info.items():
+                live_loggers = [lg for lg in loggers if lg['is_live']]
+                if live_loggers:
+                    print(f"  Station {station}: {len(live_loggers)} live loggers")
+                    for logger in live_loggers:
+                        end_str = logger['end_time'].strftime('%Y-%m-%d') if logger['end_time'] else 'Present'
+                        print(f"    {logger['logger_id']}: {logger['start_time'].strftime('%Y-%m-%d')} to {end_str}")
+    
+    def get_station_qc_limits(self, station, param):
+        """Get QC limits for a specific station and parameter"""
+        # Start with default limits
+        limits = self.default_qc_limits.get(param, {}).copy()
+        
+        # Override with station-specific limits if available
+        if station in self.station_qc_limits:
+            station_limits = self.station_qc_limits[station].get(param, {})
+            limits.update(station_limits)
+        
+        return limits
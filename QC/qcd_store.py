@@ -0,0 +1,135 @@
+"""
+QC'd Dataset Storage
+====================
+
+Reads and writes the buoy_{station}_{year}_qcd datasets. Each dataset is
+written as CSV (kept as the export format) and, when pyarrow is installed,
+as a typed Parquet copy alongside it that loaders prefer:
+- time as datetime64
+- qc_ind, ind_* and reason_* as int8
+- measured values as float32
+- loggerid and source_file as categoricals
+
+Usage (build Parquet copies for existing CSVs):
+  python qcd_store.py [qc_data_dir]
+"""
+
+import os
+import sys
+import pandas as pd
+
+# Optional columnar backend
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+CATEGORICAL_COLUMNS = ['loggerid', 'source_file']
+
+# Records per Parquet row group; bounds the memory of chunked reads
+PARQUET_ROW_GROUP_ROWS = 100_000
+
+
+def columnar_path(csv_path):
+    """Path of the Parquet copy stored alongside a _qcd.csv file"""
+    return os.path.splitext(str(csv_path))[0] + '.parquet'
+
+
+def is_flag_column(col):
+    """True for record/parameter QC indicator and failure reason columns"""
+    return col == 'qc_ind' or col.startswith('ind_') or col.startswith('reason_')
+
+
+def to_columnar_types(df):
+    """Return df with the compact dtypes used by the columnar store"""
+    df = df.copy(deep=False)
+    for col in df.columns:
+        series = df[col]
+        if col == 'time':
+            df[col] = pd.to_datetime(series, errors='coerce')
+        elif is_flag_column(col) and pd.api.types.is_numeric_dtype(series):
+            df[col] = series.astype('int8' if series.notna().all() else 'Int8')
+        elif col in CATEGORICAL_COLUMNS:
+            df[col] = series.astype('category')
+        elif pd.api.types.is_float_dtype(series):
+            df[col] = series.astype('float32')
+    return df
+
+
+def write_qcd(df, csv_path):
+    """Write a QC'd dataset as CSV plus its typed Parquet copy"""
+    df.to_csv(csv_path, index=False)
+    if PARQUET_AVAILABLE:
+        to_columnar_types(df).to_parquet(columnar_path(csv_path), index=False,
+                                         row_group_size=PARQUET_ROW_GROUP_ROWS)
+    return csv_path
+
+
+def has_current_columnar_copy(csv_path):
+    """True if a Parquet copy exists and is at least as new as the CSV"""
+    parquet_path = columnar_path(csv_path)
+    if not PARQUET_AVAILABLE or not os.path.exists(parquet_path):
+        return False
+    if not os.path.exists(csv_path):
+        return True
+    return os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path)
+
+
+def read_qcd(csv_path, columns=None):
+    """Load a QC'd dataset, preferring its typed Parquet copy
+
+    Falls back to parsing the CSV (e.g. when pyarrow is missing or the CSV
+    was edited after the copy was written); both paths return the same dtypes.
+    """
+    if has_current_columnar_copy(csv_path):
+        return pd.read_parquet(columnar_path(csv_path), columns=columns)
+
+    df = pd.read_csv(csv_path, usecols=columns)
+    return to_columnar_types(df)
+
+
+def read_qcd_chunks(csv_path, chunk_rows, columns=None):
+    """Iterate over a QC'd dataset in chunks of at most chunk_rows records
+
+    Same source preference and dtypes as read_qcd(), for consumers that
+    stream a dataset without holding it in memory. Parquet copies are
+    written in row groups of PARQUET_ROW_GROUP_ROWS, which bounds the
+    memory of each read.
+    """
+    if has_current_columnar_copy(csv_path):
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(columnar_path(csv_path))
+        for batch in parquet_file.iter_batches(batch_size=chunk_rows, columns=columns):
+            yield batch.to_pandas()
+        return
+
+    for chunk in pd.read_csv(csv_path, usecols=columns, chunksize=chunk_rows):
+        yield to_columnar_types(chunk)
+
+
+def build_columnar_copies(qc_data_dir):
+    """Create or refresh Parquet copies for every _qcd.csv in a directory"""
+    if not PARQUET_AVAILABLE:
+        print("pyarrow is not installed; cannot write Parquet copies")
+        return 0
+
+    written = 0
+    for file_name in sorted(os.listdir(qc_data_dir)):
+        if not file_name.endswith('_qcd.csv'):
+            continue
+        csv_path = os.path.join(qc_data_dir, file_name)
+        if has_current_columnar_copy(csv_path):
+            continue
+        df = to_columnar_types(pd.read_csv(csv_path))
+        df.to_parquet(columnar_path(csv_path), index=False, row_group_size=PARQUET_ROW_GROUP_ROWS)
+        print(f"  Wrote {os.path.basename(columnar_path(csv_path))}")
+        written += 1
+
+    print(f"{written} Parquet copies written")
+    return written
+
+
+if __name__ == "__main__":
+    build_columnar_copies(sys.argv[1] if len(sys.argv) > 1 else "../QC/Data")
@@ -0,0 +1,341 @@
+"""
+Time-Indexed QC'd Data
+======================
+
+Store of QC'd station-year datasets for time-window queries, used by the
+storm analyzer to cut storm windows.
+
+Each dataset is held sorted by time together with its times as an int64
+array. A window [start, end] is two binary searches and a positional
+slice of the stored frame (no boolean masks over the full year, no copy).
+Datasets are grouped per station across years with their time ranges,
+so station-years whose range misses a window are skipped before any of
+their rows are looked at.
+
+Datasets can also be added as files to be read lazily. Each file then has
+a time index of its record blocks: min/max time of every INDEX_BLOCK_ROWS
+records plus the byte offset where the block starts in the CSV, cached
+next to the CSV and rebuilt when the file changes. A Parquet copy's own
+row-group statistics are used instead when it is current. A window read
+only parses the blocks it overlaps, and files outside it are not opened.
+
+The store is a read-only mapping of station-year key ("62091_2024") to
+the full frame (lazy files are read in full on first access), in the
+order datasets were added.
+"""
+
+import io
+import os
+import pickle
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+
+from qcd_store import read_qcd, columnar_path, has_current_columnar_copy, to_columnar_types
+
+# Records per block of a CSV time index
+INDEX_BLOCK_ROWS = 256
+
+# Bump when the cached index layout changes
+INDEX_VERSION = 1
+
+# Block bounds of records without a time; such blocks never overlap a window
+_NO_TIME_MIN = np.iinfo(np.int64).max
+_NO_TIME_MAX = np.iinfo(np.int64).min
+
+
+def _ns(value):
+    return pd.Timestamp(value).as_unit('ns').value
+
+
+def _overlaps(first, last, start, end):
+    """True if records spanning [first, last] can fall in [start, end]"""
+    return first is not None and first <= pd.Timestamp(end) and last >= pd.Timestamp(start)
+
+
+def index_cache_path(csv_path):
+    """Time index cache stored alongside a _qcd.csv file"""
+    directory, name = os.path.split(str(csv_path))
+    return os.path.join(directory, f".{os.path.splitext(name)[0]}.time.cache.pkl")
+
+
+class FileTimeIndex:
+    """Time range of each block of records in a QC'd dataset file"""
+
+    def __init__(self, source, first_rows, rows, block_min, block_max, offsets=None, columns=None):
+        self.source = source                # 'csv' or 'parquet'
+        self.first_rows = np.asarray(first_rows, dtype=np.int64)
+        self.rows = int(rows)
+        self.block_min = np.asarray(block_min, dtype=np.int64)
+        self.block_max = np.asarray(block_max, dtype=np.int64)
+        self.offsets = offsets              # CSV byte offset of each block, plus the file size
+        self.columns = columns              # CSV header
+
+        timed = self.block_min != _NO_TIME_MIN
+        self.start = pd.Timestamp(self.block_min[timed].min()) if timed.any() else None
+        self.end = pd.Timestamp(self.block_max[timed].max()) if timed.any() else None
+
+    @classmethod
+    def from_csv(cls, csv_path, time_column='time'):
+        """Index a CSV: one parse of the time column plus a scan for line starts"""
+        with open(csv_path, 'rb') as f:
+            data = f.read()
+        times = pd.to_datetime(pd.read_csv(io.BytesIO(data), usecols=[time_column])[time_column], errors='coerce')
+        header = pd.read_csv(io.BytesIO(data), nrows=0).columns.tolist()
+        rows = len(times)
+        first_rows = np.arange(0, rows, INDEX_BLOCK_ROWS, dtype=np.int64)
+
+        # Line starts give block offsets unless some record spans lines (quoted newlines, blank lines)
+        newlines = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == ord('\n'))
+        offsets = None
+        if rows > 0 and len(newlines) == rows + data.endswith(b'\n'):
+            line_starts = np.concatenate([[0], newlines + 1])[1:rows + 1]
+            offsets = np.append(line_starts[first_rows], len(data))
+
+        block_min, block_max = cls._block_bounds(times, first_rows)
+        return cls('csv', first_rows, rows, block_min, block_max, offsets, header)
+
+    @classmethod
+    def from_parquet(cls, parquet_path, time_column='time'):
+        """Index a Parquet copy from its row-group statistics (footer only)"""
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(parquet_path)
+        metadata = parquet_file.metadata
+        time_index = metadata.schema.to_arrow_schema().get_field_index(time_column)
+        first_rows, block_min, block_max, row = [], [], [], 0
+        for i in range(metadata.num_row_groups):
+            group = metadata.row_group(i)
+            stats = group.column(time_index).statistics
+            first_rows.append(row)
+            if stats is not None and stats.has_min_max:
+                block_min.append(_ns(stats.min))
+                block_max.append(_ns(stats.max))
+            else:
+                # No statistics (or no times): read the group's time column
+                times = parquet_file.read_row_group(i, columns=[time_column]).to_pandas()[time_column]
+                bounds = cls._block_bounds(times, np.array([0]))
+                block_min.append(bounds[0][0] if len(times) else _NO_TIME_MIN)
+                block_max.append(bounds[1][0] if len(times) else _NO_TIME_MAX)
+            row += group.num_rows
+        return cls('parquet', first_rows, row, block_min, block_max)
+
+    @staticmethod
+    def _block_bounds(times, first_rows):
+        """Per-block min/max of int64 times, ignoring missing ones"""
+        if len(times) == 0:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+        values = pd.DatetimeIndex(times).as_unit('ns').asi8
+        missing = pd.isna(times).to_numpy()
+        block_min = np.minimum.reduceat(np.where(missing, _NO_TIME_MIN, values), first_rows)
+        block_max = np.maximum.reduceat(np.where(missing, _NO_TIME_MAX, values), first_rows)
+        return block_min, block_max
+
+    def overlapping_blocks(self, start, end):
+        """Indices of blocks that may hold records with start <= time <= end"""
+        return np.flatnonzero((self.block_min <= _ns(end)) & (self.block_max >= _ns(start)))
+
+    def block_rows(self, block):
+        """(first row, row count) of a block"""
+        stop = self.first_rows[block + 1] if block + 1 < len(self.first_rows) else self.rows
+        return int(self.first_rows[block]), int(stop - self.first_rows[block])
+
+    def read_blocks(self, csv_path, blocks):
+        """Records of the given blocks in file order, indexed by file row number
+
+        Returns None when blocks cannot be read on their own (a CSV whose
+        records could not be located by line); read the whole file instead.
+        """
+        if self.source == 'parquet':
+            import pyarrow.parquet as pq
+
+            df = pq.ParquetFile(columnar_path(csv_path)).read_row_groups([int(b) for b in blocks]).to_pandas()
+        elif self.offsets is not None:
+            parts = []
+            with open(csv_path, 'rb') as f:
+                # Read each run of consecutive blocks in one go
+                for run in np.split(blocks, np.flatnonzero(np.diff(blocks) != 1) + 1):
+                    f.seek(self.offsets[run[0]])
+                    data = f.read(self.offsets[run[-1] + 1] - self.offsets[run[0]])
+                    parts.append(pd.read_csv(io.BytesIO(data), header=None, names=self.columns))
+            df = to_columnar_types(pd.concat(parts, ignore_index=True))
+        else:
+            return None
+
+        df.index = np.concatenate([np.arange(first, first + count)
+                                   for first, count in map(self.block_rows, blocks)]).astype(np.int64)
+        return df
+
+
+def _read_index_cache(cache_file):
+    try:
+        with open(cache_file, 'rb') as f:
+            cached = pickle.load(f)
+        return cached if cached.get('version') == INDEX_VERSION else None
+    except Exception:
+        return None
+
+
+def _write_index_cache(cache_file, cached):
+    # Cache is an optimisation only; a read-only data directory just skips it
+    try:
+        temp_file = cache_file + '.tmp'
+        with open(temp_file, 'wb') as f:
+            pickle.dump(cached, f)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        pass
+
+
+def load_file_time_index(csv_path, time_column='time', use_cache=True):
+    """Time index of a QC'd dataset: its current Parquet copy's, else the CSV's (cached)"""
+    if has_current_columnar_copy(csv_path):
+        return FileTimeIndex.from_parquet(columnar_path(csv_path), time_column)
+
+    stat = os.stat(csv_path)
+    cache_file = index_cache_path(csv_path)
+    cached = _read_index_cache(cache_file) if use_cache else None
+    if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size \
+            and cached['time_column'] == time_column:
+        return cached['index']
+
+    index = FileTimeIndex.from_csv(csv_path, time_column)
+    if use_cache:
+        _write_index_cache(cache_file, {'version': INDEX_VERSION, 'mtime_ns': stat.st_mtime_ns,
+                                        'size': stat.st_size, 'time_column': time_column, 'index': index})
+    return index
+
+
+class TimeIndexedFrame:
+    """A QC'd dataset sorted by time with binary-search window slicing"""
+
+    def __init__(self, df, time_column='time'):
+        times = pd.DatetimeIndex(df[time_column]).as_unit('ns')
+        valid = int(times.notna().sum())
+        if times[:valid].hasnans or not times[:valid].is_monotonic_increasing:
+            # Missing times sort last; those rows never fall in a window
+            df = df.sort_values(time_column, kind='stable', na_position='last')
+            times = pd.DatetimeIndex(df[time_column]).as_unit('ns')
+
+        self.df = df
+        self._times = times.asi8[:valid]
+        self.start = pd.Timestamp(self._times[0]) if len(self._times) else None
+        self.end = pd.Timestamp(self._times[-1]) if len(self._times) else None
+
+    def overlaps(self, start, end):
+        """True if any record time can fall in [start, end]"""
+        return _overlaps(self.start, self.end, start, end)
+
+    @property
+    def rows(self):
+        return len(self.df)
+
+    def window(self, start, end):
+        """Rows with start <= time <= end, as a positional slice of the stored frame"""
+        lo = np.searchsorted(self._times, pd.Timestamp(start).as_unit('ns').value, side='left')
+        hi = np.searchsorted(self._times, pd.Timestamp(end).as_unit('ns').value, side='right')
+        return self.df.iloc[lo:hi]
+
+
+class LazyTimeIndexedFile:
+    """A QC'd dataset file read on demand through its time index"""
+
+    def __init__(self, csv_path, time_column='time'):
+        self.path = str(csv_path)
+        self.time_column = time_column
+        self.index = load_file_time_index(self.path, time_column)
+        self.start, self.end = self.index.start, self.index.end
+        self._loaded = None
+
+    @property
+    def rows(self):
+        return self.index.rows
+
+    def _load(self):
+        if self._loaded is None:
+            self._loaded = TimeIndexedFrame(read_qcd(self.path), self.time_column)
+        return self._loaded
+
+    @property
+    def df(self):
+        """The whole dataset, read on first access"""
+        return self._load().df
+
+    def overlaps(self, start, end):
+        """True if any record time can fall in [start, end]"""
+        return _overlaps(self.start, self.end, start, end)
+
+    def window(self, start, end):
+        """Rows with start <= time <= end, reading only the blocks that can hold them"""
+        if self._loaded is None:
+            blocks = self.index.overlapping_blocks(start, end)
+            # A window falling between blocks still needs the columns; one block gives them
+            part = self.index.read_blocks(self.path, blocks if len(blocks) else np.array([0]))
+            if part is not None:
+                return TimeIndexedFrame(part, self.time_column).window(start, end)
+        return self._load().window(start, end)
+
+
+class QCDTimeStore(Mapping):
+    """Time-indexed QC'd datasets per station, spanning their years"""
+
+    def __init__(self, time_column='time'):
+        self.time_column = time_column
+        self._frames = {}      # key -> TimeIndexedFrame or LazyTimeIndexedFile, in insertion order
+        self._stations = {}    # station -> keys ordered by start time
+
+    def add(self, station, year, df):
+        """Store a station-year dataset; returns its key"""
+        return self._add(station, f"{station}_{year}", TimeIndexedFrame(df, self.time_column))
+
+    def add_file(self, station, year, csv_path):
+        """Index a station-year file to be read on demand; returns its key"""
+        return self._add(station, f"{station}_{year}", LazyTimeIndexedFile(csv_path, self.time_column))
+
+    def _add(self, station, key, frame):
+        self._frames[key] = frame
+
+        keys = [k for k in self._stations.get(station, []) if k != key] + [key]
+        keys.sort(key=lambda k: (self._frames[k].start is None, self._frames[k].start or pd.Timestamp.min))
+        self._stations[station] = keys
+        return key
+
+    def rows(self, key):
+        """Record count of a station-year, without reading a lazy file"""
+        return self._frames[key].rows
+
+    def __getitem__(self, key):
+        return self._frames[key].df
+
+    def __iter__(self):
+        return iter(self._frames)
+
+    def __len__(self):
+        return len(self._frames)
+
+    @property
+    def stations(self):
+        return list(self._stations)
+
+    def time_range(self, key):
+        """(first, last) record time of a station-year, or (None, None) if it has none"""
+        frame = self._frames[key]
+        return frame.start, frame.end
+
+    def station_window(self, station, start, end):
+        """[(key, rows)] for a station's years overlapping [start, end], in time order"""
+        return [(key, self._frames[key].window(start, end))
+                for key in self._stations.get(station, [])
+                if self._frames[key].overlaps(start, end)]
+
+    def window(self, start, end):
+        """[(key, rows)] for every station-year overlapping [start, end], in insertion order
+
+        rows are positional slices of the stored frames (or of the blocks read
+        from a lazy file); station-years whose time range misses the window
+        are skipped without touching their rows.
+        """
+        return [(key, frame.window(start, end))
+                for key, frame in self._frames.items()
+                if frame.overlaps(start, end)]
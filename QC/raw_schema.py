@@ -0,0 +1,98 @@
+"""
+Raw Buoy File Schema
+====================
+
+Schema registry for the raw {year}_{station}_zzqc_fugrobuoy.csv layout.
+Instead of letting pandas infer every column as float64/int64/object, the
+registry declares a dtype for each column from its name:
+- time: parsed with an explicit format
+- loggerid: string
+- rowid, stno: int32; qc_ind and ind_*: int8
+- QC parameter values: float64, so test thresholds behave exactly as before
+- everything else (_1/_2 sensor duplicates, unchecked parameters): float32
+
+read_raw_file can also project to a subset of columns (e.g. qc_columns())
+when only the QC inputs are needed.
+"""
+
+import csv
+import re
+import pandas as pd
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Identifier columns present in every zzqc_fugrobuoy file
+ID_COLUMNS = ['rowid', 'qc_ind', 'stno', 'loggerid', 'time']
+
+# (pattern, dtype) rules, first match wins; QC parameters are handled first
+ZZQC_FUGROBUOY_RULES = [
+    (re.compile(r'^loggerid$'), 'str'),
+    (re.compile(r'^time$'), 'str'),
+    (re.compile(r'^(rowid|stno)$'), 'int32'),
+    (re.compile(r'^(qc_ind|ind_.+)$'), 'int8'),
+]
+DEFAULT_VALUE_DTYPE = 'float32'
+QC_VALUE_DTYPE = 'float64'
+
+
+def column_dtypes(columns, qc_parameters=()):
+    """Declared dtype for each column of a raw file header"""
+    qc_parameters = set(qc_parameters)
+    dtypes = {}
+    for col in columns:
+        if col in qc_parameters:
+            dtypes[col] = QC_VALUE_DTYPE
+            continue
+        for pattern, dtype in ZZQC_FUGROBUOY_RULES:
+            if pattern.match(col):
+                dtypes[col] = dtype
+                break
+        else:
+            dtypes[col] = DEFAULT_VALUE_DTYPE
+    return dtypes
+
+
+def qc_columns(qc_parameters):
+    """Columns the QC tests need: identifiers plus each value and its indicator"""
+    columns = list(ID_COLUMNS)
+    for param in qc_parameters:
+        columns.extend([f'ind_{param}', param])
+    return columns
+
+
+def parse_time(series):
+    """Parse the time column with the registry format, inferring if it differs"""
+    try:
+        return pd.to_datetime(series, format=TIME_FORMAT)
+    except (ValueError, TypeError):
+        return pd.to_datetime(series, errors='coerce')
+
+
+def read_raw_file(file_path, qc_parameters=(), columns=None):
+    """Read one zzqc_fugrobuoy file with declared dtypes
+
+    Args:
+        file_path: raw CSV path
+        qc_parameters: parameters tested by QC (kept as float64)
+        columns: optional list of columns to load; others are skipped at parse
+            time (names missing from the file are ignored)
+
+    Integer columns that turn out to contain blanks fall back to pandas'
+    own inference so a single odd file never fails to load.
+    """
+    with open(file_path, newline='') as f:
+        header = next(csv.reader(f), [])
+    if columns is not None:
+        wanted = set(columns)
+        header = [c for c in header if c in wanted]
+    dtypes = column_dtypes(header, qc_parameters)
+
+    try:
+        df = pd.read_csv(file_path, usecols=header, dtype=dtypes)
+    except ValueError:
+        dtypes = {c: d for c, d in dtypes.items() if not d.startswith('int')}
+        df = pd.read_csv(file_path, usecols=header, dtype=dtypes)
+
+    if 'time' in df.columns:
+        df['time'] = parse_time(df['time'])
+    return df
@@ -0,0 +1,284 @@
+"""
+Report Model
+============
+
+Structured report content shared by the yearly QC reports and the storm
+reports. A Report is built once from the QC results or storm statistics as
+a list of blocks (headings, paragraphs, bullet lists, tables, images), and
+the markdown and PDF writers each render it in a single pass. The PDF no
+longer depends on re-reading and re-parsing the markdown file, so either
+format can be written on its own or alongside the other.
+
+Text may use the same light inline markup as the markdown reports:
+**bold**, *italic* and <br> line breaks inside table cells.
+
+Blocks are dicts with a 'type' and an optional 'id' that PDF callers can
+use to substitute their own flowables (e.g. a custom styled table).
+
+The PDF side is built for batches of reports: the sample style sheet and
+table style are created once per process, and figures are embedded as
+thumbnails resampled to PDF_IMAGE_DPI at their printed size rather than
+as the full 300 dpi PNGs saved for the markdown reports. Streams are
+written binary rather than ASCII85-encoded.
+"""
+
+import io
+import os
+import re
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+# Resolution of figures embedded in PDFs at their printed size
+PDF_IMAGE_DPI = 150
+
+
+class Report:
+    """Ordered report content with builder methods for each block type"""
+
+    def __init__(self, title):
+        self.title = title
+        self.blocks = []
+
+    def _add(self, block_type, block_id=None, **content):
+        self.blocks.append(dict(type=block_type, id=block_id, **content))
+        return self
+
+    def heading(self, text, level=2, block_id=None):
+        return self._add('heading', block_id, text=text, level=level)
+
+    def paragraph(self, text, block_id=None):
+        return self._add('paragraph', block_id, text=text)
+
+    def bullets(self, items, block_id=None):
+        """Bullet list; an item is text or (text, [sub-item text, ...])"""
+        items = [item if isinstance(item, tuple) else (item, []) for item in items]
+        return self._add('bullets', block_id, items=items)
+
+    def numbered(self, items, block_id=None):
+        return self._add('numbered', block_id, items=list(items))
+
+    def table(self, header, rows, block_id=None):
+        return self._add('table', block_id, header=list(header), rows=[list(row) for row in rows])
+
+    def image(self, path, alt='', caption=None, block_id=None):
+        """Image by path; markdown links it relative to the report"""
+        return self._add('image', block_id, path=str(path), alt=alt, caption=caption)
+
+    def rule(self, block_id=None):
+        return self._add('rule', block_id)
+
+
+# ---------------------------------------------------------------------------
+# Markdown
+# ---------------------------------------------------------------------------
+
+def _markdown_cell(text):
+    return str(text).replace('|', '\\|').replace('\n', '<br>')
+
+
+def to_markdown(report, image_links=None):
+    """Render a Report as markdown text
+
+    image_links maps image paths to the link written in the markdown;
+    by default the file name, as images are saved alongside the report.
+    """
+    parts = [f"# {report.title}\n"]
+    for block in report.blocks:
+        kind = block['type']
+        if kind == 'heading':
+            parts.append(f"{'#' * block['level']} {block['text']}\n")
+        elif kind == 'paragraph':
+            parts.append(f"{block['text']}\n")
+        elif kind == 'bullets':
+            lines = []
+            for text, sub_items in block['items']:
+                lines.append(f"- {text}")
+                lines.extend(f"  - {sub}" for sub in sub_items)
+            parts.append('\n'.join(lines) + '\n')
+        elif kind == 'numbered':
+            parts.append('\n'.join(f"{i}. {text}" for i, text in enumerate(block['items'], 1)) + '\n')
+        elif kind == 'table':
+            lines = ['| ' + ' | '.join(_markdown_cell(c) for c in block['header']) + ' |',
+                     '|' + '|'.join('---' for _ in block['header']) + '|']
+            lines.extend('| ' + ' | '.join(_markdown_cell(c) for c in row) + ' |' for row in block['rows'])
+            parts.append('\n'.join(lines) + '\n')
+        elif kind == 'image':
+            link = (image_links or {}).get(block['path'], os.path.basename(block['path']))
+            parts.append(f"![{block['alt']}]({link})\n")
+            if block['caption']:
+                parts.append(f"*{block['caption']}*\n")
+        elif kind == 'rule':
+            parts.append("---\n")
+    return '\n'.join(parts)
+
+
+def write_markdown(report, path, image_links=None):
+    """Write the markdown rendering of a Report and return the path"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(to_markdown(report, image_links))
+    return path
+
+
+# ---------------------------------------------------------------------------
+# PDF (ReportLab)
+# ---------------------------------------------------------------------------
+
+def pdf_markup(text):
+    """Inline markdown (**bold**, *italic*, <br>, [links](url)) -> ReportLab markup"""
+    text = escape(str(text))
+    text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
+    text = re.sub(r'\*(.+?)\*', r'<i>\1</i>', text)
+    text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
+    return re.sub(r'&lt;br\s*/?&gt;', '<br/>', text)
+
+
+@lru_cache(maxsize=None)
+def _configure_reportlab():
+    """Write PDF streams as binary rather than ASCII85 text
+
+    ASCII85 is encoded in pure Python without ReportLab's C accelerator
+    and grows every image stream by a quarter; it is not needed for files
+    that are only ever read by PDF viewers.
+    """
+    from reportlab import rl_config
+
+    rl_config.useA85 = 0
+
+
+@lru_cache(maxsize=None)
+def sample_styles():
+    """ReportLab sample style sheet, shared by every report in the process
+
+    Styles derived from it should be cached by the caller too; treat the
+    returned sheet as read-only.
+    """
+    from reportlab.lib.styles import getSampleStyleSheet
+
+    return getSampleStyleSheet()
+
+
+@lru_cache(maxsize=None)
+def default_table_style():
+    """Grid table with a shaded header row, as used by the QC reports"""
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f8f9fa')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#2c3e50')),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')])
+    ])
+
+
+def pdf_image(path, max_size, dpi=PDF_IMAGE_DPI):
+    """Image flowable scaled to fit max_size (width, height) in points
+
+    The bitmap is resampled to dpi at the printed size when the source has
+    more pixels than that, so a 300 dpi figure is not embedded in full;
+    dpi=None embeds the original. Returns None when the image cannot be read.
+    """
+    from reportlab.platypus import Image
+    from reportlab.lib.utils import ImageReader
+
+    try:
+        width, height = ImageReader(path).getSize()
+    except Exception:
+        return None
+    scale = min(max_size[0] / width, max_size[1] / height)
+    width_pt, height_pt = width * scale, height * scale
+
+    source = path
+    pixels = (max(round(width_pt / 72 * dpi), 1), max(round(height_pt / 72 * dpi), 1)) if dpi else (width, height)
+    if pixels[0] < width:
+        try:
+            from PIL import Image as PILImage
+
+            with PILImage.open(path) as im:
+                if im.mode not in ('RGB', 'RGBA'):
+                    im = im.convert('RGBA')
+                thumb = im.resize(pixels, PILImage.LANCZOS, reducing_gap=3.0)
+            if thumb.mode == 'RGBA':
+                # Flatten onto white, as the figures are drawn on a white page
+                flat = PILImage.new('RGB', thumb.size, 'white')
+                flat.paste(thumb, mask=thumb.getchannel('A'))
+                thumb = flat
+            source = io.BytesIO()
+            thumb.save(source, format='PNG', compress_level=1)
+            source.seek(0)
+        except ImportError:
+            pass  # Pillow not installed; embed the original
+    return Image(source, width=width_pt, height=height_pt)
+
+
+def build_story(report, styles, max_image_size, renderers=None, table_style=None, bullet='•',
+                image_dpi=PDF_IMAGE_DPI):
+    """ReportLab flowables for a Report's blocks (the title is left to the caller)
+
+    styles maps 'heading2'..'heading4', 'body', 'bullet' and 'caption' to
+    ParagraphStyles; missing heading levels fall back to the nearest one.
+    renderers maps block ids to callables returning a list of flowables
+    (empty to omit the block). Images are scaled to fit max_image_size
+    (width, height) in points and embedded at image_dpi. table_style may be
+    a TableStyle or a list of commands.
+    """
+    from reportlab.platypus import Paragraph, Spacer, Table, TableStyle, HRFlowable
+
+    _configure_reportlab()
+    renderers = renderers or {}
+    if table_style is None:
+        table_style = default_table_style()
+    elif not isinstance(table_style, TableStyle):
+        table_style = TableStyle(table_style)
+    story = []
+
+    def cell(text):
+        markup = pdf_markup(text)
+        return Paragraph(markup, styles['body']) if markup != str(text) else str(text)
+
+    for block in report.blocks:
+        if block['id'] in renderers:
+            story.extend(renderers[block['id']](block))
+            continue
+
+        kind = block['type']
+        if kind == 'heading':
+            level = min(max(block['level'], 2), 4)
+            style = styles.get(f'heading{level}') or styles.get(f'heading{level - 1}') or styles['heading2']
+            story.append(Paragraph(pdf_markup(block['text']), style))
+        elif kind == 'paragraph':
+            story.append(Paragraph(pdf_markup(block['text']), styles['body']))
+        elif kind == 'bullets':
+            for text, sub_items in block['items']:
+                story.append(Paragraph(f"{bullet} {pdf_markup(text)}", styles['bullet']))
+                for sub in sub_items:
+                    story.append(Paragraph(f"&nbsp;&nbsp;&nbsp;&nbsp;- {pdf_markup(sub)}", styles['bullet']))
+            story.append(Spacer(1, 8))
+        elif kind == 'numbered':
+            for i, text in enumerate(block['items'], 1):
+                story.append(Paragraph(f"{i}. {pdf_markup(text)}", styles['bullet']))
+            story.append(Spacer(1, 8))
+        elif kind == 'table':
+            table = Table([[cell(c) for c in block['header']]] + [[cell(c) for c in row] for row in block['rows']],
+                          repeatRows=1)
+            table.setStyle(table_style)
+            story.append(table)
+            story.append(Spacer(1, 15))
+        elif kind == 'image':
+            image = pdf_image(block['path'], max_image_size, image_dpi)
+            if image is None:
+                continue  # image not rendered; keep the rest of the report
+            story.append(image)
+            story.append(Spacer(1, 10))
+            if block['caption']:
+                story.append(Paragraph(pdf_markup(block['caption']), styles.get('caption', styles['body'])))
+        elif kind == 'rule':
+            story.append(HRFlowable(width='100%', thickness=1, spaceBefore=6, spaceAfter=10))
+    return story
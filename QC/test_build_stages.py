@@ -0,0 +1,105 @@
+"""
+Test QC Build Stages
+====================
+Verify which station-years the QC and render stages rebuild on synthetic
+raw input
+"""
+
+import sys
+import os
+import io
+import tempfile
+import contextlib
+import numpy as np
+import pandas as pd
+
+# Add this directory to path to import the QC modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from buoy_qc_processor import BuoyQCProcessor
+
+STATIONS = ['62091', '62092']
+
+
+def make_raw_file(input_dir, station, year, n=200):
+    """Hourly zzqc_fugrobuoy file with every key parameter"""
+    rng = np.random.default_rng(int(station))
+    df = pd.DataFrame({
+        'rowid': np.arange(n),
+        'qc_ind': 0,
+        'stno': int(station),
+        'loggerid': '8704_CR6',
+        'time': pd.date_range(f'{year}-01-01', periods=n, freq='h').strftime('%Y-%m-%d %H:%M:%S')
+    })
+    for param in ['airpressure', 'airtemp', 'humidity', 'windsp', 'windgust', 'winddir',
+                  'hm0', 'hmax', 'tp', 'mdir', 'seatemp_aa']:
+        df[f'ind_{param}'] = 0
+        df[param] = rng.uniform(1, 20, n).round(2)
+    df.to_csv(os.path.join(input_dir, f'{year}_{station}_zzqc_fugrobuoy.csv'), index=False)
+
+
+def make_dirs(tmp):
+    input_dir = os.path.join(tmp, 'input')
+    output_dir = os.path.join(tmp, 'output')
+    os.makedirs(input_dir)
+    os.makedirs(output_dir)
+    for station in STATIONS:
+        make_raw_file(input_dir, station, 2024)
+    return input_dir, output_dir
+
+
+def run_processor(input_dir, output_dir, **options):
+    """Run the processor quietly, returning its console output"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        processor = BuoyQCProcessor(input_dir=input_dir, output_dir=output_dir)
+        processor.process_all_buoys_by_year(**options)
+    return output.getvalue()
+
+
+def test_deleted_outputs_are_rebuilt():
+    """Unchanged inputs are skipped only while their QC outputs still exist"""
+    print("Testing manifest skip check...")
+    with tempfile.TemporaryDirectory() as tmp:
+        input_dir, output_dir = make_dirs(tmp)
+        assert "2 of 2 station-years need processing" in run_processor(input_dir, output_dir, data_only=True)
+        assert "0 of 2 station-years need processing" in run_processor(input_dir, output_dir, data_only=True)
+
+        os.remove(os.path.join(output_dir, 'buoy_62091_2024_qc_results.json'))
+        os.remove(os.path.join(output_dir, 'buoy_62092_2024_qcd.csv'))
+        output = run_processor(input_dir, output_dir, data_only=True)
+        assert "2 of 2 station-years need processing" in output
+        for station in STATIONS:
+            assert os.path.exists(os.path.join(output_dir, f'buoy_{station}_2024_qc_results.json'))
+            assert os.path.exists(os.path.join(output_dir, f'buoy_{station}_2024_qcd.csv'))
+
+
+def test_data_only_then_default_run_renders_reports():
+    """Reports skipped by a data-only run, or later removed, are rendered next run"""
+    print("Testing render stage pickup...")
+    with tempfile.TemporaryDirectory() as tmp:
+        input_dir, output_dir = make_dirs(tmp)
+        run_processor(input_dir, output_dir, data_only=True)
+
+        output = run_processor(input_dir, output_dir)
+        assert "0 of 2 station-years need processing" in output
+        assert "Rendered 2 of 2 station-year reports" in output
+        processor = BuoyQCProcessor(input_dir=input_dir, output_dir=output_dir)
+        for station in STATIONS:
+            assert all(os.path.exists(path) for path in processor.get_report_files(station, '2024'))
+            assert not processor.report_needs_render(station, '2024')
+
+        # Nothing left to render once reports are current
+        assert "Rendered 0 of 0 station-year reports" in run_processor(input_dir, output_dir)
+
+        # A missing report (e.g. a failed render) is retried
+        os.remove(processor.get_report_files('62092', '2024')[1])
+        output = run_processor(input_dir, output_dir)
+        assert "Rendered 1 of 1 station-year reports" in output
+        assert "Rendering 62092 - 2024" in output and "Rendering 62091 - 2024" not in output
+
+
+if __name__ == "__main__":
+    test_deleted_outputs_are_rebuilt()
+    test_data_only_then_default_run_renders_reports()
+    print("\nTest completed!")
@@ -0,0 +1,65 @@
+"""
+Test Figure Cache
+=================
+Verify figure keys track the plotted data and settings, and that a PNG
+saved with its key is recognised as cached
+"""
+
+import sys
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+# Add this directory to path to import the QC modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from figure_cache import figure_key, is_cached, png_metadata
+
+
+def make_frame():
+    return pd.DataFrame({
+        'time': pd.date_range('2024-01-01', periods=500, freq='h'),
+        'hm0': np.linspace(0.5, 4.0, 500),
+        'ind_hm0': np.ones(500, dtype=int)
+    })
+
+
+def test_key_tracks_data_and_config():
+    """Same inputs give the same key; any plotted value or setting changes it"""
+    print("Testing figure keys...")
+    df = make_frame()
+    config = {'version': 1, 'title': 'Buoy 62091 - 2024', 'plot_max_points': 10000}
+    key = figure_key([df], config)
+    assert key == figure_key([make_frame()], dict(config))
+
+    flagged = make_frame()
+    flagged.loc[100, 'ind_hm0'] = 4
+    assert figure_key([flagged], config) != key
+    assert figure_key([df], dict(config, plot_max_points=5000)) != key
+    assert figure_key([df.rename(columns={'hm0': 'hmax'})], config) != key
+    assert figure_key([df, df.iloc[:0]], config) != key
+
+
+def test_png_key_round_trip():
+    """Only an existing PNG carrying the same key counts as cached"""
+    print("Testing cached PNG lookup...")
+    from PIL import Image
+    from PIL.PngImagePlugin import PngInfo
+
+    with tempfile.TemporaryDirectory() as tmp:
+        png = os.path.join(tmp, 'overview.png')
+        assert not is_cached(png, 'abc')
+
+        info = PngInfo()
+        for field, value in png_metadata('abc').items():
+            info.add_text(field, value)
+        Image.new('RGB', (20, 10), 'white').save(png, pnginfo=info)
+        assert is_cached(png, 'abc')
+        assert not is_cached(png, 'abd')
+
+
+if __name__ == "__main__":
+    test_key_tracks_data_and_config()
+    test_png_key_round_trip()
+    print("\nTest completed!")
@@ -10,10 +10,10 @@ import os
 import pandas as pd
 from datetime import datetime
 
-# Add parent directory to path to import the processor
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add this directory to path to import the processor
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from QC_Scripts.buoy_qc_processor import BuoyQCProcessor
+from buoy_qc_processor import BuoyQCProcessor
 
 def test_logger_filtering():
     """Test that logger filtering is working correctly"""
@@ -0,0 +1,92 @@
+"""
+Test Logger Metadata Loader
+===========================
+Verify the logger log is parsed once, cached and recompiled when edited
+"""
+
+import sys
+import os
+import tempfile
+import pandas as pd
+
+# Add this directory to path to import the QC modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import logger_metadata
+from logger_metadata import load_logger_info, cache_path
+
+LOGGER_CSV = """Buoy,Loggerid,Start,End,Live,Live_wave,No_pressure_records,No_hmax_records,Comment
+62091,8704_CR6       ,07/03/2022 08:00,23/02/2024 19:00,0,6,16255,16255,
+62091,347_Wavesense  ,11/02/2022 11:00,23/02/2024 19:00,1,9,17797,17797,
+62091,12145_CR6      ,24/02/2025 10:00,,1,6,4325,4325,Seabird & DW
+62092,427_Wavesense  ,17/01/2024 00:00,,1,0,14024,14024,No MD File Received
+62092,bad_CR6        ,not a date,,0,0,0,0,
+"""
+
+
+def write_log(path, text):
+    with open(path, 'w') as f:
+        f.write(text)
+
+
+def test_parsed_entries():
+    """Entries are typed, stripped and sorted by start time"""
+    print("Testing logger log parsing...")
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = os.path.join(tmp, 'imdbon_log_of_loggers.csv')
+        write_log(log_file, LOGGER_CSV)
+
+        logger_info = load_logger_info(log_file)
+        assert list(logger_info) == ['62091', '62092']
+        assert [e['logger_id'] for e in logger_info['62091']] == ['347_Wavesense', '8704_CR6', '12145_CR6']
+
+        first = logger_info['62091'][0]
+        assert first['start_time'] == pd.Timestamp('2022-02-11 11:00')
+        assert first['is_live'] is True and first['live_wave'] is True
+        assert logger_info['62091'][2]['end_time'] is None
+        assert logger_info['62091'][2]['comment'] == 'Seabird & DW'
+
+        # Rows without a valid start time are dropped
+        assert [e['logger_id'] for e in logger_info['62092']] == ['427_Wavesense']
+
+
+def test_cache_reused_and_invalidated():
+    """Unchanged log loads from the cache; an edited log is recompiled"""
+    print("Testing logger log cache...")
+    compiled = []
+    original_compile = logger_metadata.compile_logger_log
+
+    def counting_compile(path):
+        compiled.append(path)
+        return original_compile(path)
+
+    logger_metadata.compile_logger_log = counting_compile
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            log_file = os.path.join(tmp, 'imdbon_log_of_loggers.csv')
+            write_log(log_file, LOGGER_CSV)
+
+            first = load_logger_info(log_file)
+            second = load_logger_info(log_file)
+            assert len(compiled) == 1
+            assert first == second
+            assert os.path.exists(cache_path(log_file))
+
+            # Touching without changing content keeps the cache
+            os.utime(log_file, ns=(0, 0))
+            load_logger_info(log_file)
+            assert len(compiled) == 1
+
+            # Editing the log recompiles it
+            write_log(log_file, LOGGER_CSV.replace('17/01/2024 00:00', '18/01/2024 00:00'))
+            edited = load_logger_info(log_file)
+            assert len(compiled) == 2
+            assert edited['62092'][0]['start_time'] == pd.Timestamp('2024-01-18')
+    finally:
+        logger_metadata.compile_logger_log = original_compile
+
+
+if __name__ == "__main__":
+    test_parsed_entries()
+    test_cache_reused_and_invalidated()
+    print("\nTest completed!")
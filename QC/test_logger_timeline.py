@@ -0,0 +1,128 @@
+"""
+Test Logger Timeline Index
+==========================
+Verify interval index lookups against the original linear scans
+"""
+
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Add this directory to path to import the QC modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from logger_timeline import LoggerTimeline, filter_to_live_logger
+
+
+def make_entries():
+    """Deployments with back-to-back, overlapping and open-ended loggers"""
+    rows = [
+        ('347_Wavesense', '2022-02-11 11:00', '2024-02-23 19:00', True),
+        ('8704_CR6', '2022-03-07 08:00', '2024-02-23 19:00', False),
+        ('7577_CR6', '2024-02-26 08:00', '2025-02-13 23:00', True),
+        ('9999_CR6', '2024-12-01 00:00', '2025-01-15 00:00', True),   # overlaps 7577
+        ('12145_CR6', '2025-02-24 10:00', None, True),
+    ]
+    return [{
+        'logger_id': logger_id,
+        'start_time': pd.Timestamp(start),
+        'end_time': pd.Timestamp(end) if end else None,
+        'is_live': is_live
+    } for logger_id, start, end, is_live in rows]
+
+
+def linear_live_logger_for_time(entries, target_time):
+    """Reference: first live entry whose deployment contains target_time"""
+    for entry in entries:
+        if target_time >= entry['start_time']:
+            if entry['end_time'] is None or target_time <= entry['end_time']:
+                if entry['is_live']:
+                    return entry
+    return None
+
+
+def linear_live_logger_for_period(entries, start_time, end_time):
+    """Reference: live entry covering the majority of the period"""
+    best_logger, best_coverage = None, 0
+    for entry in entries:
+        if not entry['is_live']:
+            continue
+        logger_end = entry['end_time'] if entry['end_time'] is not None else end_time
+        overlap_start = max(start_time, entry['start_time'])
+        overlap_end = min(end_time, logger_end)
+        if overlap_start < overlap_end:
+            coverage = (overlap_end - overlap_start).total_seconds() / (end_time - start_time).total_seconds()
+            if coverage > best_coverage:
+                best_coverage, best_logger = coverage, entry
+    return best_logger if best_coverage > 0.5 else None
+
+
+def test_point_lookups_match_linear_scan():
+    """Vectorized per-timestamp attribution matches the list scan"""
+    print("Testing point lookups...")
+    entries = make_entries()
+    timeline = LoggerTimeline(entries)
+
+    times = pd.date_range('2022-01-01', '2026-01-01', freq='7h')
+    # Include exact deployment boundaries
+    times = times.append(pd.DatetimeIndex([e['start_time'] for e in entries] +
+                                          [e['end_time'] for e in entries if e['end_time'] is not None]))
+
+    expected = [linear_live_logger_for_time(entries, t) for t in times]
+    expected_ids = [e['logger_id'] if e else None for e in expected]
+
+    assert list(timeline.live_logger_ids_at(times)) == expected_ids
+    assert timeline.live_logger_at(times[100]) is expected[100]
+    assert timeline.live_logger_ids_at([pd.NaT])[0] is None
+
+
+def test_period_lookups_match_linear_scan():
+    """Range and majority queries match the list scan"""
+    print("Testing period lookups...")
+    entries = make_entries()
+    timeline = LoggerTimeline(entries)
+    rng = np.random.default_rng(7)
+
+    for _ in range(500):
+        start = pd.Timestamp('2022-01-01') + pd.Timedelta(hours=int(rng.integers(0, 35000)))
+        end = start + pd.Timedelta(hours=int(rng.integers(1, 9000)))
+
+        majority, _ = timeline.majority_live_logger(start, end)
+        assert majority is linear_live_logger_for_period(entries, start, end)
+
+        expected = [e for e in entries
+                    if e['start_time'] <= end and (e['end_time'] is None or e['end_time'] >= start)]
+        assert timeline.overlapping(start, end, inclusive=True) == expected
+
+
+def test_filter_keeps_records_from_live_logger_only():
+    """Records are kept only while their own logger is live"""
+    print("Testing per-record live logger filter...")
+    timeline = LoggerTimeline(make_entries())
+
+    df = pd.DataFrame({
+        'time': pd.to_datetime([
+            '2024-02-23 19:00',   # last hour of 347_Wavesense
+            '2024-02-24 12:00',   # changeover gap: no live logger
+            '2024-02-26 08:00',   # first hour of 7577_CR6
+            '2024-03-01 00:00',   # backup logger 12105 while 7577 is live
+            '2024-12-10 00:00',   # 7577 and 9999 overlap: first listed wins
+            '2024-12-10 00:00',
+            '2025-03-01 00:00',   # open-ended deployment
+            None,
+        ]),
+        'loggerid': ['347_Wavesense  ', '347_Wavesense  ', '7577_CR6       ', '12105_CR6      ',
+                     '7577_CR6       ', '9999_CR6', '12145_CR6      ', '12145_CR6      ']
+    })
+    df['loggerid'] = df['loggerid'].astype('category')
+
+    kept = filter_to_live_logger(df, timeline)
+    assert kept.index.tolist() == [0, 2, 4, 6]
+
+
+if __name__ == "__main__":
+    test_point_lookups_match_linear_scan()
+    test_period_lookups_match_linear_scan()
+    test_filter_keeps_records_from_live_logger_only()
+    print("\nTest completed!")
@@ -0,0 +1,46 @@
+"""
+Test Parameter Metadata
+=======================
+Verify CF attributes are derived from the shared parameter mapping,
+including sensor duplicate columns
+"""
+
+import sys
+import os
+
+# Add this directory to path to import the QC modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from parameter_metadata import PARAMETER_METADATA, base_parameter, cf_attributes
+
+
+def test_base_parameter():
+    """Sensor duplicates map to their parameter; unknown columns to None"""
+    print("Testing base parameters...")
+    assert base_parameter('airtemp') == 'airtemp'
+    assert base_parameter('airtemp_2') == 'airtemp'
+    assert base_parameter('seatemp_aa_1') == 'seatemp_aa'
+    assert base_parameter('seatemp_16') == 'seatemp_16'
+    assert base_parameter('rowid') is None
+    assert base_parameter('hm0a') is None
+
+
+def test_cf_attributes():
+    """Display units become UDUNITS strings with a CF standard name"""
+    print("Testing CF attributes...")
+    assert cf_attributes('airtemp_1') == {'long_name': 'Air Temperature', 'units': 'degC',
+                                          'standard_name': 'air_temperature'}
+    assert cf_attributes('windsp')['units'] == 'knot'
+    assert cf_attributes('windgust')['units'] == 'm s-1'
+    assert cf_attributes('hm0')['units'] == 'm'
+    assert cf_attributes('stno') == {}
+
+    for param in PARAMETER_METADATA:
+        attrs = cf_attributes(param)
+        assert '°' not in attrs['units'] and 'standard_name' in attrs, param
+
+
+if __name__ == "__main__":
+    test_base_parameter()
+    test_cf_attributes()
+    print("\nTest completed!")
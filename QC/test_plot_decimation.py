@@ -0,0 +1,77 @@
+"""
+Test Plot Decimation
+====================
+Verify the min/max envelope keeps peaks while bounding the points drawn
+"""
+
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Add this directory to path to import the QC modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from plot_decimation import envelope_indices, decimate, envelope_bands
+
+
+def make_series(n=50000):
+    rng = np.random.default_rng(3)
+    return pd.DataFrame({
+        'time': pd.date_range('2024-01-01', periods=n, freq='10min'),
+        'hm0': np.abs(np.cumsum(rng.normal(0, 0.05, n))) + 1.0
+    })
+
+
+def test_envelope_bounded_and_keeps_extremes():
+    """Decimated series is bounded and keeps every bucket's min and max"""
+    print("Testing envelope decimation...")
+    df = make_series()
+    df.loc[12345, 'hm0'] = 25.0   # isolated peak
+    df.loc[33333, 'hm0'] = -5.0   # isolated trough
+
+    kept = decimate(df, 'time', 'hm0', max_points=2000)
+    assert len(kept) <= 2000
+    assert kept.index.is_monotonic_increasing
+    assert 12345 in kept.index and 33333 in kept.index
+    assert kept['hm0'].max() == df['hm0'].max() and kept['hm0'].min() == df['hm0'].min()
+    assert kept.index[0] == 0 and kept.index[-1] == len(df) - 1
+
+
+def test_small_or_disabled_is_unchanged():
+    """Series under the limit, or with no limit, are drawn in full"""
+    print("Testing small and disabled decimation...")
+    df = make_series(500)
+    assert decimate(df, 'time', 'hm0', max_points=2000) is df
+    assert len(decimate(make_series(), 'time', 'hm0', max_points=0)) == 50000
+
+
+def test_missing_values_dropped():
+    """Samples that cannot be drawn are not kept"""
+    print("Testing missing values...")
+    df = make_series(10000)
+    df.loc[::2, 'hm0'] = np.nan
+    kept = envelope_indices(df['time'], df['hm0'], 1000)
+    assert df['hm0'].iloc[kept].notna().all()
+    assert len(kept) <= 1000
+
+
+def test_envelope_bands_cover_cloud():
+    """Bands span each bucket's full range and stay within the point budget"""
+    print("Testing envelope bands...")
+    df = make_series()
+    df.loc[12345, 'hm0'] = 25.0
+
+    bands = envelope_bands(df, 'time', 'hm0', max_points=2000)
+    assert len(bands) * 2 <= 2000
+    assert bands['ymax'].max() == 25.0 and bands['ymin'].min() == df['hm0'].min()
+    assert (bands['ymin'] <= bands['ymax']).all()
+    assert envelope_bands(df.head(100), 'time', 'hm0', max_points=2000) is None
+
+
+if __name__ == "__main__":
+    test_envelope_bounded_and_keeps_extremes()
+    test_small_or_disabled_is_unchanged()
+    test_missing_values_dropped()
+    test_envelope_bands_cover_cloud()
+    print("\nTest completed!")
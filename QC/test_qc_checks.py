@@ -0,0 +1,134 @@
+"""
+Test Vectorized QC Checks
+=========================
+Verify the vectorized QC checks against the original per-row window logic
+"""
+
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Add this directory to path to import the QC modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from qc_checks import (
+    flat_line_mask, run_qc_kernel, LIMIT_FIELDS,
+    REASON_NONE, REASON_RANGE, REASON_SPIKE, REASON_FLATLINE, REASON_MISSING
+)
+
+
+def window_flat_line_mask(values, min_run=5):
+    """Reference implementation: the original sliding-window unique() test"""
+    valid_data = pd.Series(values)
+    mask = np.zeros(len(valid_data), dtype=bool)
+    for i in range(len(valid_data) - (min_run - 1)):
+        window = valid_data.iloc[i:i + min_run]
+        if len(window.unique()) == 1:
+            mask[i:i + min_run] = True
+    return mask
+
+
+def test_flat_line_matches_window_test():
+    """Run-length detector flags exactly the samples the window loop flags"""
+    print("Testing flat line detector against window loop...")
+    rng = np.random.default_rng(42)
+
+    # Quantised random walk gives plenty of short and long repeated runs
+    values = np.round(np.cumsum(rng.normal(0, 0.3, 2000)))
+    values[100:110] = np.nan  # NaN runs count as identical, as with unique()
+    values[500] = np.nan
+
+    expected = window_flat_line_mask(values)
+    result = flat_line_mask(values)
+
+    print(f"  Flagged {result.sum()} of {len(values)} values")
+    assert result.sum() > 0
+    assert np.array_equal(result, expected)
+
+
+def test_flat_line_run_length_and_tolerance():
+    """Minimum run length and tolerance are honoured"""
+    print("Testing flat line run length and tolerance...")
+    values = np.array([1.0, 1.0, 1.0, 1.0, 2.0, 3.0, 3.01, 3.02, 3.0, 3.01, 4.0])
+
+    # Four identical values are not a flat line at the default length
+    assert not flat_line_mask(values).any()
+    assert flat_line_mask(values, min_run=4)[:4].all()
+
+    # Small jitter is only treated as flat when within tolerance
+    assert not flat_line_mask(values, min_run=5).any()
+    tolerant = flat_line_mask(values, min_run=5, tolerance=0.025)
+    assert tolerant[5:10].all()
+    assert not tolerant[[4, 10]].any()
+
+    # Short input never flags
+    assert not flat_line_mask(values[:3]).any()
+
+
+def test_flat_line_tolerance_does_not_follow_drift():
+    """A slow ramp is not flat even when each step is within tolerance"""
+    print("Testing flat line tolerance on a ramp...")
+    ramp = 1000 + 0.05 * np.arange(20)
+    assert not flat_line_mask(ramp, min_run=5, tolerance=0.1).any()
+
+    # A stuck sensor after the ramp is still caught
+    values = np.concatenate([ramp, np.full(8, 1001.0)])
+    flagged = flat_line_mask(values, min_run=5, tolerance=0.1)
+    assert flagged[20:].all()
+    assert not flagged[:18].any()
+
+    # Same through the kernel with a per-parameter tolerance
+    limits = np.full((2, len(LIMIT_FIELDS)), np.nan)
+    limits[:, 3:] = [[5, 0.1], [5, 0.0]]
+    matrix = np.column_stack([values, values])
+    _, reasons, _ = run_qc_kernel(matrix, np.zeros(matrix.shape, dtype=int), limits)
+    assert np.array_equal(reasons[:, 0] == REASON_FLATLINE, flagged)
+    assert np.array_equal(reasons[:, 1] == REASON_FLATLINE, flat_line_mask(values))
+
+
+def test_qc_kernel_indicators_and_reasons():
+    """Kernel flags every test for every parameter in one call"""
+    print("Testing multi-parameter QC kernel...")
+    values = np.array([
+        [1000.0, 5.0, 10.0],
+        [1001.0, 5.0, 11.0],
+        [1030.0, 5.0, 60.0],   # pressure spike; wave height out of range
+        [1031.0, 5.0, 12.0],
+        [np.nan, 5.0, 13.0],   # pressure missing
+        [1200.0, 5.0, -5.0],   # pressure and wave height out of range
+        [1030.0, 6.0, 14.0],
+    ])
+    indicators = np.zeros(values.shape, dtype=int)
+    indicators[4, 0] = 9
+
+    limits = np.full((3, len(LIMIT_FIELDS)), np.nan)
+    limits[0, :3] = [950.0, 1050.0, 10.0]   # pressure: range + spike
+    limits[1, 3] = 5                        # temperature: flat line only
+    limits[2, :2] = [0.0, 50.0]             # wave height: range only
+
+    qc_indicators, reasons, masks = run_qc_kernel(values, indicators, limits)
+
+    # Spike is measured against the previous valid value, skipping missing
+    assert masks['spike'][:, 0].tolist() == [False, False, True, False, False, True, True]
+    assert masks['range'][:, 0].tolist() == [False, False, False, False, False, True, False]
+    assert reasons[:, 0].tolist() == [REASON_NONE, REASON_NONE, REASON_SPIKE, REASON_NONE,
+                                      REASON_MISSING, REASON_SPIKE, REASON_SPIKE]
+    assert qc_indicators[:, 0].tolist() == [1, 1, 4, 1, 9, 4, 4]
+
+    # Six identical temperatures form one flat line; the seventh differs
+    assert reasons[:, 1].tolist() == [REASON_FLATLINE] * 6 + [REASON_NONE]
+    assert qc_indicators[:, 1].tolist() == [4] * 6 + [1]
+
+    # Without a spike test, out-of-range values carry the range reason
+    assert reasons[:, 2].tolist() == [REASON_NONE, REASON_NONE, REASON_RANGE, REASON_NONE,
+                                      REASON_NONE, REASON_RANGE, REASON_NONE]
+    assert qc_indicators[:, 2].tolist() == [1, 1, 4, 1, 1, 4, 1]
+
+
+if __name__ == "__main__":
+    test_flat_line_matches_window_test()
+    test_flat_line_run_length_and_tolerance()
+    test_flat_line_tolerance_does_not_follow_drift()
+    test_qc_kernel_indicators_and_reasons()
+    print("\nTest completed!")
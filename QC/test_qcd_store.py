@@ -0,0 +1,83 @@
+"""
+Test QC'd Dataset Storage
+=========================
+Verify the typed Parquet copy round-trips and matches the CSV fallback
+"""
+
+import sys
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+# Add this directory to path to import the QC modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from qcd_store import write_qcd, read_qcd, read_qcd_chunks, columnar_path, PARQUET_AVAILABLE
+
+
+def make_qcd_frame():
+    """Small QC'd dataset with the column kinds written by the processor"""
+    return pd.DataFrame({
+        'time': pd.date_range('2024-01-01', periods=4, freq='h').strftime('%Y-%m-%d %H:%M:%S'),
+        'loggerid': ['8704_CR6', '8704_CR6', '8704_CR6', '347_Wavesense'],
+        'atmp': [1012.5, np.nan, 1013.25, 1014.0],
+        'ind_atmp': [1, 9, 4, 1],
+        'reason_atmp': [0, 9, 2, 0],
+        'qc_ind': [1, 0, 4, 1],
+    })
+
+
+def test_csv_fallback_types():
+    """CSV path returns the compact column types"""
+    print("Testing CSV fallback types...")
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'buoy_62091_2024_qcd.csv')
+        make_qcd_frame().to_csv(csv_path, index=False)
+
+        df = read_qcd(csv_path)
+        assert pd.api.types.is_datetime64_any_dtype(df['time'])
+        assert df['ind_atmp'].dtype == np.int8
+        assert df['qc_ind'].dtype == np.int8
+        assert df['atmp'].dtype == np.float32
+        assert isinstance(df['loggerid'].dtype, pd.CategoricalDtype)
+
+
+def test_parquet_copy_matches_csv():
+    """Parquet copy is written alongside the CSV and loads identically"""
+    if not PARQUET_AVAILABLE:
+        print("Skipping Parquet test (pyarrow not installed)")
+        return
+    print("Testing Parquet copy...")
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'buoy_62091_2024_qcd.csv')
+        write_qcd(make_qcd_frame(), csv_path)
+        assert os.path.exists(columnar_path(csv_path))
+
+        from_parquet = read_qcd(csv_path)
+        os.remove(columnar_path(csv_path))
+        from_csv = read_qcd(csv_path)
+        pd.testing.assert_frame_equal(from_parquet, from_csv, check_categorical=False)
+
+
+def test_chunked_read_matches_whole():
+    """Chunks are bounded and concatenate to the full dataset from either source"""
+    print("Testing chunked reads...")
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'buoy_62091_2024_qcd.csv')
+        write_qcd(make_qcd_frame(), csv_path)
+
+        for source in ['parquet', 'csv'] if PARQUET_AVAILABLE else ['csv']:
+            if source == 'csv' and os.path.exists(columnar_path(csv_path)):
+                os.remove(columnar_path(csv_path))
+            chunks = list(read_qcd_chunks(csv_path, chunk_rows=3))
+            assert [len(chunk) for chunk in chunks] == [3, 1]
+            pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True).astype({'loggerid': str}),
+                                          read_qcd(csv_path).astype({'loggerid': str}))
+
+
+if __name__ == "__main__":
+    test_csv_fallback_types()
+    test_parquet_copy_matches_csv()
+    test_chunked_read_matches_whole()
+    print("\nTest completed!")
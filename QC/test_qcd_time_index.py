@@ -0,0 +1,143 @@
+"""
+Test Time-Indexed QC'd Data
+===========================
+Verify window slices against boolean time masks, and that station-years
+outside a window are skipped
+"""
+
+import sys
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+# Add this directory to path to import the QC modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from qcd_store import write_qcd, read_qcd, PARQUET_AVAILABLE
+from qcd_time_index import QCDTimeStore, TimeIndexedFrame, LazyTimeIndexedFile, index_cache_path
+
+
+def make_year(station, year, n=2000, seed=0):
+    """Hourly records with a repeated timestamp and a missing one"""
+    rng = np.random.default_rng(seed)
+    times = pd.Series(pd.date_range(f'{year}-01-01', periods=n, freq='h'))
+    times.iloc[10] = times.iloc[9]
+    times.iloc[-1] = pd.NaT
+    return pd.DataFrame({
+        'time': times,
+        'stno': int(station),
+        'qc_ind': rng.choice([1, 4, 9], n).astype('int8'),
+        'hm0': rng.uniform(0, 8, n).astype('float32')
+    })
+
+
+def mask_window(df, start, end):
+    """Reference: the boolean mask selection the storm analyzer used"""
+    return df[(df['time'] >= start) & (df['time'] <= end)]
+
+
+def test_window_matches_mask():
+    """Slices equal mask selections, for sorted and unsorted input"""
+    print("Testing window slices...")
+    df = make_year('62091', 2024).sort_values('time')
+    shuffled = df.sample(frac=1, random_state=1)
+    windows = [
+        ('2024-01-01 09:00', '2024-01-01 12:00'),   # repeated timestamp at the edge
+        ('2023-12-01', '2024-01-02'),               # starts before the data
+        ('2024-03-20', '2024-06-01'),               # ends after the data
+        ('2024-02-01 00:30', '2024-02-01 00:45'),   # between records
+        ('2025-01-01', '2025-02-01'),               # after the data
+    ]
+    for start, end in windows:
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        expected = mask_window(df, start, end)
+        pd.testing.assert_frame_equal(TimeIndexedFrame(df).window(start, end), expected)
+        got = TimeIndexedFrame(shuffled).window(start, end)
+        assert got['time'].is_monotonic_increasing
+        pd.testing.assert_frame_equal(got.sort_index(), expected.sort_index())
+
+
+def test_store_skips_station_years():
+    """Only station-years overlapping a window are returned, per station in time order"""
+    print("Testing store windows...")
+    store = QCDTimeStore()
+    store.add('62095', '2024', make_year('62095', 2024).sort_values('time'))
+    store.add('62095', '2023', make_year('62095', 2023, n=9000).sort_values('time'))
+    store.add('62091', '2024', make_year('62091', 2024).sort_values('time'))
+
+    assert list(store) == ['62095_2024', '62095_2023', '62091_2024'] and len(store) == 3
+    assert store.stations == ['62095', '62091']
+    assert store.time_range('62095_2024')[0] == pd.Timestamp('2024-01-01')
+
+    start, end = pd.Timestamp('2023-12-31 20:00'), pd.Timestamp('2024-01-01 03:00')
+    assert [key for key, _ in store.window(start, end)] == ['62095_2024', '62095_2023', '62091_2024']
+    assert [key for key, _ in store.station_window('62095', start, end)] == ['62095_2023', '62095_2024']
+    for key, rows in store.window(start, end):
+        pd.testing.assert_frame_equal(rows, mask_window(store[key], start, end))
+
+    start, end = pd.Timestamp('2023-06-01'), pd.Timestamp('2023-06-03')
+    assert [key for key, _ in store.window(start, end)] == ['62095_2023']
+    assert store.station_window('62091', start, end) == []
+
+
+def check_lazy_windows(csv_path, source):
+    full = TimeIndexedFrame(read_qcd(csv_path))
+    lazy = LazyTimeIndexedFile(csv_path)
+    assert lazy.index.source == source
+    assert lazy.rows == len(full.df) and (lazy.start, lazy.end) == (full.start, full.end)
+    for start, end in [('2024-01-20', '2024-01-24'), ('2024-01-01 09:00', '2024-01-01 10:00'),
+                       ('2024-03-01', '2024-12-31'), ('2024-02-01 00:30', '2024-02-01 00:45')]:
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        pd.testing.assert_frame_equal(lazy.window(start, end), full.window(start, end),
+                                      check_dtype=False, check_categorical=False)
+    assert lazy._loaded is None
+
+
+def test_lazy_file_windows():
+    """Lazy windows read only overlapping blocks and equal windows of the full dataset"""
+    print("Testing lazy file windows...")
+    df = make_year('62091', 2024, n=3000)
+    df['loggerid'] = np.where(np.arange(3000) < 1500, '347_Wavesense', '7577_CR6')
+    shuffled = df.sample(frac=1, random_state=2)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'buoy_62091_2024_qcd.csv')
+        shuffled.to_csv(csv_path, index=False)
+        check_lazy_windows(csv_path, 'csv')
+
+        # The CSV index is cached, reused while the file is unchanged and rebuilt after an edit
+        cache_file = index_cache_path(csv_path)
+        cached_at = os.stat(cache_file).st_mtime_ns
+        LazyTimeIndexedFile(csv_path)
+        assert os.stat(cache_file).st_mtime_ns == cached_at
+        shuffled.iloc[:2000].to_csv(csv_path, index=False)
+        assert LazyTimeIndexedFile(csv_path).rows == 2000
+
+        # A current Parquet copy is indexed from its row-group statistics
+        if PARQUET_AVAILABLE:
+            write_qcd(shuffled, csv_path)
+            check_lazy_windows(csv_path, 'parquet')
+
+
+def test_lazy_file_multiline_records():
+    """Records spanning lines cannot be located by offset; windows fall back to a full read"""
+    print("Testing lazy fallback...")
+    df = make_year('62091', 2024, n=600)
+    df['note'] = ''
+    df.loc[3, 'note'] = 'two\nlines'
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'buoy_62091_2024_qcd.csv')
+        df.to_csv(csv_path, index=False)
+        lazy = LazyTimeIndexedFile(csv_path)
+        assert lazy.index.offsets is None
+        start, end = pd.Timestamp('2024-01-05'), pd.Timestamp('2024-01-06')
+        pd.testing.assert_frame_equal(lazy.window(start, end), TimeIndexedFrame(read_qcd(csv_path)).window(start, end))
+
+
+if __name__ == "__main__":
+    test_window_matches_mask()
+    test_store_skips_station_years()
+    test_lazy_file_windows()
+    test_lazy_file_multiline_records()
+    print("\nTest completed!")
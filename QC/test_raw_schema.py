@@ -0,0 +1,65 @@
+"""
+Test Raw Buoy File Schema
+=========================
+Verify declared dtypes, column projection and the integer fallback
+"""
+
+import sys
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+# Add this directory to path to import the QC modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from raw_schema import read_raw_file, qc_columns
+
+RAW_CSV = """rowid,qc_ind,stno,loggerid,time,ind_airtemp,airtemp,airtemp_1,ind_tp,tp
+1,0,62091,347_Wavesense  ,2024-01-01 00:00:00,0,8.21289,8.4082,0,5.2734
+2,0,62091,347_Wavesense  ,2024-01-01 01:00:00,9,,8.35938,0,5.0391
+"""
+
+
+def write_raw(tmp, text):
+    path = os.path.join(tmp, '2024_62091_zzqc_fugrobuoy.csv')
+    with open(path, 'w') as f:
+        f.write(text)
+    return path
+
+
+def test_declared_dtypes():
+    """QC parameters stay float64, duplicates become float32, flags int8"""
+    print("Testing declared dtypes...")
+    with tempfile.TemporaryDirectory() as tmp:
+        df = read_raw_file(write_raw(tmp, RAW_CSV), qc_parameters=['airtemp'])
+        assert pd.api.types.is_datetime64_any_dtype(df['time'])
+        assert df['airtemp'].dtype == np.float64
+        assert df['airtemp_1'].dtype == np.float32
+        assert df['tp'].dtype == np.float32
+        assert df['ind_airtemp'].dtype == np.int8
+        assert df['loggerid'].iloc[0] == '347_Wavesense  '
+
+
+def test_qc_projection():
+    """Projection loads only identifiers and the requested parameters"""
+    print("Testing QC column projection...")
+    with tempfile.TemporaryDirectory() as tmp:
+        df = read_raw_file(write_raw(tmp, RAW_CSV), ['airtemp'], columns=qc_columns(['airtemp']))
+        assert list(df.columns) == ['rowid', 'qc_ind', 'stno', 'loggerid', 'time', 'ind_airtemp', 'airtemp']
+
+
+def test_blank_integer_falls_back():
+    """A blank indicator does not stop the file from loading"""
+    print("Testing integer fallback...")
+    with tempfile.TemporaryDirectory() as tmp:
+        df = read_raw_file(write_raw(tmp, RAW_CSV.replace(',9,,', ',,,')), ['airtemp'])
+        assert len(df) == 2
+        assert df['ind_airtemp'].isna().sum() == 1
+
+
+if __name__ == "__main__":
+    test_declared_dtypes()
+    test_qc_projection()
+    test_blank_integer_falls_back()
+    print("\nTest completed!")
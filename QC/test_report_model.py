@@ -0,0 +1,98 @@
+"""
+Test Report Model
+=================
+Verify the markdown and PDF writers render the same report blocks
+"""
+
+import sys
+import os
+import tempfile
+
+# Add this directory to path to import the QC modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from report_model import Report, to_markdown, pdf_markup, build_story, pdf_image, sample_styles, default_table_style
+
+
+def make_report():
+    report = Report("Buoy 62091 - 2024 Quality Control Report")
+    report.paragraph("**Generated:** 2024-01-01 00:00:00", block_id='generated')
+    report.heading("Data Overview")
+    report.bullets(["**Station ID:** 62091", ("**Sensors/Loggers:** 1 active", ["347_Wavesense: 10 records"])])
+    report.table(["Parameter", "Pass Rate"], [["hm0", "99.0%"], ["tp", "**No data**<br>n/a"]], block_id='rates')
+    report.numbered(["Review flagged values", "Transfer to production"])
+    report.image("/nonexistent/buoy_62091_2024_qc_overview.png", alt="QC Overview", caption="Figure 1: Overview")
+    return report
+
+
+def test_markdown_rendering():
+    """Blocks render as the markdown used by the existing reports"""
+    print("Testing markdown rendering...")
+    text = to_markdown(make_report())
+    assert text.startswith("# Buoy 62091 - 2024 Quality Control Report\n\n**Generated:**")
+    assert "## Data Overview\n\n- **Station ID:** 62091\n- **Sensors/Loggers:** 1 active\n  - 347_Wavesense" in text
+    assert "| Parameter | Pass Rate |\n|---|---|\n| hm0 | 99.0% |\n" in text
+    assert "1. Review flagged values\n2. Transfer to production\n" in text
+    assert "![QC Overview](buoy_62091_2024_qc_overview.png)\n\n*Figure 1: Overview*" in text
+
+
+def test_pdf_markup():
+    """Inline markdown becomes ReportLab markup with text escaped"""
+    print("Testing PDF markup...")
+    assert pdf_markup("**Hm0** > 3 m & *rising*") == "<b>Hm0</b> &gt; 3 m &amp; <i>rising</i>"
+    assert pdf_markup("a<br>b") == "a<br/>b"
+
+
+def test_pdf_story():
+    """The PDF story is built straight from the blocks, with id overrides"""
+    print("Testing PDF story...")
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import SimpleDocTemplate
+
+    styles = getSampleStyleSheet()
+    pdf_styles = {'heading2': styles['Heading2'], 'body': styles['Normal'], 'bullet': styles['Normal']}
+    story = build_story(make_report(), pdf_styles, max_image_size=(400, 300),
+                        renderers={'generated': lambda block: []})
+    assert len(story) > 5
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_file = os.path.join(tmp, 'report.pdf')
+        SimpleDocTemplate(pdf_file).build(story)
+        assert os.path.getsize(pdf_file) > 0
+
+
+def test_pdf_image_thumbnail():
+    """Figures are embedded resampled to the PDF resolution at their printed size"""
+    print("Testing PDF image thumbnails...")
+    from PIL import Image
+
+    with tempfile.TemporaryDirectory() as tmp:
+        png = os.path.join(tmp, 'figure.png')
+        Image.new('RGBA', (3000, 2000), (30, 60, 200, 255)).save(png)
+
+        image = pdf_image(png, (360, 360), dpi=150)
+        assert (round(image.drawWidth), round(image.drawHeight)) == (360, 240)
+        assert (image.imageWidth, image.imageHeight) == (750, 500)
+
+        # Lower resolutions shrink further, dpi=None keeps the original and
+        # unreadable images are skipped
+        small = pdf_image(png, (360, 360), dpi=10)
+        full = pdf_image(png, (360, 360), dpi=None)
+        assert (small.imageWidth, full.imageWidth) == (50, 3000)
+        assert pdf_image(os.path.join(tmp, 'missing.png'), (360, 360)) is None
+
+
+def test_styles_shared():
+    """Style sheet and table style are created once per process"""
+    print("Testing shared styles...")
+    assert sample_styles() is sample_styles()
+    assert default_table_style() is default_table_style()
+
+
+if __name__ == "__main__":
+    test_markdown_rendering()
+    test_pdf_markup()
+    test_pdf_story()
+    test_pdf_image_thumbnail()
+    test_styles_shared()
+    print("\nTest completed!")
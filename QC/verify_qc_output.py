@@ -4,8 +4,8 @@ Verify QC Output Script
 Quick verification of the generated QC data and reports
 """
 
-import pandas as pd
 import os
+from qcd_store import read_qcd
 
 def verify_qc_output():
     qc_dir = "../QC/Data"
@@ -30,11 +30,10 @@ def verify_qc_output():
         station = csv_file.split('_')[1]
         print(f"Station {station}:")
         
-        df = pd.read_csv(os.path.join(qc_dir, csv_file))
+        # Prefers the typed Parquet copy; time is parsed either way
+        df = read_qcd(os.path.join(qc_dir, csv_file))
         print(f"  Records: {len(df):,}")
         
-        # Convert time column safely
-        df['time'] = pd.to_datetime(df['time'], errors='coerce')
         print(f"  Time range: {df['time'].min()} to {df['time'].max()}")
         
         # QC status
@@ -43,7 +42,15 @@ def verify_qc_output():
             pct = (count/len(df))*100
             status_desc = {0: 'No QC', 1: 'QC Complete', 4: 'QC Failed'}.get(status, f'Status {status}')
             print(f"  {status_desc}: {count:,} ({pct:.1f}%)")
-        
+
+        # Failure reasons recorded by the QC processor (reason_* columns)
+        reason_cols = [c for c in df.columns if c.startswith('reason_')]
+        if reason_cols:
+            reasons = df[reason_cols].to_numpy()
+            reason_desc = {1: 'Range', 2: 'Spike', 3: 'Flat line'}
+            breakdown = ", ".join(f"{desc} {(reasons == code).sum():,}" for code, desc in reason_desc.items())
+            print(f"  Failure reasons: {breakdown}")
+
         print()
 
 if __name__ == "__main__":
@@ -0,0 +1,29 @@
+"""
+Worker Jobs
+===========
+
+Shared helper for running jobs in worker pools, used by the QC processor,
+the consumer export and the storm analyzer.
+"""
+
+import io
+import contextlib
+
+
+def run_captured(job, *args, capture_output=True):
+    """Run one job, returning (console output, result, error)
+
+    Worker processes capture their output so it can be printed grouped per
+    job in a deterministic order. Errors are returned rather than raised so
+    one failing job does not abort the others. Pass capture_output=False to
+    let the job print straight to the console (serial runs).
+    """
+    buffer = io.StringIO()
+    output_context = contextlib.redirect_stdout(buffer) if capture_output else contextlib.nullcontext()
+    result, error = None, None
+    with output_context:
+        try:
+            result = job(*args)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+    return buffer.getvalue(), result, error
@@ -17,6 +17,8 @@ Options:
     --list              List all available storms
     --config FILE       Use custom configuration file
     --output DIR        Custom output directory
+    --jobs N            Render storms in N worker processes
+    --detect            Process the storms detected in the QC data
 """
 
 import sys
@@ -28,7 +30,7 @@ import json
 sys.path.insert(0, str(Path(__file__).parent))
 
 try:
-    from storm_analyzer import MarineStormAnalyzer
+    from storm_analyzer import MarineStormAnalyzer, DEFAULT_PLOT_MAX_POINTS, write_markdown
 except ImportError as e:
     print(f"Error importing storm_analyzer: {e}")
     print("Please ensure all required packages are installed:")
@@ -72,8 +74,8 @@ def process_specific_storm(analyzer, storm_name):
     
     print(f"Processing {storm_name} from {found_year}...")
     
-    # Load QC data
-    analyzer.load_qc_data()
+    # Index QC data; only the station-years overlapping the storm are read
+    analyzer.load_qc_data(lazy=True)
     
     if not analyzer.qc_data:
         print("No QC data available.")
@@ -95,8 +97,8 @@ def process_specific_storm(analyzer, storm_name):
     # Create visualizations first
     overview_plot = analyzer.create_storm_visualizations(storm_name, storm_data, storm_dir)
     
-    # Generate report
-    md_content, stats = analyzer.generate_storm_report(
+    # Build the report once, then write markdown and PDF from it
+    report, stats = analyzer.generate_storm_report(
         storm_name, 
         {'info': found_storm}, 
         storm_data, 
@@ -106,11 +108,10 @@ def process_specific_storm(analyzer, storm_name):
     
     # Save files
     md_path = storm_dir / f"{storm_name.replace(' ', '_')}_report.md"
-    with open(md_path, 'w', encoding='utf-8') as f:
-        f.write(md_content)
+    write_markdown(report, md_path)
     
     pdf_path = storm_dir / f"{storm_name.replace(' ', '_')}_report.pdf"
-    analyzer.convert_md_to_pdf(md_content, pdf_path, storm_name, stats)
+    analyzer.write_storm_pdf(report, pdf_path, storm_name, stats)
     
     csv_path = storm_dir / f"{storm_name.replace(' ', '_')}_data.csv"
     analyzer.save_storm_data_csv(storm_data, csv_path)
@@ -133,8 +134,8 @@ def process_year_storms(analyzer, year):
     storms = analyzer.storms_database[year_str]
     print(f"Processing {len(storms)} storms from {year}...")
     
-    # Load QC data once
-    analyzer.load_qc_data()
+    # Index QC data; each storm reads only its own window
+    analyzer.load_qc_data(lazy=True)
     
     if not analyzer.qc_data:
         print("No QC data available.")
@@ -188,13 +189,47 @@ def main():
         help='QC data directory (default: ../QC/Data)'
     )
     
+    parser.add_argument(
+        '--plot-max-points',
+        type=int,
+        default=DEFAULT_PLOT_MAX_POINTS,
+        help=f'Maximum points drawn per series in storm plots, 0 for all (default: {DEFAULT_PLOT_MAX_POINTS})'
+    )
+    
+    parser.add_argument(
+        '--no-figure-cache',
+        action='store_true',
+        help='Redraw storm overview plots even when their data and settings are unchanged'
+    )
+    
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Worker processes rendering storms in parallel when processing all storms (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--detect', '-d',
+        action='store_true',
+        help='Detect storm events in the QC data, save the event catalogue and process the named storms found'
+    )
+    
+    parser.add_argument(
+        '--include-unnamed',
+        action='store_true',
+        help='With --detect, also report detected events that match no named storm'
+    )
+    
     args = parser.parse_args()
     
     try:
         # Initialize analyzer with custom paths if provided
         analyzer = MarineStormAnalyzer(
             qc_data_dir=args.qc_data,
-            storm_data_dir=args.output
+            storm_data_dir=args.output,
+            plot_max_points=args.plot_max_points,
+            figure_cache=not args.no_figure_cache
         )
         
         # Handle different options
@@ -210,7 +245,8 @@ def main():
         else:
             # Default: process all storms
             print("Processing all storms...")
-            analyzer.process_all_storms()
+            analyzer.process_all_storms(jobs=args.jobs, detect=args.detect,
+                                        include_unnamed=args.include_unnamed)
     
     except KeyboardInterrupt:
         print("\n\nProcessing interrupted by user")
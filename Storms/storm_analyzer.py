@@ -7,7 +7,7 @@ comprehensive marine storm reports for each storm listed on Met Éireann's Storm
 
 Features:
 - Independent operation from existing QC scripts
-- Automated storm period detection based on meteorological criteria
+- Automated storm event detection over the whole archive (storm_events.py)
 - Detailed markdown and PDF report generation
 - QC'd data extraction for storm periods
 - Organized folder structure for each storm
@@ -18,24 +18,27 @@ Date: August 2025
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import os
 import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 import warnings
-import markdown
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-import base64
+import sys
 from pathlib import Path
 
+# Shared QC'd dataset loader lives alongside the QC processor
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "QC"))
+from qcd_store import read_qcd
+from qcd_time_index import QCDTimeStore
+from logger_timeline import build_logger_timelines, filter_to_live_logger
+from logger_metadata import load_logger_info
+from plot_decimation import decimate, envelope_indices, DEFAULT_PLOT_MAX_POINTS
+from report_model import Report, write_markdown, build_story, sample_styles
+from figure_cache import figure_key, is_cached, png_metadata
+from storm_events import StationEventDetector, detect_storm_events
+from worker_jobs import run_captured
+
 # Optional imports
 try:
     import pdfkit
@@ -45,12 +48,39 @@ except ImportError:
 
 warnings.filterwarnings('ignore')
 
+# Bump when a change to the storm overview figure should invalidate cached images
+STORM_FIGURE_VERSION = 1
+
+# Storm peaks: (name, data column, QC indicator column, 'max' or 'min')
+PEAK_PARAMETERS = [
+    ('sustained_wind', 'windsp', 'ind_windsp', 'max'),
+    ('gust_wind', 'windgust', 'ind_windgust', 'max'),
+    ('hm0', 'hm0', 'ind_hm0', 'max'),
+    ('hmax', 'hmax', 'ind_hmax', 'max'),
+    ('min_pressure', 'airpressure', 'ind_airpressure', 'min'),
+    ('max_temperature', 'airtemp', 'ind_airtemp', 'max'),
+    ('min_temperature', 'airtemp', 'ind_airtemp', 'min')
+]
+
+# Record-level QC indicators counted in the storm statistics
+QC_SUMMARY_VALUES = [0, 1, 4, 5, 6, 9]
+
+# Written to the storm output directory by detection runs
+EVENT_CATALOGUE_FILE = "storm_event_catalogue.csv"
+
 class MarineStormAnalyzer:
-    def __init__(self, qc_data_dir="../QC/Data", storm_data_dir="../Storms/Data"):
+    def __init__(self, qc_data_dir="../QC/Data", storm_data_dir="../Storms/Data",
+                 plot_max_points=DEFAULT_PLOT_MAX_POINTS, figure_cache=True):
         self.qc_data_dir = Path(qc_data_dir)
         self.storm_data_dir = Path(storm_data_dir)
         self.storm_data_dir.mkdir(exist_ok=True)
         
+        # Upper bound on points drawn per series in storm plots (None = no limit)
+        self.plot_max_points = plot_max_points
+        
+        # Reuse overview PNGs whose plotted data and settings are unchanged
+        self.figure_cache = figure_cache
+        
         # Known storms database with dates and characteristics
         # Based on Met Éireann storm naming conventions and historical data
         self.storms_database = {
@@ -156,13 +186,19 @@ class MarineStormAnalyzer:
         
         # Initialize logger information
         self.logger_info = {}
+        self.logger_timelines = {}
 
-    def load_qc_data(self):
-        """Load all available QC data files"""
+    def load_qc_data(self, lazy=False):
+        """Load all available QC data files into a time-indexed store
+
+        With lazy=True only each file's time index is read; storm windows
+        then read just the records they cover, and files outside every
+        window are never parsed.
+        """
         qc_files = list(self.qc_data_dir.glob("*_qcd.csv"))
-        self.qc_data = {}
+        self.qc_data = QCDTimeStore()
         
-        print(f"Loading QC data from {len(qc_files)} files...")
+        print(f"{'Indexing' if lazy else 'Loading'} QC data from {len(qc_files)} files...")
         
         for file in qc_files:
             # Extract station and year from filename
@@ -173,18 +209,21 @@ class MarineStormAnalyzer:
                 key = f"{station}_{year}"
                 
                 try:
-                    df = pd.read_csv(file)
-                    df['time'] = pd.to_datetime(df['time'])
-                    df = df.sort_values('time')
-                    self.qc_data[key] = df
-                    print(f"  Loaded {key}: {len(df)} records")
+                    if lazy:
+                        self.qc_data.add_file(station, year, file)
+                        print(f"  Indexed {key}: {self.qc_data.rows(key)} records")
+                    else:
+                        # The store sorts by time (stably) when the file is not already in order
+                        self.qc_data.add(station, year, read_qcd(file))
+                        print(f"  Loaded {key}: {self.qc_data.rows(key)} records")
                 except Exception as e:
                     print(f"  Error loading {file}: {e}")
         
-        print(f"Successfully loaded QC data for {len(self.qc_data)} station-years")
+        print(f"Successfully {'indexed' if lazy else 'loaded'} QC data for {len(self.qc_data)} station-years")
         
         # Load logger information
         self.logger_info = self.load_logger_info()
+        self.logger_timelines = build_logger_timelines(self.logger_info)
 
     def load_logger_info(self):
         """Load logger information from imdbon_log_of_loggers.csv"""
@@ -193,24 +232,8 @@ class MarineStormAnalyzer:
         
         try:
             if logger_file.exists():
-                df = pd.read_csv(logger_file)
-                df['Start'] = pd.to_datetime(df['Start'], format='%d/%m/%Y %H:%M')
-                df['End'] = pd.to_datetime(df['End'], format='%d/%m/%Y %H:%M', errors='coerce')
-                
-                for _, row in df.iterrows():
-                    buoy = str(row['Buoy'])
-                    if buoy not in logger_info:
-                        logger_info[buoy] = []
-                    
-                    logger_info[buoy].append({
-                        'logger_id': row['Loggerid'],
-                        'start_time': row['Start'],
-                        'end_time': row['End'],
-                        'live': row['Live'],
-                        'live_wave': row['Live_wave'],
-                        'comment': row['Comment'] if pd.notna(row['Comment']) else ''
-                    })
-                
+                # Shared with the QC processor and consumer export; cached alongside the log
+                logger_info = load_logger_info(str(logger_file))
                 print(f"Loaded logger information for {len(logger_info)} buoys")
             else:
                 print("Logger information file not found")
@@ -222,25 +245,23 @@ class MarineStormAnalyzer:
 
     def get_active_logger_during_storm(self, buoy, storm_start, storm_end):
         """Determine which logger was active during the storm period for a specific buoy"""
-        if buoy not in self.logger_info:
+        if buoy not in self.logger_timelines:
             return None
         
         active_loggers = []
-        for logger in self.logger_info[buoy]:
-            # Check if logger was active during storm period
+        # Loggers whose deployment overlaps the storm period (endpoints inclusive)
+        for logger in self.logger_timelines[buoy].overlapping(storm_start, storm_end, inclusive=True):
             logger_start = logger['start_time']
             logger_end = logger['end_time'] if pd.notna(logger['end_time']) else pd.Timestamp.now()
             
-            # Check for overlap between logger period and storm period
-            if (logger_start <= storm_end and logger_end >= storm_start):
-                active_loggers.append({
-                    'logger_id': logger['logger_id'],
-                    'live': logger['live'],
-                    'live_wave': logger['live_wave'],
-                    'comment': logger['comment'],
-                    'overlap_start': max(logger_start, storm_start),
-                    'overlap_end': min(logger_end, storm_end)
-                })
+            active_loggers.append({
+                'logger_id': logger['logger_id'],
+                'live': logger['is_live'],
+                'live_wave': logger['live_wave'],
+                'comment': logger['comment'],
+                'overlap_start': max(logger_start, storm_start),
+                'overlap_end': min(logger_end, storm_end)
+            })
         
         return active_loggers
 
@@ -263,61 +284,71 @@ class MarineStormAnalyzer:
 
     def detect_storm_periods(self, df, station_id):
         """Detect potential storm periods in the data based on meteorological criteria"""
-        storm_periods = []
-        
-        # Create storm indicators
-        wind_storms = df['windsp'] > self.storm_criteria['wind_speed_threshold']
-        wave_storms = df['hm0'] > self.storm_criteria['wave_height_threshold']
-        
-        # Combine criteria - either high winds OR high waves
-        storm_conditions = wind_storms | wave_storms
-        
-        # Find continuous periods
-        storm_groups = (storm_conditions != storm_conditions.shift()).cumsum()
-        
-        for group_id, group in df[storm_conditions].groupby(storm_groups):
-            if len(group) >= self.storm_criteria['duration_hours']:
-                period = {
-                    'start_time': group['time'].min(),
-                    'end_time': group['time'].max(),
-                    'duration_hours': len(group),
-                    'max_wind_speed': group['windsp'].max(),
-                    'max_wave_height': group['hm0'].max(),
-                    'min_pressure': group['airpressure'].min(),
-                    'station': station_id
-                }
-                storm_periods.append(period)
-        
-        return storm_periods
-
-    def match_storms_to_database(self, detected_periods):
-        """Match detected storm periods to known storms in database"""
-        matched_storms = {}
-        
+        detector = StationEventDetector(station_id, self.storm_criteria)
+        detector.feed(df)
+        return [{
+            'start_time': event['start'],
+            'end_time': event['end'],
+            'duration_hours': event['duration_hours'],
+            'max_wind_speed': event['max_wind'],
+            'max_wave_height': event['max_hm0'],
+            'min_pressure': event['min_pressure'],
+            'station': station_id
+        } for event in detector.finish()]
+
+    def build_event_catalogue(self, chunk_rows=None):
+        """Detect storm events across every station-year and save the catalogue
+        
+        Events are matched to storms_database; the catalogue is written to
+        EVENT_CATALOGUE_FILE in the storm output directory and returned.
+        """
+        print(f"Detecting storm events in {self.qc_data_dir}...")
+        catalogue = detect_storm_events(self.qc_data_dir, self.storm_criteria, self.storms_database,
+                                        chunk_rows=chunk_rows)
+        
+        named = catalogue[catalogue['storms'] != '']
+        print(f"Detected {len(catalogue)} storm events, {len(named)} matching named storms")
+        for storms in self.storms_database.values():
+            for storm_name in storms:
+                event_ids = [row.event_id for row in named.itertuples()
+                             if storm_name in row.storms.split(', ')]
+                print(f"  {storm_name}: {', '.join(event_ids) if event_ids else 'not detected'}")
+        
+        catalogue_path = self.storm_data_dir / EVENT_CATALOGUE_FILE
+        catalogue.to_csv(catalogue_path, index=False, float_format='%.2f')
+        print(f"Event catalogue saved: {catalogue_path}")
+        return catalogue
+
+    def storm_jobs_from_events(self, catalogue, include_unnamed=False):
+        """(year, storm_name, storm_info) to process for a detected event catalogue
+        
+        Named storms matched by any event keep their database entry. With
+        include_unnamed, each remaining event is processed as 'Event
+        YYYY-MM-DD HHUTC' over the days it spans.
+        """
+        matched = {name for storms in catalogue['storms'] if storms for name in storms.split(', ')}
+        jobs_by_year = {}
         for year, storms in self.storms_database.items():
             for storm_name, storm_info in storms.items():
-                storm_dates = [pd.to_datetime(date) for date in storm_info['dates']]
-                storm_start = min(storm_dates)
-                storm_end = max(storm_dates) + timedelta(days=1)  # Include full end day
-                
-                # Find matching detected periods
-                matching_periods = []
-                for period in detected_periods:
-                    period_start = pd.to_datetime(period['start_time'])
-                    period_end = pd.to_datetime(period['end_time'])
-                    
-                    # Check if periods overlap
-                    if (period_start <= storm_end and period_end >= storm_start):
-                        matching_periods.append(period)
-                
-                if matching_periods:
-                    matched_storms[storm_name] = {
-                        'info': storm_info,
-                        'periods': matching_periods,
-                        'year': year
-                    }
+                if storm_name in matched:
+                    jobs_by_year.setdefault(year, []).append((year, storm_name, storm_info))
+        
+        if include_unnamed:
+            for event in catalogue[catalogue['storms'] == ''].itertuples():
+                year = str(event.start.year)
+                days = pd.date_range(event.start.normalize(), event.end.normalize(), freq='D')
+                stations = event.stations.split(',')
+                storm_info = {
+                    "dates": [day.strftime('%Y-%m-%d') for day in days],
+                    "description": f"Storm event {event.event_id} detected automatically ({event.criteria}).",
+                    "peak_winds": f"{event.max_wind * 1.852:.0f} km/h" if pd.notna(event.max_wind) else "Unknown",
+                    "areas_affected": [self.buoy_stations.get(station, {}).get('name', f'Buoy {station}')
+                                       for station in stations]
+                }
+                storm_name = f"Event {event.start:%Y-%m-%d %H}UTC"
+                jobs_by_year.setdefault(year, []).append((year, storm_name, storm_info))
         
-        return matched_storms
+        return [job for jobs in jobs_by_year.values() for job in jobs]
 
     def extract_storm_data(self, storm_name, storm_info):
         """Extract QC'd data for a specific storm period, excluding outliers"""
@@ -327,70 +358,89 @@ class MarineStormAnalyzer:
         
         storm_data = {}
         
-        for key, df in self.qc_data.items():
-            station_year = key.split('_')
-            if len(station_year) == 2:
-                station, year = station_year
-                
-                # Filter data for storm period
-                time_mask = (df['time'] >= start_date) & (df['time'] <= end_date)
-                
-                # Only include QC'd good data (qc_ind = 1) - exclude outliers and bad data
-                qc_mask = df['qc_ind'] == 1
-                
-                # Combine filters
-                combined_mask = time_mask & qc_mask
-                storm_df = df[combined_mask].copy()
-                
-                if not storm_df.empty:
-                    storm_data[f"{station}_{year}"] = storm_df
-                    print(f"    {key}: {len(storm_df)} good QC records (filtered from {len(df[time_mask])} total)")
+        # Binary-search slice per station-year; years outside the period are skipped
+        for key, window_df in self.qc_data.window(start_date, end_date):
+            # Only include QC'd good data (qc_ind = 1) - exclude outliers and bad data
+            storm_df = window_df[window_df['qc_ind'] == 1]
+            
+            if not storm_df.empty:
+                storm_data[key] = storm_df
+                print(f"    {key}: {len(storm_df)} good QC records (filtered from {len(window_df)} total)")
         
         return storm_data
 
     def create_storm_visualizations(self, storm_name, storm_data, output_dir, storm_info=None):
-        """Create comprehensive visualizations for the storm using only active logger data"""
+        """Create comprehensive visualizations for the storm using only active logger data
+        
+        The figure is keyed on the plotted series and settings; an existing
+        overview PNG with the same key is reused without redrawing.
+        """
+        overview_path = output_dir / f'{storm_name.replace(" ", "_")}_overview.png'
+        title = f'{storm_name} - Marine Meteorological Analysis'
+        
+        plot_series = {}
+        for station_key, df in storm_data.items():
+            station = station_key.split('_')[0]
+            
+            # Filter data to records from the logger that was live at each record's time
+            if station in self.logger_timelines and 'loggerid' in df.columns:
+                logger_filtered_df = filter_to_live_logger(df, self.logger_timelines[station])
+                live_logger_ids = sorted(logger_filtered_df['loggerid'].astype(str).str.strip().unique())
+                print(f"    {station}: Using {len(logger_filtered_df)} records from live loggers: {', '.join(live_logger_ids)}")
+            else:
+                logger_filtered_df = df
+                print(f"    {station}: No logger info available, using all {len(df)} records")
+            
+            # Filter data for each parameter based on individual QC indicators (from active logger data only),
+            # decimated to each series' min/max envelope so long windows draw a bounded number of points
+            good = {param: decimate(logger_filtered_df[logger_filtered_df[f'ind_{param}'] == 1], 'time', param,
+                                    self.plot_max_points)[['time', param]]
+                    for param in ['windsp', 'hm0', 'hmax', 'airpressure', 'airtemp', 'tp', 'winddir']}
+            
+            # Wind direction matched with wind speed data; the scatter is coloured by speed, so keep
+            # the envelope of both series, each with half the point budget
+            wind_combined = df[(df['ind_winddir'] == 1) & (df['ind_windsp'] == 1)][['time', 'winddir', 'windsp']]
+            if self.plot_max_points and len(wind_combined) > self.plot_max_points:
+                half = max(self.plot_max_points // 2, 1)
+                keep = np.union1d(envelope_indices(wind_combined['time'], wind_combined['winddir'], half),
+                                  envelope_indices(wind_combined['time'], wind_combined['windsp'], half))
+                wind_combined = wind_combined.iloc[keep]
+            good['wind_combined'] = wind_combined
+            plot_series[station_key] = good
+        
+        key = figure_key([frame for good in plot_series.values() for frame in good.values()], {
+            'version': STORM_FIGURE_VERSION,
+            'title': title,
+            'stations': list(plot_series),
+            'plot_max_points': self.plot_max_points
+        })
+        if self.figure_cache and is_cached(overview_path, key):
+            print(f"  Overview plot unchanged, reusing {overview_path}")
+            return str(overview_path)
+        
+        # Plotting stack is only imported when figures are rendered
+        import matplotlib.pyplot as plt
+        
         plt.style.use('seaborn-v0_8')
         
         # Create multi-panel storm overview plot
         fig, axes = plt.subplots(4, 2, figsize=(15, 16))
-        fig.suptitle(f'{storm_name} - Marine Meteorological Analysis', fontsize=16, fontweight='bold')
+        fig.suptitle(title, fontsize=16, fontweight='bold')
         
         colors = plt.cm.tab10(np.linspace(0, 1, len(storm_data)))
         
-        for idx, (station_key, df) in enumerate(storm_data.items()):
+        for idx, (station_key, good) in enumerate(plot_series.items()):
             station = station_key.split('_')[0]
             color = colors[idx % len(colors)]
             label = f"Buoy {station}"
             
-            # Filter data to only include records from active loggers during storm period
-            if storm_info and 'info' in storm_info and 'dates' in storm_info['info']:
-                storm_dates = [pd.to_datetime(date) for date in storm_info['info']['dates']]
-                storm_start = min(storm_dates)
-                storm_end = max(storm_dates) + timedelta(days=1)  # Include full end day
-                
-                # Get active loggers for this station during storm period
-                active_loggers = self.get_active_logger_during_storm(station, storm_start, storm_end)
-                if active_loggers:
-                    # Filter data to only include records from active loggers
-                    active_logger_ids = [logger['logger_id'] for logger in active_loggers]
-                    logger_filtered_df = df[df['loggerid'].isin(active_logger_ids)]
-                    print(f"    {station}: Using {len(logger_filtered_df)} records from active loggers: {', '.join(active_logger_ids)}")
-                else:
-                    logger_filtered_df = df
-                    print(f"    {station}: No logger info available, using all {len(df)} records")
-            else:
-                logger_filtered_df = df
-                print(f"    {station}: No storm info available, using all {len(df)} records")
-            
-            # Filter data for each parameter based on individual QC indicators (from active logger data only)
-            good_windsp = logger_filtered_df[logger_filtered_df['ind_windsp'] == 1]
-            good_hm0 = logger_filtered_df[logger_filtered_df['ind_hm0'] == 1]
-            good_hmax = logger_filtered_df[logger_filtered_df['ind_hmax'] == 1]
-            good_pressure = logger_filtered_df[logger_filtered_df['ind_airpressure'] == 1]
-            good_temp = logger_filtered_df[logger_filtered_df['ind_airtemp'] == 1]
-            good_tp = logger_filtered_df[logger_filtered_df['ind_tp'] == 1]
-            good_winddir = logger_filtered_df[logger_filtered_df['ind_winddir'] == 1]
+            good_windsp = good['windsp']
+            good_hm0 = good['hm0']
+            good_hmax = good['hmax']
+            good_pressure = good['airpressure']
+            good_temp = good['airtemp']
+            good_tp = good['tp']
+            good_winddir = good['winddir']
             
             # Wind Speed (only good data) - Display in knots
             if not good_windsp.empty:
@@ -442,8 +492,7 @@ class MarineStormAnalyzer:
             
             # Wind Direction (scatter plot) (only good data)
             if not good_winddir.empty and not good_windsp.empty:
-                # Match wind direction with wind speed data
-                wind_combined = df[(df['ind_winddir'] == 1) & (df['ind_windsp'] == 1)]
+                wind_combined = good['wind_combined']
                 if not wind_combined.empty:
                     # Use wind speed in knots for color mapping
                     scatter = axes[3, 0].scatter(wind_combined['time'], wind_combined['winddir'], 
@@ -471,14 +520,13 @@ class MarineStormAnalyzer:
             ax.tick_params(axis='x', rotation=45)
         
         plt.tight_layout()
-        overview_path = output_dir / f'{storm_name.replace(" ", "_")}_overview.png'
-        plt.savefig(overview_path, dpi=300, bbox_inches='tight')
+        plt.savefig(overview_path, dpi=300, bbox_inches='tight', metadata=png_metadata(key))
         plt.close()
         
         return str(overview_path)
 
     def generate_storm_report(self, storm_name, storm_info, storm_data, output_dir, overview_plot=None):
-        """Generate detailed markdown report for a storm"""
+        """Build the storm report model, returned with the storm statistics"""
         
         # Calculate storm statistics
         stats = self.calculate_storm_statistics(storm_data)
@@ -490,135 +538,75 @@ class MarineStormAnalyzer:
         if overview_plot is None:
             overview_plot = self.create_storm_visualizations(storm_name, storm_data, output_dir, storm_info)
         
-        # Generate markdown content based on severity
-        if severity == "minor":
-            md_content = self._generate_minor_storm_report(storm_name, storm_info, storm_data, stats, overview_plot)
-        else:
-            md_content = self._generate_full_storm_report(storm_name, storm_info, storm_data, stats, overview_plot)
+        # Minor storms get a streamlined report without the pressure analysis
+        report = self._build_storm_report(storm_name, storm_info, storm_data, stats, overview_plot,
+                                          full=(severity != "minor"))
+        
+        return report, stats  # Return stats as well for PDF generation
+
+    def _build_storm_report(self, storm_name, storm_info, storm_data, stats, overview_plot, full=True):
+        """Report model shared by the markdown and PDF storm reports"""
+        report = Report(f"{storm_name} - Marine Storm Report")
+        report.paragraph(f"**Report Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", block_id='generated')
+        
+        report.heading("Marine Observations Summary")
+        report.heading("Data Sources", level=3)
+        self._add_data_sources(report, storm_data)
+        report.heading("Peak Conditions Observed", level=3)
+        self._add_peak_conditions(report, stats)
+        report.heading("Station-by-Station Analysis", level=3)
+        self._add_station_analysis(report, storm_data, stats)
+        
+        report.heading("Meteorological Analysis")
+        report.heading("Wind Analysis", level=3)
+        self._add_wind_analysis(report, stats)
+        report.heading("Wave Analysis", level=3)
+        self._add_wave_analysis(report, stats)
+        if full:
+            report.heading("Pressure Analysis", level=3)
+            self._add_pressure_analysis(report, stats)
+        
+        report.heading("Quality Control Summary")
+        self._add_qc_summary(report, stats)
+        self._add_qc_data_and_logger_info(report, storm_data, storm_info)
+        
+        report.heading("Data Visualization")
+        description = "Comprehensive marine meteorological analysis" if full else "Marine meteorological analysis"
+        report.image(overview_plot, alt="Storm Overview",
+                     caption=f"Figure 1: {description} showing wind speed, wave height, atmospheric pressure, "
+                             f"air temperature, wind direction, and wave period during {storm_name}.")
+        
+        report.heading("Technical Notes")
+        report.heading("QC Methods Applied", level=3)
+        report.bullets([
+            "**Manual QC:** Visual inspection and expert validation",
+            "**Automatic QC:** Range checks, spike detection, and flat-line identification"
+        ])
+        report.heading("Data Quality Indicators", level=3)
+        report.bullets([
+            "0: No QC performed",
+            "1: QC performed, data OK",
+            "4: QC performed, raw data not OK and not adjusted",
+            "5: QC performed, raw data not OK but value adjusted/interpolated",
+            "6: QC performed, data OK (Datawell Hmax sensor specific)",
+            "9: Data missing"
+        ])
         
-        return md_content, stats  # Return stats as well for PDF generation
-
-    def _generate_minor_storm_report(self, storm_name, storm_info, storm_data, stats, overview_plot):
-        """Generate streamlined report for minor storms"""
-        md_content = f"""# {storm_name} - Marine Storm Report
-
-**Report Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Marine Observations Summary
-
-### Data Sources
-{self._format_data_sources(storm_data)}
-
-### Peak Conditions Observed
-{self._format_peak_conditions(stats)}
-
-### Station-by-Station Analysis
-{self._format_station_analysis(storm_data, stats)}
-
-## Meteorological Analysis
-
-### Wind Analysis
-{self._format_wind_analysis(stats)}
-
-### Wave Analysis  
-{self._format_wave_analysis(stats)}
-
-## Quality Control Summary
-{self._format_qc_summary(storm_data)}
-
-{self._format_qc_data_and_logger_info(storm_data, storm_info)}
-
-## Data Visualization
-
-![Storm Overview]({os.path.basename(overview_plot)})
-
-*Figure 1: Marine meteorological analysis showing wind speed, wave height, atmospheric pressure, air temperature, wind direction, and wave period during {storm_name}.*
-
-## Technical Notes
-
-### QC Methods Applied
-- **Manual QC:** Visual inspection and expert validation
-- **Automatic QC:** Range checks, spike detection, and flat-line identification
-
-### Data Quality Indicators
-- 0: No QC performed
-- 1: QC performed, data OK
-- 4: QC performed, raw data not OK and not adjusted
-- 5: QC performed, raw data not OK but value adjusted/interpolated
-- 6: QC performed, data OK (Datawell Hmax sensor specific)
-- 9: Data missing
-
----
-
-*Report generated by Marine Storm Analysis System*
-*Data source: Irish Marine Data Buoy Network*
-*Quality controlled data from Met Éireann marine observations*
-"""
-        return md_content
-
-    def _generate_full_storm_report(self, storm_name, storm_info, storm_data, stats, overview_plot):
-        """Generate comprehensive report for moderate/major storms"""
-        md_content = f"""# {storm_name} - Marine Storm Report
-
-**Report Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Marine Observations Summary
-
-### Data Sources
-{self._format_data_sources(storm_data)}
-
-### Peak Conditions Observed
-{self._format_peak_conditions(stats)}
-
-### Station-by-Station Analysis
-{self._format_station_analysis(storm_data, stats)}
-
-## Meteorological Analysis
-
-### Wind Analysis
-{self._format_wind_analysis(stats)}
-
-### Wave Analysis  
-{self._format_wave_analysis(stats)}
-
-### Pressure Analysis
-{self._format_pressure_analysis(stats)}
-
-## Quality Control Summary
-{self._format_qc_summary(storm_data)}
-
-{self._format_qc_data_and_logger_info(storm_data, storm_info)}
-
-## Data Visualization
-
-![Storm Overview]({os.path.basename(overview_plot)})
-
-*Figure 1: Comprehensive marine meteorological analysis showing wind speed, wave height, atmospheric pressure, air temperature, wind direction, and wave period during {storm_name}.*
-
-## Technical Notes
-
-### QC Methods Applied
-- **Manual QC:** Visual inspection and expert validation
-- **Automatic QC:** Range checks, spike detection, and flat-line identification
-
-### Data Quality Indicators
-- 0: No QC performed
-- 1: QC performed, data OK
-- 4: QC performed, raw data not OK and not adjusted
-- 5: QC performed, raw data not OK but value adjusted/interpolated
-- 6: QC performed, data OK (Datawell Hmax sensor specific)
-- 9: Data missing
-
----
-
-*Report generated by Marine Storm Analysis System*
-*Data source: Irish Marine Data Buoy Network*
-*Quality controlled data from Met Éireann marine observations*
-"""
-        return md_content
+        report.rule(block_id='footer')
+        report.paragraph("*Report generated by Marine Storm Analysis System*", block_id='footer')
+        report.paragraph("*Data source: Irish Marine Data Buoy Network*", block_id='footer')
+        report.paragraph("*Quality controlled data from Met Éireann marine observations*", block_id='footer')
+        return report
 
     def calculate_storm_statistics(self, storm_data):
-        """Calculate comprehensive statistics for the storm using only parameter-level good data"""
+        """Calculate comprehensive statistics for the storm using only parameter-level good data
+        
+        Peaks, their times and QC counts come from one storm_peak_table
+        pass over the storm slice (kept as stats['peak_table']); the
+        overall peaks and per-buoy dictionaries used by the reports are read
+        from that table.
+        """
+        table = storm_peak_table(storm_data)
         stats = {
             'peak_wind_speed': 0,
             'peak_hm0': 0,
@@ -627,7 +615,7 @@ class MarineStormAnalyzer:
             'max_temperature': -float('inf'),
             'min_temperature': float('inf'),
             'total_stations': len(storm_data),
-            'total_observations': 0,
+            'total_observations': int(table['records'].sum()),
             'station_stats': {},
             # Track which buoy recorded each peak
             'peak_wind_buoy': '',
@@ -637,156 +625,56 @@ class MarineStormAnalyzer:
             'max_temp_buoy': '',
             'min_temp_buoy': '',
             # Peak conditions table data (per buoy)
-            'buoy_peaks': {}
+            'buoy_peaks': {},
+            'peak_table': table
         }
         
-        for station_key, df in storm_data.items():
-            station = station_key.split('_')[0]
-            
-            # Initialize buoy peaks dictionary for this station
-            stats['buoy_peaks'][station] = {
-                'sustained_wind': {'value': 0, 'time': None},
-                'gust_wind': {'value': 0, 'time': None},
-                'hm0': {'value': 0, 'time': None},
-                'hmax': {'value': 0, 'time': None},
-                'min_pressure': {'value': float('inf'), 'time': None}
-            }
+        # Overall peaks and the buoy that recorded them (first buoy on ties)
+        for key, buoy_key, name in [('peak_wind_speed', 'peak_wind_buoy', 'sustained_wind'),
+                                    ('peak_hm0', 'peak_hm0_buoy', 'hm0'),
+                                    ('peak_hmax', 'peak_hmax_buoy', 'hmax'),
+                                    ('min_pressure', 'min_pressure_buoy', 'min_pressure'),
+                                    ('max_temperature', 'max_temp_buoy', 'max_temperature'),
+                                    ('min_temperature', 'min_temp_buoy', 'min_temperature')]:
+            values = table[name].dropna()
+            if values.empty:
+                continue
+            station = values.idxmin() if name.startswith('min_') else values.idxmax()
+            # Peaks keep their initial floor (0 knots / 0 m) as the reports always have
+            if key.startswith('peak_') and values[station] <= stats[key]:
+                continue
+            stats[key] = values[station]
+            stats[buoy_key] = station
+        
+        for station, row in table.iterrows():
+            peaks = {}
+            for name in ['sustained_wind', 'gust_wind', 'hm0', 'hmax', 'min_pressure']:
+                if row[f'{name}_good'] > 0:
+                    peaks[name] = {'value': row[name], 'time': row[f'{name}_time']}
+                else:
+                    peaks[name] = {'value': float('inf') if name == 'min_pressure' else 0, 'time': None}
+            stats['buoy_peaks'][station] = peaks
             
-            # Overall statistics with buoy tracking - only use parameter-level good data
-            if not df.empty:
-                # Track peak sustained wind speed and buoy (only ind_windsp = 1)
-                good_windsp_df = df[df['ind_windsp'] == 1]
-                if not good_windsp_df.empty:
-                    max_windsp_idx = good_windsp_df['windsp'].idxmax()
-                    max_windsp = good_windsp_df.loc[max_windsp_idx, 'windsp']
-                    max_windsp_time = good_windsp_df.loc[max_windsp_idx, 'time']
-                    
-                    stats['buoy_peaks'][station]['sustained_wind'] = {
-                        'value': max_windsp,
-                        'time': max_windsp_time
-                    }
-                    
-                    if max_windsp > stats['peak_wind_speed']:
-                        stats['peak_wind_speed'] = max_windsp
-                        stats['peak_wind_buoy'] = station
-                
-                # Track peak gust wind speed (check if windgust column exists)
-                if 'windgust' in df.columns and 'ind_windgust' in df.columns:
-                    good_windgust_df = df[df['ind_windgust'] == 1]
-                    if not good_windgust_df.empty:
-                        max_gust_idx = good_windgust_df['windgust'].idxmax()
-                        max_gust = good_windgust_df.loc[max_gust_idx, 'windgust']
-                        max_gust_time = good_windgust_df.loc[max_gust_idx, 'time']
-                        
-                        stats['buoy_peaks'][station]['gust_wind'] = {
-                            'value': max_gust,
-                            'time': max_gust_time
-                        }
-                
-                # Track peak Hm0 and buoy (only ind_hm0 = 1)
-                good_hm0_df = df[df['ind_hm0'] == 1]
-                if not good_hm0_df.empty:
-                    max_hm0_idx = good_hm0_df['hm0'].idxmax()
-                    max_hm0 = good_hm0_df.loc[max_hm0_idx, 'hm0']
-                    max_hm0_time = good_hm0_df.loc[max_hm0_idx, 'time']
-                    
-                    stats['buoy_peaks'][station]['hm0'] = {
-                        'value': max_hm0,
-                        'time': max_hm0_time
-                    }
-                    
-                    if max_hm0 > stats['peak_hm0']:
-                        stats['peak_hm0'] = max_hm0
-                        stats['peak_hm0_buoy'] = station
-                
-                # Track peak Hmax and buoy (only ind_hmax = 1)
-                good_hmax_df = df[df['ind_hmax'] == 1]
-                if not good_hmax_df.empty:
-                    max_hmax_idx = good_hmax_df['hmax'].idxmax()
-                    max_hmax = good_hmax_df.loc[max_hmax_idx, 'hmax']
-                    max_hmax_time = good_hmax_df.loc[max_hmax_idx, 'time']
-                    
-                    stats['buoy_peaks'][station]['hmax'] = {
-                        'value': max_hmax,
-                        'time': max_hmax_time
-                    }
-                    
-                    if max_hmax > stats['peak_hmax']:
-                        stats['peak_hmax'] = max_hmax
-                        stats['peak_hmax_buoy'] = station
-                
-                # Track minimum pressure and buoy (only ind_airpressure = 1)
-                good_pressure_df = df[df['ind_airpressure'] == 1]
-                if not good_pressure_df.empty:
-                    min_pressure_idx = good_pressure_df['airpressure'].idxmin()
-                    min_pressure = good_pressure_df.loc[min_pressure_idx, 'airpressure']
-                    min_pressure_time = good_pressure_df.loc[min_pressure_idx, 'time']
-                    
-                    stats['buoy_peaks'][station]['min_pressure'] = {
-                        'value': min_pressure,
-                        'time': min_pressure_time
-                    }
-                    
-                    if min_pressure < stats['min_pressure']:
-                        stats['min_pressure'] = min_pressure
-                        stats['min_pressure_buoy'] = station
-                
-                # Track temperature extremes and buoys (only ind_airtemp = 1)
-                good_temp = df[df['ind_airtemp'] == 1]['airtemp']
-                if not good_temp.empty:
-                    if good_temp.max() > stats['max_temperature']:
-                        stats['max_temperature'] = good_temp.max()
-                        stats['max_temp_buoy'] = station
-                    
-                    if good_temp.min() < stats['min_temperature']:
-                        stats['min_temperature'] = good_temp.min()
-                        stats['min_temp_buoy'] = station
-                
-                stats['total_observations'] += len(df)
-                
-                # Station-specific statistics - only parameter-level good data
-                station_stats = {
-                    'observations': len(df),
-                    'data_quality': self._assess_data_quality(df)
+            # Station-specific statistics - only parameter-level good data
+            if row['records'] > 0:
+                stats['station_stats'][station] = {
+                    'observations': int(row['records']),
+                    'data_quality': self._assess_data_quality(row),
+                    'max_wind': row['sustained_wind'] if row['sustained_wind_good'] > 0 else 0.0,
+                    'max_hm0': row['hm0'] if row['hm0_good'] > 0 else 0.0,
+                    'max_hmax': row['hmax'] if row['hmax_good'] > 0 else 0.0,
+                    'min_pressure': row['min_pressure'] if row['min_pressure_good'] > 0 else float('inf')
                 }
-                
-                # Only include parameters with good QC data - use the dataframes created earlier
-                if not good_windsp_df.empty:
-                    station_stats['max_wind'] = good_windsp_df['windsp'].max()
-                else:
-                    station_stats['max_wind'] = 0.0
-                
-                if not good_hm0_df.empty:
-                    station_stats['max_hm0'] = good_hm0_df['hm0'].max()
-                else:
-                    station_stats['max_hm0'] = 0.0
-                
-                if not good_hmax_df.empty:
-                    station_stats['max_hmax'] = good_hmax_df['hmax'].max()
-                else:
-                    station_stats['max_hmax'] = 0.0
-                
-                if not good_pressure_df.empty:
-                    station_stats['min_pressure'] = good_pressure_df['airpressure'].min()
-                else:
-                    station_stats['min_pressure'] = float('inf')
-                
-                stats['station_stats'][station] = station_stats
         
         return stats
 
-    def _assess_data_quality(self, df):
-        """Assess data quality for a station during storm period"""
-        total_records = len(df)
+    def _assess_data_quality(self, station_row):
+        """Assess data quality for a station from its peak table row"""
+        total_records = station_row['records']
         if total_records == 0:
             return "No data"
         
-        # Count QC indicators
-        qc_good = len(df[df['qc_ind'] == 1])
-        qc_adjusted = len(df[df['qc_ind'] == 5])
-        qc_missing = len(df[df['qc_ind'] == 9])
-        
-        good_percentage = (qc_good / total_records) * 100
+        good_percentage = (station_row['qc_1'] / total_records) * 100
         
         if good_percentage >= 90:
             return f"Excellent ({good_percentage:.1f}% good data)"
@@ -797,23 +685,23 @@ class MarineStormAnalyzer:
         else:
             return f"Poor ({good_percentage:.1f}% good data)"
 
-    def _format_data_sources(self, storm_data):
-        """Format data sources section"""
+    def _add_data_sources(self, report, storm_data):
+        """Add the data sources list"""
         sources = []
         for station_key in storm_data.keys():
             station = station_key.split('_')[0]
             if station in self.buoy_stations:
                 info = self.buoy_stations[station]
-                sources.append(f"- **Buoy {station}** ({info['name']}): {info['location']}")
+                sources.append(f"**Buoy {station}** ({info['name']}): {info['location']}")
         
-        return '\n'.join(sources) if sources else "No data sources available"
+        if sources:
+            report.bullets(sources)
+        else:
+            report.paragraph("No data sources available")
 
-    def _format_peak_conditions(self, stats):
-        """Format peak conditions section for markdown"""
-        # Create markdown table
-        table = "\n| Buoy (Location) | Sustained Wind Speeds | Gust Wind Speeds | Significant Wave Height | Individual Wave | MSLP (hPa) |\n"
-        table += "|---|---|---|---|---|---|\n"
-        
+    def _add_peak_conditions(self, report, stats):
+        """Add the peak conditions table (the PDF draws its own styled version)"""
+        rows = []
         for station in sorted(stats['buoy_peaks'].keys()):
             peaks = stats['buoy_peaks'][station]
             station_info = self.buoy_stations.get(station, {})
@@ -858,13 +746,14 @@ class MarineStormAnalyzer:
             else:
                 pressure_str = "No data"
             
-            table += f"| {location} | {sustained_str} | {gust_str} | {hm0_str} | {hmax_str} | {pressure_str} |\n"
+            rows.append([location, sustained_str, gust_str, hm0_str, hmax_str, pressure_str])
         
-        return table
+        report.table(["Buoy (Location)", "Sustained Wind Speeds", "Gust Wind Speeds", "Significant Wave Height",
+                      "Individual Wave", "MSLP (hPa)"], rows, block_id='peak_conditions')
 
-    def _format_station_analysis(self, storm_data, stats):
-        """Format station-by-station analysis"""
-        analysis = []
+    def _add_station_analysis(self, report, storm_data, stats):
+        """Add the station-by-station analysis"""
+        added = False
         
         for station_key, df in storm_data.items():
             station = station_key.split('_')[0]
@@ -899,63 +788,67 @@ class MarineStormAnalyzer:
                     pressure_time = peaks['min_pressure']['time'].strftime('%a %d %b %Y %H:%M UTC')
                     pressure_str += f" on {pressure_time}"
                 
-                analysis.append(f"""
-### Buoy {station} - {station_info.get('name', 'Unknown')}
-- **Location:** {station_info.get('location', 'Unknown')}
-- **Peak Wind Speed:** {wind_str}
-- **Peak Significant Wave Height (Hm0):** {hm0_str}
-- **Peak Maximum Wave Height (Hmax):** {hmax_str}
-- **Minimum Pressure:** {pressure_str}
-- **Data Quality:** {station_stat['data_quality']}
-- **Observations:** {station_stat['observations']:,} records (QC good data only)
-""")
-        
-        return '\n'.join(analysis) if analysis else "No station data available"
-
-    def _format_wind_analysis(self, stats):
-        """Format wind analysis section"""
-        return f"""
-The storm produced maximum sustained winds of **{stats['peak_wind_speed']:.1f} knots** ({stats['peak_wind_speed'] * 1.852:.1f} km/h).
-
-**Wind Categories:**
-- Force 7 — Near gale: 28–33 kn (50–61 km/h)
-- Force 8 — Gale: 34–40 kn (62–74 km/h)
-- Force 9 — Severe gale (aka Strong gale): 41–47 kn (75–88 km/h)
-- Force 10 — Storm: 48–55 kn (89–102 km/h)
-- Force 11 — Violent storm: 56–63 kn (103–117 km/h)
-- Force 12 — Hurricane force: ≥64 kn (≥118 km/h)
-"""
+                report.heading(f"Buoy {station} - {station_info.get('name', 'Unknown')}", level=3)
+                report.bullets([
+                    f"**Location:** {station_info.get('location', 'Unknown')}",
+                    f"**Peak Wind Speed:** {wind_str}",
+                    f"**Peak Significant Wave Height (Hm0):** {hm0_str}",
+                    f"**Peak Maximum Wave Height (Hmax):** {hmax_str}",
+                    f"**Minimum Pressure:** {pressure_str}",
+                    f"**Data Quality:** {station_stat['data_quality']}",
+                    f"**Observations:** {station_stat['observations']:,} records (QC good data only)"
+                ])
+                added = True
+        
+        if not added:
+            report.paragraph("No station data available")
+
+    def _add_wind_analysis(self, report, stats):
+        """Add the wind analysis section"""
+        report.paragraph(f"The storm produced maximum sustained winds of **{stats['peak_wind_speed']:.1f} knots** "
+                         f"({stats['peak_wind_speed'] * 1.852:.1f} km/h).")
+        report.paragraph("**Wind Categories:**")
+        report.bullets([
+            "Force 7 — Near gale: 28–33 kn (50–61 km/h)",
+            "Force 8 — Gale: 34–40 kn (62–74 km/h)",
+            "Force 9 — Severe gale (aka Strong gale): 41–47 kn (75–88 km/h)",
+            "Force 10 — Storm: 48–55 kn (89–102 km/h)",
+            "Force 11 — Violent storm: 56–63 kn (103–117 km/h)",
+            "Force 12 — Hurricane force: ≥64 kn (≥118 km/h)"
+        ])
 
-    def _format_wave_analysis(self, stats):
-        """Format wave analysis section"""
+    def _add_wave_analysis(self, report, stats):
+        """Add the wave analysis section"""
         # Sea state classification only applies to Hm0 (significant wave height)
         hm0_category = "rough" if stats['peak_hm0'] < 4 else "very rough" if stats['peak_hm0'] < 6 else "high" if stats['peak_hm0'] < 9 else "very high" if stats['peak_hm0'] < 14 else "phenomenal"
-        
-        return f"""
-**Significant Wave Heights (Hm0):** Peak values reached **{stats['peak_hm0']:.1f} m**, representing **{hm0_category}**.
-
-**Maximum Wave Heights (Hmax):** Individual wave heights peaked at **{stats['peak_hmax']:.1f} m**. Note: Hmax values represent individual wave heights and are not used for sea state classification.
-
-**Wave Height Relationship:** The Hmax/Hm0 ratio was **{stats['peak_hmax']/stats['peak_hm0']:.2f}**, {"within normal range (1.3-1.8)" if 1.3 <= stats['peak_hmax']/stats['peak_hm0'] <= 1.8 else "indicating extreme wave conditions" if stats['peak_hmax']/stats['peak_hm0'] > 1.8 else "unusually low for storm conditions"}.
-
-**Sea State Classification (Hm0):**
-- Rough: 2.5-4.0 m
-- Very Rough: 4.0-6.0 m
-- High: 6.0-9.0 m
-- Very High: 9.0-14.0 m
-- Phenomenal: >14.0 m
+        ratio = stats['peak_hmax'] / stats['peak_hm0']
+        ratio_note = ("within normal range (1.3-1.8)" if 1.3 <= ratio <= 1.8
+                      else "indicating extreme wave conditions" if ratio > 1.8
+                      else "unusually low for storm conditions")
+        
+        report.paragraph(f"**Significant Wave Heights (Hm0):** Peak values reached **{stats['peak_hm0']:.1f} m**, "
+                         f"representing **{hm0_category}**.")
+        report.paragraph(f"**Maximum Wave Heights (Hmax):** Individual wave heights peaked at "
+                         f"**{stats['peak_hmax']:.1f} m**. Note: Hmax values represent individual wave heights and "
+                         f"are not used for sea state classification.")
+        report.paragraph(f"**Wave Height Relationship:** The Hmax/Hm0 ratio was **{ratio:.2f}**, {ratio_note}.")
+        report.paragraph("**Sea State Classification (Hm0):**")
+        report.bullets([
+            "Rough: 2.5-4.0 m",
+            "Very Rough: 4.0-6.0 m",
+            "High: 6.0-9.0 m",
+            "Very High: 9.0-14.0 m",
+            "Phenomenal: >14.0 m"
+        ])
+        report.paragraph("**Wave Height Definitions:**")
+        report.bullets([
+            "**Hm0 (Significant Wave Height):** Average height of the highest one-third of waves",
+            "**Hmax (Maximum Wave Height):** Highest individual wave recorded during the period"
+        ])
 
-**Wave Height Definitions:**
-- **Hm0 (Significant Wave Height):** Average height of the highest one-third of waves
-- **Hmax (Maximum Wave Height):** Highest individual wave recorded during the period
-"""
-
-    def _format_pressure_analysis(self, stats):
-        """Format pressure analysis section"""
-        pressure_drop = 1013.25 - stats['min_pressure']  # From standard pressure
-        return f"""
-Atmospheric pressure dropped to a minimum of **{stats['min_pressure']:.1f} hPa**.
-"""
+    def _add_pressure_analysis(self, report, stats):
+        """Add the pressure analysis section"""
+        report.paragraph(f"Atmospheric pressure dropped to a minimum of **{stats['min_pressure']:.1f} hPa**.")
 
     def _format_storm_timeline(self, storm_data):
         """Format storm timeline section"""
@@ -986,39 +879,38 @@ Atmospheric pressure dropped to a minimum of **{stats['min_pressure']:.1f} hPa**
 - Storm passage: Gradual improvement in conditions
 """
 
-    def _format_qc_summary(self, storm_data):
-        """Format QC summary section"""
-        total_records = sum(len(df) for df in storm_data.values())
+    def _add_qc_summary(self, report, stats):
+        """Add the QC summary section"""
+        total_records = stats['total_observations']
         if total_records == 0:
-            return "No QC data available"
-        
-        qc_counts = {0: 0, 1: 0, 4: 0, 5: 0, 6: 0, 9: 0}
+            report.paragraph("No QC data available")
+            return
         
-        for df in storm_data.values():
-            for qc_val in qc_counts.keys():
-                qc_counts[qc_val] += len(df[df['qc_ind'] == qc_val])
+        table = stats['peak_table']
+        qc_counts = {qc_val: int(table[f'qc_{qc_val}'].sum()) for qc_val in QC_SUMMARY_VALUES}
         
-        return f"""
-**Total Records:** {total_records:,}
-
-**QC Status Distribution:**
-- Good Data (QC=1): {qc_counts[1]:,} records ({qc_counts[1]/total_records*100:.1f}%)
-- Adjusted Data (QC=5): {qc_counts[5]:,} records ({qc_counts[5]/total_records*100:.1f}%)
-- Missing Data (QC=9): {qc_counts[9]:,} records ({qc_counts[9]/total_records*100:.1f}%)
-- No QC (QC=0): {qc_counts[0]:,} records ({qc_counts[0]/total_records*100:.1f}%)
-"""
+        report.paragraph(f"**Total Records:** {total_records:,}")
+        report.paragraph("**QC Status Distribution:**")
+        report.bullets([
+            f"Good Data (QC=1): {qc_counts[1]:,} records ({qc_counts[1]/total_records*100:.1f}%)",
+            f"Adjusted Data (QC=5): {qc_counts[5]:,} records ({qc_counts[5]/total_records*100:.1f}%)",
+            f"Missing Data (QC=9): {qc_counts[9]:,} records ({qc_counts[9]/total_records*100:.1f}%)",
+            f"No QC (QC=0): {qc_counts[0]:,} records ({qc_counts[0]/total_records*100:.1f}%)"
+        ])
 
-    def _format_qc_data_and_logger_info(self, storm_data, storm_info):
-        """Format logger information section"""
+    def _add_qc_data_and_logger_info(self, report, storm_data, storm_info):
+        """Add the logger information section"""
         if not storm_data:
-            return "No QC data available"
+            report.paragraph("No QC data available")
+            return
         
         # Get storm period from storm info
         storm_dates = [pd.to_datetime(date) for date in storm_info['info']['dates']]
         storm_start = min(storm_dates)
         storm_end = max(storm_dates) + timedelta(days=1)  # Include full end day
         
-        logger_info = []
+        report.heading("Data Sources and Logger Information")
+        report.heading("Active Logger Information During Storm Period", level=3)
         
         for station_key, df in storm_data.items():
             station = station_key.split('_')[0]
@@ -1026,34 +918,24 @@ Atmospheric pressure dropped to a minimum of **{stats['min_pressure']:.1f} hPa**
             # Get logger information for this station during storm period
             active_loggers = self.get_active_logger_during_storm(station, storm_start, storm_end)
             
+            report.paragraph(f"**Buoy {station} ({self.buoy_stations.get(station, {}).get('name', 'Unknown')}):**")
             if active_loggers:
                 # Just show the logger ID(s) that were active
                 logger_ids = [logger['logger_id'] for logger in active_loggers]
-                logger_info.append(f"""
-**Buoy {station} ({self.buoy_stations.get(station, {}).get('name', 'Unknown')}):**
-- Logger(s) used: {', '.join(logger_ids)}""")
+                report.bullets([f"Logger(s) used: {', '.join(logger_ids)}"])
             else:
-                logger_info.append(f"""
-**Buoy {station} ({self.buoy_stations.get(station, {}).get('name', 'Unknown')}):**
-- No logger information available for this period""")
+                report.bullets(["No logger information available for this period"])
         
-        return f"""
-## Data Sources and Logger Information
-
-### Active Logger Information During Storm Period
-{chr(10).join(logger_info)}
-
-**Note:** This report uses only quality-controlled data (QC indicators 1 and 5) for meteorological analysis. Logger information shows which data acquisition systems were active during the storm period."""
+        report.paragraph("**Note:** This report uses only quality-controlled data (QC indicators 1 and 5) for "
+                         "meteorological analysis. Logger information shows which data acquisition systems were "
+                         "active during the storm period.")
 
-
-
-    def convert_md_to_pdf(self, md_content, output_path, storm_name, stats=None):
-        """Convert markdown content to PDF using reportlab with modern, attractive styling"""
+    def write_storm_pdf(self, report, output_path, storm_name, stats=None):
+        """Render the storm report model to PDF using reportlab with modern, attractive styling"""
         try:
-            from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-            from reportlab.platypus import PageBreak, KeepTogether
-            from reportlab.graphics.shapes import Drawing, Rect, String
-            from reportlab.graphics import renderPDF
+            from reportlab.lib.pagesizes import A4
+            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+            from reportlab.lib.units import inch
             
             # Create PDF document with margins
             doc = SimpleDocTemplate(
@@ -1065,342 +947,57 @@ Atmospheric pressure dropped to a minimum of **{stats['min_pressure']:.1f} hPa**
                 rightMargin=0.8*inch
             )
             
-            styles = getSampleStyleSheet()
+            # Met Éireann official styles, shared by every storm report
+            styles = _storm_pdf_styles()
             story = []
             
-            # Met Éireann official color palette
-            met_blue = colors.Color(0.0, 0.31, 0.62)        # Met Éireann primary blue #004F9F
-            met_light_blue = colors.Color(0.26, 0.59, 0.85) # Met Éireann light blue #4396D9
-            met_green = colors.Color(0.0, 0.55, 0.40)       # Met Éireann green #008C66
-            met_orange = colors.Color(1.0, 0.60, 0.0)       # Met Éireann orange #FF9900
-            light_grey = colors.Color(0.95, 0.95, 0.95)     # Very light grey
-            medium_grey = colors.Color(0.5, 0.5, 0.5)       # Medium grey
-            dark_grey = colors.Color(0.2, 0.2, 0.2)         # Dark grey
-            white = colors.Color(1.0, 1.0, 1.0)             # White
-            
-            # Met Éireann official styles
-            title_style = ParagraphStyle(
-                'MetTitle',
-                parent=styles['Title'],
-                fontSize=26,
-                spaceAfter=8,
-                spaceBefore=15,
-                alignment=TA_CENTER,
-                textColor=met_blue,
-                fontName='Helvetica-Bold'
-            )
-            
-            subtitle_style = ParagraphStyle(
-                'MetSubtitle',
-                parent=styles['Normal'],
-                fontSize=18,
-                spaceAfter=5,
-                alignment=TA_CENTER,
-                textColor=met_green,
-                fontName='Helvetica-Bold'
-            )
-            
-            department_style = ParagraphStyle(
-                'MetDepartment',
-                parent=styles['Normal'],
-                fontSize=14,
-                spaceAfter=25,
-                alignment=TA_CENTER,
-                textColor=met_light_blue,
-                fontName='Helvetica'
-            )
-            
-            meta_style = ParagraphStyle(
-                'MetMetaInfo',
-                parent=styles['Normal'],
-                fontSize=10,
-                spaceAfter=30,
-                alignment=TA_CENTER,
-                textColor=medium_grey,
-                fontName='Helvetica'
-            )
-            
-            heading1_style = ParagraphStyle(
-                'MetHeading1',
-                parent=styles['Heading1'],
-                fontSize=16,
-                spaceAfter=12,
-                spaceBefore=20,
-                textColor=white,
-                fontName='Helvetica-Bold',
-                borderWidth=0,
-                borderPadding=10,
-                backColor=met_blue,
-                leftIndent=0,
-                rightIndent=0,
-                alignment=TA_LEFT
-            )
-            
-            heading2_style = ParagraphStyle(
-                'MetHeading2',
-                parent=styles['Heading2'],
-                fontSize=14,
-                spaceAfter=8,
-                spaceBefore=15,
-                textColor=met_blue,
-                fontName='Helvetica-Bold',
-                borderWidth=0,
-                borderColor=met_light_blue,
-                borderPadding=0,
-                leftIndent=0
-            )
-            
-            heading3_style = ParagraphStyle(
-                'MetHeading3',
-                parent=styles['Heading3'],
-                fontSize=12,
-                spaceAfter=6,
-                spaceBefore=12,
-                textColor=met_green,
-                fontName='Helvetica-Bold'
-            )
-            
-            body_style = ParagraphStyle(
-                'MetBody',
-                parent=styles['Normal'],
-                fontSize=11,
-                spaceAfter=6,
-                alignment=TA_JUSTIFY,
-                fontName='Helvetica',
-                textColor=dark_grey,
-                leading=13
-            )
-            
-            bullet_style = ParagraphStyle(
-                'MetBullet',
-                parent=styles['Normal'],
-                fontSize=11,
-                spaceAfter=3,
-                leftIndent=20,
-                fontName='Helvetica',
-                textColor=dark_grey,
-                bulletIndent=8
-            )
-            
-            highlight_box_style = ParagraphStyle(
-                'MetHighlightBox',
-                parent=styles['Normal'],
-                fontSize=11,
-                spaceAfter=10,
-                spaceBefore=10,
-                alignment=TA_LEFT,
-                fontName='Helvetica-Bold',
-                textColor=met_blue,
-                borderWidth=2,
-                borderColor=met_orange,
-                borderPadding=8,
-                backColor=colors.Color(1.0, 0.98, 0.95),  # Very light orange
-                leftIndent=0,
-                rightIndent=0
-            )
-            
             # Add Met Éireann official header
             story.append(Spacer(1, 15))
             
             # Met Éireann branding header
-            story.append(Paragraph("Met Éireann", title_style))
-            story.append(Paragraph("The Irish Meteorological Service", department_style))
+            story.append(Paragraph("Met Éireann", styles['title']))
+            story.append(Paragraph("The Irish Meteorological Service", styles['department']))
             story.append(Spacer(1, 20))
             
             # Storm title section
-            story.append(Paragraph(f"{storm_name}", title_style))
-            story.append(Paragraph("Marine Storm Report", subtitle_style))
-            story.append(Paragraph("Marine Unit", department_style))
+            story.append(Paragraph(f"{storm_name}", styles['title']))
+            story.append(Paragraph("Marine Storm Report", styles['subtitle']))
+            story.append(Paragraph("Marine Unit", styles['department']))
             story.append(Spacer(1, 10))
             
             # Report metadata in official style
-            story.append(Paragraph(f"Report Date: {datetime.now().strftime('%d %B %Y')}", meta_style))
-            story.append(Paragraph(f"Report Time: {datetime.now().strftime('%H:%M UTC')}", meta_style))
+            story.append(Paragraph(f"Report Date: {datetime.now().strftime('%d %B %Y')}", styles['meta']))
+            story.append(Paragraph(f"Report Time: {datetime.now().strftime('%H:%M UTC')}", styles['meta']))
             story.append(Spacer(1, 25))
             
-            # Process markdown content with enhanced formatting
-            lines = md_content.split('\n')
-            current_section = []
-            in_bullet_list = False
-            in_peak_conditions = False
-            skip_until_next_section = False
-            
-            for line in lines:
-                line = line.strip()
-                
-                if line.startswith('# '):
-                    continue  # Skip main title, already added
-                elif line.startswith('**Report Generated:**'):
-                    continue  # Skip, already added
-                elif line.startswith('## '):
-                    if current_section:
-                        story.append(Paragraph(' '.join(current_section), body_style))
-                        story.append(Spacer(1, 8))
-                        current_section = []
-                    story.append(Paragraph(line[3:], heading1_style))
-                    in_bullet_list = False
-                    skip_until_next_section = False
-                elif line.startswith('### '):
-                    if current_section:
-                        story.append(Paragraph(' '.join(current_section), body_style))
-                        story.append(Spacer(1, 8))
-                        current_section = []
-                    
-                    # Check if this is Peak Conditions Observed section
-                    if 'Peak Conditions' in line and stats:
-                        # Add the heading
-                        story.append(Paragraph(line[4:], heading2_style))
-                        # Insert the ReportLab table
-                        story.append(Spacer(1, 10))
-                        peak_table = self._create_peak_conditions_table(stats, styles)
-                        story.append(peak_table)
-                        story.append(Spacer(1, 15))
-                        skip_until_next_section = True  # Skip markdown table content
-                    else:
-                        # Regular heading - reset skip flag
-                        story.append(Paragraph(line[4:], heading2_style))
-                        skip_until_next_section = False
-                    
-                    in_bullet_list = False
-                elif line.startswith('#### '):
-                    if current_section:
-                        story.append(Paragraph(' '.join(current_section), body_style))
-                        story.append(Spacer(1, 8))
-                        current_section = []
-                    story.append(Paragraph(line[5:], heading3_style))
-                    in_bullet_list = False
-                    skip_until_next_section = False
-                elif line.startswith('|') and skip_until_next_section:
-                    # Skip markdown table rows when we have the ReportLab table
-                    continue
-                elif line.startswith('- '):
-                    if skip_until_next_section:
-                        continue
-                    if current_section and not in_bullet_list:
-                        story.append(Paragraph(' '.join(current_section), body_style))
-                        story.append(Spacer(1, 8))
-                        current_section = []
-                    
-                    # Clean up markdown formatting for PDF
-                    clean_line = self._clean_markdown_for_pdf(line[2:])
-                    
-                    # Use highlight box for peak conditions
-                    if in_peak_conditions and ('Maximum' in line or 'Minimum' in line or 'Total Observations' in line):
-                        story.append(Paragraph(f"▶ {clean_line}", highlight_box_style))
-                    else:
-                        story.append(Paragraph(f"• {clean_line}", bullet_style))
-                    in_bullet_list = True
-                elif line.strip():
-                    if skip_until_next_section:
-                        continue
-                    if in_bullet_list:
-                        in_bullet_list = False
-                        story.append(Spacer(1, 8))
-                    # Clean up markdown formatting for PDF
-                    clean_line = self._clean_markdown_for_pdf(line)
-                    current_section.append(clean_line)
-                else:
-                    if current_section:
-                        story.append(Paragraph(' '.join(current_section), body_style))
-                        story.append(Spacer(1, 8))
-                        current_section = []
-                    in_bullet_list = False
-            
-            if current_section:
-                story.append(Paragraph(' '.join(current_section), body_style))
-            
-            # Add the overview plot if it exists with Met Éireann styling
-            overview_image_path = output_path.parent / f"{storm_name.replace(' ', '_')}_overview.png"
-            if overview_image_path.exists():
-                story.append(Spacer(1, 25))
-                story.append(Paragraph("Marine Meteorological Analysis", heading1_style))
-                story.append(Spacer(1, 15))
-                
-                # Add the image - scale it to fit the page width
-                from reportlab.lib.utils import ImageReader
-                img = ImageReader(str(overview_image_path))
-                img_width, img_height = img.getSize()
-                
-                # Scale image to fit page width (with margins)
-                available_width = doc.width
-                available_height = doc.height * 0.55  # Use 55% of page height max
-                
-                # Calculate scaling factor
-                scale_factor = min(available_width / img_width, available_height / img_height)
-                scaled_width = img_width * scale_factor
-                scaled_height = img_height * scale_factor
-                
-                # Center the image
-                story.append(Spacer(1, 10))
-                story.append(Image(str(overview_image_path), width=scaled_width, height=scaled_height))
-                story.append(Spacer(1, 10))
-                
-                # Add Met Éireann style image caption
-                caption_style = ParagraphStyle(
-                    'MetCaption',
-                    parent=styles['Normal'],
-                    fontSize=10,
-                    alignment=TA_CENTER,
-                    textColor=dark_grey,
-                    fontName='Helvetica',
-                    spaceAfter=15,
-                    borderWidth=1,
-                    borderColor=met_light_blue,
-                    borderPadding=8,
-                    backColor=colors.Color(0.98, 0.99, 1.0)  # Very light blue
-                )
-                story.append(Paragraph(f"<b>Figure 1:</b> Marine meteorological observations during {storm_name}. Eight-panel analysis showing wind speed, significant wave height (Hm0), maximum wave height (Hmax), atmospheric pressure, air temperature, wave period, wind direction patterns, and comparative wave heights across the Irish Marine Data Buoy Network. Quality-controlled data only.", caption_style))
+            # Render the report model in one pass; the peak conditions table gets
+            # its own styled layout, and the header/footer replace the markdown ones
+            renderers = {
+                'generated': lambda block: [],
+                'footer': lambda block: [],
+            }
+            if stats:
+                renderers['peak_conditions'] = lambda block: [
+                    Spacer(1, 10), self._create_peak_conditions_table(stats, styles['sample']), Spacer(1, 15)
+                ]
+            story.extend(build_story(
+                report,
+                styles,
+                max_image_size=(doc.width, doc.height * 0.55),  # Use 55% of page height max
+                renderers=renderers
+            ))
             
             # Add Met Éireann official footer section
             story.append(Spacer(1, 35))
             
             # Footer separator line in Met Éireann style
-            footer_line_style = ParagraphStyle(
-                'MetFooterLine',
-                parent=styles['Normal'],
-                fontSize=8,
-                alignment=TA_CENTER,
-                textColor=met_blue,
-                borderWidth=2,
-                borderColor=met_blue,
-                spaceAfter=15
-            )
-            story.append(Paragraph("", footer_line_style))
+            story.append(Paragraph("", styles['footer_line']))
             
             # Met Éireann official footer content
-            footer_main_style = ParagraphStyle(
-                'MetFooterMain',
-                parent=styles['Normal'],
-                fontSize=11,
-                alignment=TA_CENTER,
-                textColor=met_blue,
-                fontName='Helvetica-Bold',
-                spaceAfter=6
-            )
-            
-            footer_sub_style = ParagraphStyle(
-                'MetFooterSub',
-                parent=styles['Normal'],
-                fontSize=10,
-                alignment=TA_CENTER,
-                textColor=met_green,
-                fontName='Helvetica',
-                spaceAfter=4
-            )
-            
-            footer_small_style = ParagraphStyle(
-                'MetFooterSmall',
-                parent=styles['Normal'],
-                fontSize=9,
-                alignment=TA_CENTER,
-                textColor=medium_grey,
-                fontName='Helvetica'
-            )
-            
-            story.append(Paragraph("<b>Met Éireann Marine Unit</b>", footer_main_style))
-            story.append(Paragraph("Irish Marine Data Buoy Network", footer_sub_style))
-            story.append(Paragraph("Valentia Observatory, Co. Kerry", footer_small_style))
-            story.append(Paragraph("www.met.ie/climate/storm-centre", footer_small_style))
+            story.append(Paragraph("<b>Met Éireann Marine Unit</b>", styles['footer_main']))
+            story.append(Paragraph("Irish Marine Data Buoy Network", styles['footer_sub']))
+            story.append(Paragraph("Valentia Observatory, Co. Kerry", styles['footer_small']))
+            story.append(Paragraph("www.met.ie/climate/storm-centre", styles['footer_small']))
             
             # Build PDF
             doc.build(story)
@@ -1413,29 +1010,10 @@ Atmospheric pressure dropped to a minimum of **{stats['min_pressure']:.1f} hPa**
             traceback.print_exc()
             return False
 
-    def _clean_markdown_for_pdf(self, text):
-        """Clean markdown formatting for PDF generation"""
-        # Handle bold text
-        import re
-        text = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', text)
-        # Handle italic text  
-        text = re.sub(r'\*(.*?)\*', r'<i>\1</i>', text)
-        # Handle links (remove markdown link syntax, keep text)
-        text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
-        # Escape special characters
-        text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-        # Restore our formatting
-        text = text.replace('&lt;b&gt;', '<b>').replace('&lt;/b&gt;', '</b>')
-        text = text.replace('&lt;i&gt;', '<i>').replace('&lt;/i&gt;', '</i>')
-        return text
-
     def _create_peak_conditions_table(self, stats, styles):
         """Create ReportLab table for peak conditions in PDF"""
-        # Met Éireann official color palette
-        met_blue = colors.Color(0.0, 0.31, 0.62)        # Met Éireann primary blue #004F9F
-        met_teal = colors.Color(0.21, 0.53, 0.58)       # Teal color matching the image
-        white = colors.Color(1.0, 1.0, 1.0)             # White
-        light_grey = colors.Color(0.95, 0.95, 0.95)     # Very light grey
+        from reportlab.platypus import Paragraph, Table
+        from reportlab.lib.units import inch
         
         # Create table data
         table_data = []
@@ -1540,37 +1118,7 @@ Atmospheric pressure dropped to a minimum of **{stats['min_pressure']:.1f} hPa**
         # Create table
         table = Table(table_data, colWidths=[1.2*inch, 1.5*inch, 1.5*inch, 1.2*inch, 1.2*inch, 1.2*inch])
         
-        # Apply table style
-        table_style = TableStyle([
-            # Header row styling
-            ('BACKGROUND', (0, 0), (-1, 0), met_teal),
-            ('TEXTCOLOR', (0, 0), (-1, 0), white),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, 0), 'MIDDLE'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('TOPPADDING', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            
-            # Data rows styling
-            ('ALIGN', (0, 1), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 1), (-1, -1), 'MIDDLE'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('TOPPADDING', (0, 1), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-            ('LEFTPADDING', (0, 1), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 1), (-1, -1), 6),
-            
-            # Grid
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            ('BOX', (0, 0), (-1, -1), 2, met_teal),
-            
-            # Alternating row colors
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [white, light_grey]),
-        ])
-        
-        table.setStyle(table_style)
+        table.setStyle(_peak_table_style())
         return table
 
     def save_storm_data_csv(self, storm_data, output_path):
@@ -1601,8 +1149,64 @@ Atmospheric pressure dropped to a minimum of **{stats['min_pressure']:.1f} hPa**
             print(f"  Error saving CSV: {e}")
             return False
 
-    def process_all_storms(self):
-        """Main processing function to analyze all storms"""
+    def process_storm(self, year, storm_name, storm_info):
+        """Extract, plot and report one storm; returns False if it has no data"""
+        print(f"\n  Processing {storm_name}...")
+        
+        # Create storm directory
+        storm_dir = self.storm_data_dir / storm_name.replace(" ", "_")
+        storm_dir.mkdir(exist_ok=True)
+        
+        # Extract storm data
+        storm_data = self.extract_storm_data(storm_name, {'info': storm_info})
+        
+        if not storm_data:
+            print(f"    No data available for {storm_name}")
+            return False
+        
+        print(f"    Found data from {len(storm_data)} station-years")
+        
+        # Create visualizations first (before generating report)
+        overview_plot = self.create_storm_visualizations(storm_name, storm_data, storm_dir, {'info': storm_info})
+        
+        # Build the report once, then write markdown and PDF from it
+        report, stats = self.generate_storm_report(
+            storm_name, 
+            {'info': storm_info}, 
+            storm_data, 
+            storm_dir,
+            overview_plot
+        )
+        
+        # Save markdown report
+        md_path = storm_dir / f"{storm_name.replace(' ', '_')}_report.md"
+        write_markdown(report, md_path)
+        print(f"    Markdown report saved: {md_path}")
+        
+        # Render PDF
+        pdf_path = storm_dir / f"{storm_name.replace(' ', '_')}_report.pdf"
+        self.write_storm_pdf(report, pdf_path, storm_name, stats)
+        
+        # Save storm data CSV
+        csv_path = storm_dir / f"{storm_name.replace(' ', '_')}_data.csv"
+        self.save_storm_data_csv(storm_data, csv_path)
+        
+        print(f"    [OK] {storm_name} processing complete")
+        return True
+
+    def process_all_storms(self, jobs=1, detect=False, include_unnamed=False):
+        """Main processing function to analyze all storms
+        
+        Storms are independent once QC data is loaded. With jobs > 1 they
+        are rendered in a process pool whose workers share the loaded data
+        (see _storm_process_pool); console output is still printed grouped
+        per storm in database order, and a failing storm does not stop the
+        others.
+        
+        With detect=True the storms come from the detected event catalogue
+        (build_event_catalogue) instead of the whole database: named storms
+        the data shows, plus unmatched events when include_unnamed is set.
+        """
         print("=" * 60)
         print("MARINE STORM ANALYSIS AND REPORTING SYSTEM")
         print("=" * 60)
@@ -1614,68 +1218,386 @@ Atmospheric pressure dropped to a minimum of **{stats['min_pressure']:.1f} hPa**
             print("No QC data available. Exiting.")
             return
         
-        # Process each storm in the database
-        total_storms = sum(len(storms) for storms in self.storms_database.values())
+        if detect:
+            # Process the storms found in the data
+            print()
+            storm_jobs = self.storm_jobs_from_events(self.build_event_catalogue(), include_unnamed)
+        else:
+            # Process each storm in the database
+            storm_jobs = [(year, storm_name, storm_info)
+                          for year, storms in self.storms_database.items()
+                          for storm_name, storm_info in storms.items()]
+        total_storms = len(storm_jobs)
         processed_storms = 0
+        failures = {}
         
-        print(f"\nProcessing {total_storms} known storms...")
+        print(f"\nProcessing {total_storms} {'detected' if detect else 'known'} storms...")
         print("-" * 40)
         
-        for year, storms in self.storms_database.items():
-            print(f"\nProcessing {year} storms:")
-            
-            for storm_name, storm_info in storms.items():
-                print(f"\n  Processing {storm_name}...")
-                
-                # Create storm directory
-                storm_dir = self.storm_data_dir / storm_name.replace(" ", "_")
-                storm_dir.mkdir(exist_ok=True)
-                
-                # Extract storm data
-                storm_data = self.extract_storm_data(storm_name, {'info': storm_info})
-                
-                if not storm_data:
-                    print(f"    No data available for {storm_name}")
-                    continue
-                
-                print(f"    Found data from {len(storm_data)} station-years")
-                
-                # Create visualizations first (before generating report)
-                overview_plot = self.create_storm_visualizations(storm_name, storm_data, storm_dir, {'info': storm_info})
-                
-                # Generate report
-                md_content, stats = self.generate_storm_report(
-                    storm_name, 
-                    {'info': storm_info}, 
-                    storm_data, 
-                    storm_dir,
-                    overview_plot
-                )
-                
-                # Save markdown report
-                md_path = storm_dir / f"{storm_name.replace(' ', '_')}_report.md"
-                with open(md_path, 'w', encoding='utf-8') as f:
-                    f.write(md_content)
-                print(f"    Markdown report saved: {md_path}")
-                
-                # Convert to PDF
-                pdf_path = storm_dir / f"{storm_name.replace(' ', '_')}_report.pdf"
-                self.convert_md_to_pdf(md_content, pdf_path, storm_name, stats)
+        executor = None
+        pending = {}
+        if jobs > 1 and total_storms > 1:
+            print(f"Rendering {total_storms} storms with {jobs} worker processes")
+            executor = _storm_process_pool(self, jobs)
+            for year, storm_name, storm_info in storm_jobs:
+                pending[storm_name] = executor.submit(run_captured, _process_storm_in_worker,
+                                                     year, storm_name, storm_info)
+        
+        try:
+            current_year = None
+            for year, storm_name, storm_info in storm_jobs:
+                if year != current_year:
+                    print(f"\nProcessing {year} storms:")
+                    current_year = year
                 
-                # Save storm data CSV
-                csv_path = storm_dir / f"{storm_name.replace(' ', '_')}_data.csv"
-                self.save_storm_data_csv(storm_data, csv_path)
+                if executor is not None:
+                    # Print each storm's captured output in database order
+                    try:
+                        output, processed, error = pending[storm_name].result()
+                    except Exception as e:
+                        output, processed, error = '', False, f"{type(e).__name__}: {e}"
+                    print(output, end='')
+                else:
+                    _, processed, error = run_captured(self.process_storm, year, storm_name, storm_info,
+                                                       capture_output=False)
                 
-                processed_storms += 1
-                print(f"    [OK] {storm_name} processing complete")
+                if error:
+                    print(f"    Error processing {storm_name}: {error}")
+                    failures[storm_name] = error
+                elif processed:
+                    processed_storms += 1
+        finally:
+            if executor is not None:
+                executor.shutdown()
         
         print("\n" + "=" * 60)
         print(f"PROCESSING COMPLETE")
         print(f"Successfully processed {processed_storms} of {total_storms} storms")
+        for storm_name, error in failures.items():
+            print(f"  {storm_name}: FAILED - {error}")
         print(f"Reports saved to: {self.storm_data_dir}")
         print("=" * 60)
 
 
+# Analyzer shared by the storm worker processes (set by _init_storm_worker)
+_worker_analyzer = None
+
+
+def _init_storm_worker(analyzer):
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+
+def _process_storm_in_worker(year, storm_name, storm_info):
+    return _worker_analyzer.process_storm(year, storm_name, storm_info)
+
+
+def _storm_process_pool(analyzer, jobs):
+    """Process pool whose workers share the analyzer and its loaded QC data
+    
+    The analyzer is handed to each worker once, through the pool
+    initializer, rather than pickled with every storm. Where fork is
+    available the workers inherit it copy-on-write and nothing is copied;
+    elsewhere (Windows) it is pickled once per worker.
+    """
+    context = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else None
+    return ProcessPoolExecutor(max_workers=jobs, mp_context=context,
+                               initializer=_init_storm_worker, initargs=(analyzer,))
+
+
+def _frame_peaks(df):
+    """Peak values, times and good-record counts of one station-year frame
+    
+    All parameters are reduced together: the value columns form one matrix,
+    records not flagged good (indicator 1) or missing are masked, and a
+    single argmax per column finds each peak. Minima are found as maxima of
+    the negated values. Ties resolve to the earliest record.
+    """
+    row = {'records': len(df)}
+    qc_counts = df['qc_ind'].value_counts() if 'qc_ind' in df else pd.Series(dtype='int64')
+    for qc_val in QC_SUMMARY_VALUES:
+        row[f'qc_{qc_val}'] = int(qc_counts.get(qc_val, 0))
+    
+    n = len(df)
+    values = np.full((n, len(PEAK_PARAMETERS)), np.nan)
+    good = np.zeros((n, len(PEAK_PARAMETERS)), dtype=bool)
+    for i, (_, column, indicator, _) in enumerate(PEAK_PARAMETERS):
+        if column in df and indicator in df:
+            values[:, i] = df[column].to_numpy(dtype='float64', na_value=np.nan)
+            good[:, i] = (df[indicator] == 1).to_numpy(dtype=bool, na_value=False)
+    good &= ~np.isnan(values)
+    
+    signs = np.array([-1.0 if kind == 'min' else 1.0 for *_, kind in PEAK_PARAMETERS])
+    ranked = np.where(good, values * signs, -np.inf)
+    positions = ranked.argmax(axis=0) if n else np.zeros(len(PEAK_PARAMETERS), dtype=int)
+    good_counts = good.sum(axis=0)
+    times = df['time'].to_numpy() if n else None
+    
+    for i, (name, *_) in enumerate(PEAK_PARAMETERS):
+        found = good_counts[i] > 0
+        row[name] = values[positions[i], i] if found else np.nan
+        row[f'{name}_time'] = times[positions[i]] if found else pd.NaT
+        row[f'{name}_good'] = int(good_counts[i])
+    return row
+
+
+def storm_peak_table(storm_data):
+    """Per-station peak statistics for a storm, one row per station
+    
+    storm_data maps 'station_year' keys to storm slices. Columns are typed:
+    records and qc_{indicator} counts (int64), and for each PEAK_PARAMETERS
+    name its value (float64, NaN without good data), {name}_time
+    (datetime64, NaT) and {name}_good count (int64). Stations keep their
+    storm_data order; a station with several station-years in the window
+    gets the extreme over all of them and summed counts.
+    """
+    rows = []
+    for station_key, df in storm_data.items():
+        row = _frame_peaks(df)
+        row['station'] = station_key.split('_')[0]
+        rows.append(row)
+    
+    count_columns = ['records'] + [f'qc_{qc_val}' for qc_val in QC_SUMMARY_VALUES] + \
+                    [f'{name}_good' for name, *_ in PEAK_PARAMETERS]
+    keyed = pd.DataFrame(rows, columns=['station'] + count_columns +
+                         [column for name, *_ in PEAK_PARAMETERS for column in (name, f'{name}_time')])
+    stations = pd.unique(keyed['station'])
+    
+    table = keyed.groupby('station', sort=False)[count_columns].sum().astype('int64')
+    for name, _, _, kind in PEAK_PARAMETERS:
+        # Extreme station-year per station; stable sort keeps the first on ties
+        best = keyed.sort_values(name, ascending=(kind == 'min'), kind='stable', na_position='last')
+        best = best.drop_duplicates('station').set_index('station')
+        table[name] = best[name].astype('float64')
+        table[f'{name}_time'] = pd.to_datetime(best[f'{name}_time'])
+    
+    columns = ['records'] + [f'qc_{qc_val}' for qc_val in QC_SUMMARY_VALUES] + \
+              [column for name, *_ in PEAK_PARAMETERS for column in (name, f'{name}_time', f'{name}_good')]
+    table = table.reindex(index=stations, columns=columns)
+    table.index.name = 'station'
+    return table
+
+
+# Met Éireann official color palette (as reportlab Color arguments)
+MET_PALETTE = {
+    'met_blue': (0.0, 0.31, 0.62),          # Met Éireann primary blue #004F9F
+    'met_light_blue': (0.26, 0.59, 0.85),   # Met Éireann light blue #4396D9
+    'met_green': (0.0, 0.55, 0.40),         # Met Éireann green #008C66
+    'met_teal': (0.21, 0.53, 0.58),         # Teal color matching the image
+    'light_grey': (0.95, 0.95, 0.95),       # Very light grey
+    'medium_grey': (0.5, 0.5, 0.5),         # Medium grey
+    'dark_grey': (0.2, 0.2, 0.2),           # Dark grey
+    'white': (1.0, 1.0, 1.0),               # White
+}
+
+
+@lru_cache(maxsize=None)
+def _storm_pdf_styles():
+    """Met Éireann paragraph styles for the storm PDFs, created once per process
+    
+    Keys follow build_story ('heading2'..'heading4', 'body', 'bullet',
+    'caption') plus the header and footer styles; 'sample' is the shared
+    sample style sheet used by the peak conditions table.
+    """
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
+    
+    styles = sample_styles()
+    met_blue, met_light_blue, met_green, medium_grey, dark_grey, white = (
+        colors.Color(*MET_PALETTE[name])
+        for name in ('met_blue', 'met_light_blue', 'met_green', 'medium_grey', 'dark_grey', 'white')
+    )
+    
+    return {
+        'sample': styles,
+        'title': ParagraphStyle(
+            'MetTitle',
+            parent=styles['Title'],
+            fontSize=26,
+            spaceAfter=8,
+            spaceBefore=15,
+            alignment=TA_CENTER,
+            textColor=met_blue,
+            fontName='Helvetica-Bold'
+        ),
+        'subtitle': ParagraphStyle(
+            'MetSubtitle',
+            parent=styles['Normal'],
+            fontSize=18,
+            spaceAfter=5,
+            alignment=TA_CENTER,
+            textColor=met_green,
+            fontName='Helvetica-Bold'
+        ),
+        'department': ParagraphStyle(
+            'MetDepartment',
+            parent=styles['Normal'],
+            fontSize=14,
+            spaceAfter=25,
+            alignment=TA_CENTER,
+            textColor=met_light_blue,
+            fontName='Helvetica'
+        ),
+        'meta': ParagraphStyle(
+            'MetMetaInfo',
+            parent=styles['Normal'],
+            fontSize=10,
+            spaceAfter=30,
+            alignment=TA_CENTER,
+            textColor=medium_grey,
+            fontName='Helvetica'
+        ),
+        # Report sections (##) are rendered as the banded MetHeading1
+        'heading2': ParagraphStyle(
+            'MetHeading1',
+            parent=styles['Heading1'],
+            fontSize=16,
+            spaceAfter=12,
+            spaceBefore=20,
+            textColor=white,
+            fontName='Helvetica-Bold',
+            borderWidth=0,
+            borderPadding=10,
+            backColor=met_blue,
+            leftIndent=0,
+            rightIndent=0,
+            alignment=TA_LEFT
+        ),
+        'heading3': ParagraphStyle(
+            'MetHeading2',
+            parent=styles['Heading2'],
+            fontSize=14,
+            spaceAfter=8,
+            spaceBefore=15,
+            textColor=met_blue,
+            fontName='Helvetica-Bold',
+            borderWidth=0,
+            borderColor=met_light_blue,
+            borderPadding=0,
+            leftIndent=0
+        ),
+        'heading4': ParagraphStyle(
+            'MetHeading3',
+            parent=styles['Heading3'],
+            fontSize=12,
+            spaceAfter=6,
+            spaceBefore=12,
+            textColor=met_green,
+            fontName='Helvetica-Bold'
+        ),
+        'body': ParagraphStyle(
+            'MetBody',
+            parent=styles['Normal'],
+            fontSize=11,
+            spaceAfter=6,
+            alignment=TA_JUSTIFY,
+            fontName='Helvetica',
+            textColor=dark_grey,
+            leading=13
+        ),
+        'bullet': ParagraphStyle(
+            'MetBullet',
+            parent=styles['Normal'],
+            fontSize=11,
+            spaceAfter=3,
+            leftIndent=20,
+            fontName='Helvetica',
+            textColor=dark_grey,
+            bulletIndent=8
+        ),
+        # Caption style for the overview figure
+        'caption': ParagraphStyle(
+            'MetCaption',
+            parent=styles['Normal'],
+            fontSize=10,
+            alignment=TA_CENTER,
+            textColor=dark_grey,
+            fontName='Helvetica',
+            spaceAfter=15,
+            borderWidth=1,
+            borderColor=met_light_blue,
+            borderPadding=8,
+            backColor=colors.Color(0.98, 0.99, 1.0)  # Very light blue
+        ),
+        # Footer separator line in Met Éireann style
+        'footer_line': ParagraphStyle(
+            'MetFooterLine',
+            parent=styles['Normal'],
+            fontSize=8,
+            alignment=TA_CENTER,
+            textColor=met_blue,
+            borderWidth=2,
+            borderColor=met_blue,
+            spaceAfter=15
+        ),
+        'footer_main': ParagraphStyle(
+            'MetFooterMain',
+            parent=styles['Normal'],
+            fontSize=11,
+            alignment=TA_CENTER,
+            textColor=met_blue,
+            fontName='Helvetica-Bold',
+            spaceAfter=6
+        ),
+        'footer_sub': ParagraphStyle(
+            'MetFooterSub',
+            parent=styles['Normal'],
+            fontSize=10,
+            alignment=TA_CENTER,
+            textColor=met_green,
+            fontName='Helvetica',
+            spaceAfter=4
+        ),
+        'footer_small': ParagraphStyle(
+            'MetFooterSmall',
+            parent=styles['Normal'],
+            fontSize=9,
+            alignment=TA_CENTER,
+            textColor=medium_grey,
+            fontName='Helvetica'
+        ),
+    }
+
+
+@lru_cache(maxsize=None)
+def _peak_table_style():
+    """Table style for the peak conditions table, created once per process"""
+    from reportlab.platypus import TableStyle
+    from reportlab.lib import colors
+    
+    met_teal, white, light_grey = (colors.Color(*MET_PALETTE[name]) for name in ('met_teal', 'white', 'light_grey'))
+    
+    return TableStyle([
+        # Header row styling
+        ('BACKGROUND', (0, 0), (-1, 0), met_teal),
+        ('TEXTCOLOR', (0, 0), (-1, 0), white),
+        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, 0), 'MIDDLE'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('TOPPADDING', (0, 0), (-1, 0), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        
+        # Data rows styling
+        ('ALIGN', (0, 1), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 1), (-1, -1), 'MIDDLE'),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+        ('TOPPADDING', (0, 1), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+        ('LEFTPADDING', (0, 1), (-1, -1), 6),
+        ('RIGHTPADDING', (0, 1), (-1, -1), 6),
+        
+        # Grid
+        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+        ('BOX', (0, 0), (-1, -1), 2, met_teal),
+        
+        # Alternating row colors
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [white, light_grey]),
+    ])
+
+
 def main():
     """Main execution function"""
     try:
@@ -0,0 +1,307 @@
+"""
+Storm Event Detection
+=====================
+
+Finds storm events in the QC'd archive from the storm criteria alone,
+independent of the named storm list:
+
+1. Each station's station-years are streamed in time order through a
+   StationEventDetector. A record exceeds the criteria when a QC-good
+   (indicator 1) sustained wind, significant wave height or gust is above
+   its threshold, or when good pressure has fallen by at least
+   pressure_drop_threshold within the preceding PRESSURE_DROP_WINDOW.
+   Runs of exceeding records are found by run-length encoding that mask;
+   runs lasting less than duration_hours are dropped. Detector state
+   carries over between chunks and station-years, so a run crossing New
+   Year or a chunk boundary is one event.
+2. Station events that overlap in time are merged into network events.
+3. Each network event is matched to the named storms whose dates it
+   overlaps (several when storms follow closely, e.g. Isha and Jocelyn).
+
+The result is a compact catalogue, one row per event (see
+EVENT_CATALOGUE_COLUMNS), that can drive the storm report processing.
+"""
+
+import re
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from datetime import timedelta
+
+from qcd_store import read_qcd, read_qcd_chunks
+
+# Threshold criteria: (flag, data column, QC indicator column, storm_criteria key)
+THRESHOLD_CRITERIA = [
+    ('wind', 'windsp', 'ind_windsp', 'wind_speed_threshold'),
+    ('wave', 'hm0', 'ind_hm0', 'wave_height_threshold'),
+    ('gust', 'windgust', 'ind_windgust', 'gust_threshold')
+]
+
+# Flags in the order they are listed in an event's criteria
+EVENT_FLAGS = [flag for flag, *_ in THRESHOLD_CRITERIA] + ['pressure_drop']
+
+# Pressure drops are measured from the highest pressure within this window
+PRESSURE_DROP_WINDOW = pd.Timedelta(hours=24)
+
+# Records further apart than this (a data gap) never continue a run
+MAX_RECORD_GAP = pd.Timedelta(hours=3)
+
+EVENT_COLUMNS = ['time', 'airpressure', 'ind_airpressure'] + \
+                [column for _, data, indicator, _ in THRESHOLD_CRITERIA for column in (data, indicator)]
+
+EVENT_CATALOGUE_COLUMNS = [
+    'event_id', 'start', 'end', 'duration_hours', 'stations', 'station_count',
+    'max_wind', 'max_wind_station', 'max_gust', 'max_hm0', 'max_hm0_station',
+    'min_pressure', 'min_pressure_station', 'max_pressure_drop', 'criteria',
+    'storms'
+]
+
+
+def _good_values(df, column, indicator):
+    """Values flagged good as float64, NaN elsewhere or when the column is missing"""
+    if column not in df or indicator not in df:
+        return np.full(len(df), np.nan)
+    values = df[column].to_numpy(dtype='float64', na_value=np.nan)
+    good = (df[indicator] == 1).to_numpy(dtype=bool, na_value=False)
+    return np.where(good, values, np.nan)
+
+
+def _criteria_label(flags):
+    """'wind+wave' style label for a boolean flag vector in EVENT_FLAGS order"""
+    return '+'.join(flag for flag, raised in zip(EVENT_FLAGS, flags) if raised)
+
+
+class StationEventDetector:
+    """Streaming storm event detector for one station
+
+    Feed time-ordered record chunks with feed(); call finish() once the
+    station's data is exhausted to close the last run and get the events.
+    Each event is a dict with start/end (first and last exceeding record),
+    duration_hours (end - start plus one record interval), records, the
+    peak values and the criteria that were raised.
+    """
+
+    def __init__(self, station, criteria):
+        self.station = station
+        self.criteria = criteria
+        self.min_duration = pd.Timedelta(hours=criteria['duration_hours'])
+        self.events = []
+        self._run = None
+        self._last_time = None
+        self._step = None
+        # Good pressures still inside the drop window of the next record
+        self._pressure = pd.Series(dtype='float64', index=pd.DatetimeIndex([]))
+
+    def _pressure_drop(self, times, pressure):
+        """Fall from the highest good pressure in the preceding window, per record"""
+        history = pd.concat([self._pressure, pd.Series(pressure, index=times)])
+        highest = history.rolling(PRESSURE_DROP_WINDOW).max().to_numpy()[-len(pressure):]
+        kept = history.dropna()
+        self._pressure = kept[kept.index > times[-1] - PRESSURE_DROP_WINDOW]
+        return highest - pressure
+
+    def feed(self, df):
+        """Process the next chunk of records, which must not precede earlier ones"""
+        df = df[df['time'].notna()]
+        if df.empty:
+            return
+        if not df['time'].is_monotonic_increasing:
+            df = df.sort_values('time', kind='stable')
+        times = pd.DatetimeIndex(df['time'])
+        if self._last_time is not None and times[0] < self._last_time:
+            raise ValueError(f"Records for station {self.station} must be fed in time order "
+                             f"({times[0]} follows {self._last_time})")
+
+        # Per-record exceedance flags and values for the run aggregates
+        values = {flag: _good_values(df, data, indicator) for flag, data, indicator, _ in THRESHOLD_CRITERIA}
+        pressure = _good_values(df, 'airpressure', 'ind_airpressure')
+        drop = self._pressure_drop(times, pressure)
+        with np.errstate(invalid='ignore'):
+            flags = np.column_stack(
+                [values[flag] > self.criteria[key] for flag, _, _, key in THRESHOLD_CRITERIA] +
+                [drop >= self.criteria['pressure_drop_threshold']]
+            )
+        mask = flags.any(axis=1)
+
+        # Run-length encode the mask, also breaking runs at data gaps
+        ns = times.asi8
+        previous = self._last_time.value if self._last_time is not None else ns[0]
+        intervals = np.diff(ns, prepend=previous)
+        gaps = intervals > MAX_RECORD_GAP.value
+        edges = np.flatnonzero((np.diff(mask.astype(np.int8)) != 0) | gaps[1:]) + 1
+        starts = np.concatenate(([0], edges))
+        ends = np.concatenate((edges, [len(mask)]))
+
+        # Record interval, measured from the previous chunk too (chunks may be one record)
+        positive = intervals[intervals > 0]
+        if self._step is None and len(positive):
+            self._step = pd.Timedelta(int(np.median(positive)))
+
+        # Close the open run unless the chunk's first record continues it
+        if self._run is not None and (not mask[0] or gaps[0]):
+            self._close_run()
+
+        run_flags = np.logical_or.reduceat(flags, starts)
+        with np.errstate(invalid='ignore'):
+            peaks = {
+                'max_wind': np.fmax.reduceat(values['wind'], starts),
+                'max_gust': np.fmax.reduceat(values['gust'], starts),
+                'max_hm0': np.fmax.reduceat(values['wave'], starts),
+                'min_pressure': np.fmin.reduceat(pressure, starts),
+                'max_pressure_drop': np.fmax.reduceat(drop, starts)
+            }
+        for i in np.flatnonzero(mask[starts]):
+            run = {
+                'start': times[starts[i]],
+                'end': times[ends[i] - 1],
+                'records': int(ends[i] - starts[i]),
+                'flags': run_flags[i]
+            }
+            run.update({name: peak[i] for name, peak in peaks.items()})
+            if self._run is not None:
+                # Only the chunk's first run can continue the open one
+                run = self._merge_run(self._run, run)
+                self._run = None
+            if ends[i] == len(mask):
+                self._run = run
+            else:
+                self._emit(run)
+
+        self._last_time = times[-1]
+
+    @staticmethod
+    def _merge_run(first, second):
+        merged = dict(first, end=second['end'], records=first['records'] + second['records'],
+                      flags=first['flags'] | second['flags'])
+        for name in ['max_wind', 'max_gust', 'max_hm0', 'max_pressure_drop']:
+            merged[name] = np.fmax(first[name], second[name])
+        merged['min_pressure'] = np.fmin(first['min_pressure'], second['min_pressure'])
+        return merged
+
+    def _close_run(self):
+        self._emit(self._run)
+        self._run = None
+
+    def _emit(self, run):
+        duration = run['end'] - run['start'] + (self._step or pd.Timedelta(0))
+        if duration < self.min_duration:
+            return
+        event = {'station': self.station, 'start': run['start'], 'end': run['end'],
+                 'duration_hours': duration / pd.Timedelta(hours=1), 'records': run['records']}
+        for name in ['max_wind', 'max_gust', 'max_hm0', 'min_pressure', 'max_pressure_drop']:
+            event[name] = float(run[name])
+        event['criteria'] = _criteria_label(run['flags'])
+        self.events.append(event)
+
+    def finish(self):
+        """Close any open run and return the station's events"""
+        if self._run is not None:
+            self._close_run()
+        return self.events
+
+
+def _peak_station(events, group, column, smallest=False):
+    """Station of each group's extreme value (NaN values never win)"""
+    ranked = events.dropna(subset=[column]).sort_values(column, ascending=smallest, kind='stable')
+    return ranked.drop_duplicates(group).set_index(group)['station']
+
+
+def merge_station_events(station_events):
+    """Merge station events overlapping in time into network events
+
+    Events are swept in start order; one joins the current network event
+    while it starts no later than the latest end seen so far. Returns the
+    catalogue (without storm matches) sorted by start.
+    """
+    if not station_events:
+        return pd.DataFrame(columns=EVENT_CATALOGUE_COLUMNS)
+
+    events = pd.DataFrame(station_events).sort_values(['start', 'station'], kind='stable').reset_index(drop=True)
+    events['until'] = events['start'] + pd.to_timedelta(events['duration_hours'], unit='h')
+    latest_end = events['end'].cummax().shift()
+    events['group'] = (events['start'] > latest_end).cumsum()
+
+    grouped = events.groupby('group')
+    catalogue = grouped.agg(start=('start', 'min'), end=('end', 'max'), until=('until', 'max'),
+                            max_wind=('max_wind', 'max'), max_gust=('max_gust', 'max'),
+                            max_hm0=('max_hm0', 'max'), min_pressure=('min_pressure', 'min'),
+                            max_pressure_drop=('max_pressure_drop', 'max'))
+    catalogue['duration_hours'] = (catalogue.pop('until') - catalogue['start']) / pd.Timedelta(hours=1)
+    catalogue['stations'] = grouped['station'].agg(lambda stations: ','.join(dict.fromkeys(stations)))
+    catalogue['station_count'] = grouped['station'].nunique()
+    catalogue['max_wind_station'] = _peak_station(events, 'group', 'max_wind')
+    catalogue['max_hm0_station'] = _peak_station(events, 'group', 'max_hm0')
+    catalogue['min_pressure_station'] = _peak_station(events, 'group', 'min_pressure', smallest=True)
+    catalogue['criteria'] = grouped['criteria'].agg(
+        lambda labels: '+'.join(flag for flag in EVENT_FLAGS
+                                if any(flag in label.split('+') for label in labels)))
+    catalogue['event_id'] = 'EV' + catalogue['start'].dt.strftime('%Y%m%d%H')
+    catalogue['storms'] = ''
+    return catalogue.reset_index(drop=True)[EVENT_CATALOGUE_COLUMNS]
+
+
+def storm_window(storm_info):
+    """Start and end of a named storm's dates, including the whole last day"""
+    storm_dates = [pd.to_datetime(date) for date in storm_info['dates']]
+    return min(storm_dates), max(storm_dates) + timedelta(days=1)
+
+
+def match_named_storms(catalogue, storms_database):
+    """Name the storms each event overlaps in its 'storms' column
+
+    Names are comma-separated in storms_database order; events overlapping
+    no named storm keep an empty string.
+    """
+    matches = [[] for _ in range(len(catalogue))]
+    for storms in storms_database.values():
+        for storm_name, storm_info in storms.items():
+            storm_start, storm_end = storm_window(storm_info)
+            overlapping = (catalogue['start'] <= storm_end) & (catalogue['end'] >= storm_start)
+            for position in np.flatnonzero(overlapping.to_numpy()):
+                matches[position].append(storm_name)
+
+    catalogue = catalogue.copy()
+    catalogue['storms'] = [', '.join(names) for names in matches]
+    return catalogue
+
+
+def _station_year_files(qc_data_dir):
+    """QC'd files grouped by station, each station's years in order"""
+    stations = {}
+    for path in sorted(Path(qc_data_dir).glob("buoy_*_qcd.csv")):
+        match = re.match(r'buoy_(\w+?)_(\d{4})_qcd$', path.stem)
+        if match:
+            stations.setdefault(match.group(1), []).append((match.group(2), path))
+    return {station: [path for _, path in sorted(files)] for station, files in stations.items()}
+
+
+def _read_event_records(path, chunk_rows=None):
+    """Yield the columns the detector needs, whole or in chunks"""
+    header = pd.read_csv(path, nrows=0).columns
+    columns = [column for column in EVENT_COLUMNS if column in header]
+    if chunk_rows:
+        yield from read_qcd_chunks(path, chunk_rows, columns=columns)
+    else:
+        yield read_qcd(path, columns=columns)
+
+
+def detect_storm_events(qc_data_dir, criteria, storms_database=None, chunk_rows=None):
+    """Detect storm events over every station-year in qc_data_dir
+
+    Station-years are read one at a time (in chunks of chunk_rows records
+    when given; each file must then be in time order) and only the event
+    columns are loaded. Returns the event catalogue, matched to
+    storms_database when given.
+    """
+    station_events = []
+    for station, paths in _station_year_files(qc_data_dir).items():
+        detector = StationEventDetector(station, criteria)
+        for path in paths:
+            for chunk in _read_event_records(path, chunk_rows):
+                detector.feed(chunk)
+        station_events.extend(detector.finish())
+
+    catalogue = merge_station_events(station_events)
+    if storms_database:
+        catalogue = match_named_storms(catalogue, storms_database)
+    return catalogue
@@ -0,0 +1,210 @@
+"""
+Test Storm Events
+=================
+Verify storm event detection, merging and named storm matching on
+synthetic QC'd records
+"""
+
+import sys
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+# Add this directory and the QC modules to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'QC'))
+
+from qcd_store import write_qcd
+from storm_events import (StationEventDetector, merge_station_events, match_named_storms,
+                          detect_storm_events, MAX_RECORD_GAP)
+
+CRITERIA = {
+    'wind_speed_threshold': 29.0,
+    'wave_height_threshold': 4.0,
+    'pressure_drop_threshold': 10.0,
+    'duration_hours': 6,
+    'gust_threshold': 39.0
+}
+
+
+def make_records(start, n):
+    """Hourly calm records, every parameter flagged good"""
+    df = pd.DataFrame({'time': pd.date_range(start, periods=n, freq='h')})
+    for column, value in [('windsp', 10.0), ('windgust', 15.0), ('hm0', 2.0), ('airpressure', 1010.0)]:
+        df[column] = value
+        df[f'ind_{column}'] = 1
+    return df
+
+
+def set_between(df, start, end, column, value):
+    df.loc[(df['time'] >= start) & (df['time'] <= end), column] = value
+
+
+def detect(frames, chunk_rows=None):
+    """Events from feeding the frames in order, whole or in chunks"""
+    detector = StationEventDetector('62091', CRITERIA)
+    for df in frames:
+        step = chunk_rows or len(df)
+        for offset in range(0, len(df), step):
+            detector.feed(df.iloc[offset:offset + step])
+    return detector.finish()
+
+
+def make_station_years():
+    """Two station-years with one storm inside 2023 and one across New Year"""
+    late = make_records('2023-12-20 00:00', 288)
+    early = make_records('2024-01-01 00:00', 240)
+    set_between(late, '2023-12-22 06:00', '2023-12-22 15:00', 'windsp', 35.0)
+    set_between(late, '2023-12-22 10:00', '2023-12-22 11:00', 'windgust', 45.0)
+    set_between(late, '2023-12-31 18:00', '2023-12-31 23:00', 'hm0', 5.5)
+    set_between(early, '2024-01-01 00:00', '2024-01-01 06:00', 'hm0', 6.0)
+    set_between(early, '2024-01-03 00:00', '2024-01-03 03:00', 'windsp', 32.0)   # too short
+    return late, early
+
+
+def test_chunked_feed_matches_whole_file():
+    """Chunk size and station-year boundaries do not change the events"""
+    print("Testing chunked detection...")
+    frames = make_station_years()
+    events = detect(frames)
+
+    assert [(e['start'], e['end'], e['records'], e['criteria']) for e in events] == [
+        (pd.Timestamp('2023-12-22 06:00'), pd.Timestamp('2023-12-22 15:00'), 10, 'wind+gust'),
+        (pd.Timestamp('2023-12-31 18:00'), pd.Timestamp('2024-01-01 06:00'), 13, 'wave')
+    ]
+    assert events[0]['max_wind'] == 35.0 and events[0]['max_gust'] == 45.0
+    assert events[1]['max_hm0'] == 6.0 and events[1]['duration_hours'] == 13.0
+    for chunk_rows in [1, 5, 17, 100]:
+        assert detect(frames, chunk_rows) == events, chunk_rows
+
+    # The same through the QC'd files, read whole and in chunks
+    with tempfile.TemporaryDirectory() as tmp:
+        for df, year in zip(frames, ['2023', '2024']):
+            write_qcd(df, os.path.join(tmp, f'buoy_62091_{year}_qcd.csv'))
+        whole = detect_storm_events(tmp, CRITERIA)
+        chunked = detect_storm_events(tmp, CRITERIA, chunk_rows=7)
+    pd.testing.assert_frame_equal(whole, chunked)
+    assert list(whole['start']) == [event['start'] for event in events]
+
+
+def test_runs_split_at_record_gaps():
+    """A gap longer than MAX_RECORD_GAP ends a run, a shorter one does not"""
+    print("Testing record gaps...")
+    df = make_records('2024-01-01 00:00', 30)
+    df['windsp'] = 35.0
+    gap_hours = int(MAX_RECORD_GAP / pd.Timedelta(hours=1))
+
+    # Records 10.. missing: a gap of exactly MAX_RECORD_GAP continues the run
+    short_gap = df.drop(index=range(10, 10 + gap_hours - 1))
+    assert len(detect([short_gap])) == 1
+
+    # One record more and the run splits into two events
+    long_gap = df.drop(index=range(10, 10 + gap_hours))
+    events = detect([long_gap])
+    assert [(e['start'], e['end']) for e in events] == [
+        (pd.Timestamp('2024-01-01 00:00'), pd.Timestamp('2024-01-01 09:00')),
+        (pd.Timestamp('2024-01-01 13:00'), pd.Timestamp('2024-01-02 05:00'))
+    ]
+    # Also when the gap falls on a chunk boundary
+    assert detect([long_gap.iloc[:10], long_gap.iloc[10:]]) == events
+
+
+def test_minimum_duration():
+    """Runs shorter than duration_hours are dropped"""
+    print("Testing minimum duration...")
+    df = make_records('2024-01-01 00:00', 48)
+    set_between(df, '2024-01-01 02:00', '2024-01-01 06:00', 'windsp', 35.0)   # 5 h
+    set_between(df, '2024-01-01 20:00', '2024-01-02 01:00', 'windsp', 35.0)   # 6 h
+    events = detect([df])
+    assert len(events) == 1
+    assert events[0]['start'] == pd.Timestamp('2024-01-01 20:00')
+    assert events[0]['duration_hours'] == 6.0
+
+
+def test_pressure_drop_criterion():
+    """Pressure falling by the threshold within 24 h raises an event on its own"""
+    print("Testing pressure drop...")
+    df = make_records('2024-01-01 00:00', 96)
+    # 1 hPa per hour from 1010 at hour 24 down to 998 at hour 36
+    df['airpressure'] = np.clip(1010.0 - (np.arange(96) - 24.0).clip(0), 998.0, None)
+    events = detect([df])
+    assert len(events) == 1
+    event = events[0]
+    assert event['criteria'] == 'pressure_drop'
+    # Drop reaches 10 hPa at hour 34 and stays above it until hour 25 leaves the window
+    assert event['start'] == pd.Timestamp('2024-01-02 10:00')
+    assert event['end'] == pd.Timestamp('2024-01-03 01:00')
+    assert event['max_pressure_drop'] == 12.0 and event['min_pressure'] == 998.0
+
+    # The same fall spread over 48 h stays under the threshold
+    slow = make_records('2024-01-01 00:00', 96)
+    slow['airpressure'] = 1010.0 - 0.25 * np.arange(96).clip(0, 48)
+    assert detect([slow]) == []
+
+    # A sharp fall flagged bad is ignored
+    flagged = make_records('2024-01-01 00:00', 96)
+    set_between(flagged, '2024-01-02 00:00', '2024-01-02 12:00', 'airpressure', 990.0)
+    set_between(flagged, '2024-01-02 00:00', '2024-01-02 12:00', 'ind_airpressure', 4)
+    assert detect([flagged]) == []
+
+
+def station_event(station, start, end, criteria='wind', max_wind=35.0, max_hm0=5.0, min_pressure=990.0):
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    return {'station': station, 'start': start, 'end': end,
+            'duration_hours': (end - start) / pd.Timedelta(hours=1) + 1, 'records': 0,
+            'max_wind': max_wind, 'max_gust': np.nan, 'max_hm0': max_hm0,
+            'min_pressure': min_pressure, 'max_pressure_drop': 0.0, 'criteria': criteria}
+
+
+def test_overlapping_station_events_merge():
+    """Station events overlapping in time become one network event"""
+    print("Testing network event merging...")
+    catalogue = merge_station_events([
+        station_event('62092', '2024-01-01 10:00', '2024-01-02 02:00', 'wave+pressure_drop',
+                      max_wind=40.0, min_pressure=970.0),
+        station_event('62091', '2024-01-01 00:00', '2024-01-01 12:00', max_hm0=7.0),
+        # Overlaps only the 62092 event, which still extends the network event
+        station_event('62093', '2024-01-01 20:00', '2024-01-02 04:00'),
+        station_event('62094', '2024-01-05 00:00', '2024-01-05 08:00')
+    ])
+    assert len(catalogue) == 2
+    event = catalogue.iloc[0]
+    assert event['event_id'] == 'EV2024010100'
+    assert event['stations'] == '62091,62092,62093' and event['station_count'] == 3
+    assert event['start'] == pd.Timestamp('2024-01-01 00:00')
+    assert event['end'] == pd.Timestamp('2024-01-02 04:00')
+    assert event['duration_hours'] == 29.0
+    assert event['max_wind'] == 40.0 and event['max_wind_station'] == '62092'
+    assert event['max_hm0'] == 7.0 and event['max_hm0_station'] == '62091'
+    assert event['min_pressure'] == 970.0 and event['min_pressure_station'] == '62092'
+    assert event['criteria'] == 'wind+wave+pressure_drop'
+    assert catalogue.iloc[1]['stations'] == '62094'
+    assert merge_station_events([]).empty
+
+
+def test_named_storm_matching():
+    """Events are named after every storm whose dates they overlap"""
+    print("Testing named storm matching...")
+    storms_database = {'2024': {
+        'Storm Isha': {'dates': ['2024-01-21', '2024-01-22']},
+        'Storm Jocelyn': {'dates': ['2024-01-23', '2024-01-24']}
+    }}
+    catalogue = merge_station_events([
+        station_event('62091', '2024-01-10 00:00', '2024-01-10 08:00'),
+        station_event('62091', '2024-01-22 18:00', '2024-01-23 06:00'),
+        station_event('62092', '2024-01-25 06:00', '2024-01-25 12:00')
+    ])
+    matched = match_named_storms(catalogue, storms_database)
+    assert list(matched['storms']) == ['', 'Storm Isha, Storm Jocelyn', '']
+    assert (catalogue['storms'] == '').all()   # input left unchanged
+
+
+if __name__ == "__main__":
+    test_chunked_feed_matches_whole_file()
+    test_runs_split_at_record_gaps()
+    test_minimum_duration()
+    test_pressure_drop_criterion()
+    test_overlapping_station_events_merge()
+    test_named_storm_matching()
+    print("\nTest completed!")
@@ -0,0 +1,140 @@
+"""
+Test Storm Peaks
+================
+Verify the vectorized storm peak table against per-parameter idxmax over
+each station's good records
+"""
+
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Add this directory to path to import the storm modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from storm_analyzer import storm_peak_table, PEAK_PARAMETERS, QC_SUMMARY_VALUES
+
+
+def make_frame(start, n=48, seed=0):
+    """Hourly storm slice with every peak parameter flagged good"""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'time': pd.date_range(start, periods=n, freq='h'),
+        'qc_ind': 1
+    })
+    for column in ['windsp', 'windgust', 'hm0', 'hmax', 'airpressure', 'airtemp']:
+        df[column] = rng.uniform(1, 30, n).round(1)
+        df[f'ind_{column}'] = 1
+    df['airpressure'] += 960
+    return df
+
+
+def reference_peaks(frames):
+    """Peaks as the analyzer used to find them: idxmax/idxmin per parameter
+    over the good records, with a station's frames taken in order"""
+    df = pd.concat(frames, ignore_index=True)
+    row = {'records': len(df)}
+    for qc_val in QC_SUMMARY_VALUES:
+        row[f'qc_{qc_val}'] = int((df['qc_ind'] == qc_val).sum())
+    for name, column, indicator, kind in PEAK_PARAMETERS:
+        good = df[(df[indicator] == 1) & df[column].notna()] if column in df else df.iloc[:0]
+        row[f'{name}_good'] = len(good)
+        if good.empty:
+            row[name], row[f'{name}_time'] = np.nan, pd.NaT
+            continue
+        idx = good[column].idxmin() if kind == 'min' else good[column].idxmax()
+        row[name], row[f'{name}_time'] = good.loc[idx, column], good.loc[idx, 'time']
+    return row
+
+
+def make_storm_data():
+    """Storm slices keyed as in the analyzer, plus each station's frames in order"""
+    # 62091 spans a year boundary, so it has two station-year frames
+    first = make_frame('2023-12-30 00:00', seed=1)
+    second = make_frame('2024-01-01 00:00', seed=2)
+    first.loc[5, 'windsp'] = 60.0
+    first.loc[6, 'ind_windsp'] = 4            # flagged, higher value ignored
+    first.loc[6, 'windsp'] = 90.0
+    second.loc[10, 'windsp'] = 60.0           # tie across frames: first frame wins
+    first.loc[[3, 20], 'hmax'] = 40.0         # tie within a frame: earliest wins
+    second.loc[30, 'airpressure'] = 940.0     # minimum in the second frame
+    first.loc[2, 'qc_ind'] = 4
+    second.loc[7, 'qc_ind'] = 9
+
+    # 62092 has a parameter with no usable values, gaps and NaT times
+    other = make_frame('2024-01-01 00:00', seed=3)
+    other['windgust'] = np.nan
+    other['ind_airtemp'] = 4
+    other.loc[::5, 'hm0'] = np.nan
+    other.loc[12, 'hm0'] = 35.0
+    other.loc[[12, 13], 'time'] = pd.NaT      # peak on a record without a time
+
+    # 62093 has no gust sensor at all
+    no_gust = make_frame('2024-01-01 00:00', seed=4).drop(columns=['windgust', 'ind_windgust'])
+
+    storm_data = {
+        '62091_2023': first,
+        '62092_2024': other,
+        '62091_2024': second,
+        '62093_2024': no_gust
+    }
+    stations = {'62091': [first, second], '62092': [other], '62093': [no_gust]}
+    return storm_data, stations
+
+
+def assert_matches(table, station, expected):
+    row = table.loc[station]
+    for column, value in expected.items():
+        if column.endswith('_time'):
+            assert (pd.isna(value) and pd.isna(row[column])) or row[column] == value, (station, column)
+        elif isinstance(value, float) and np.isnan(value):
+            assert np.isnan(row[column]), (station, column)
+        else:
+            assert row[column] == value, (station, column, row[column], value)
+
+
+def test_peak_table_matches_idxmax():
+    """Every station's peaks, times and counts match the per-parameter reference"""
+    print("Testing storm peak table against idxmax...")
+    storm_data, stations = make_storm_data()
+    table = storm_peak_table(storm_data)
+
+    assert list(table.index) == ['62091', '62092', '62093']
+    for station, frames in stations.items():
+        assert_matches(table, station, reference_peaks(frames))
+
+
+def test_ties_missing_and_station_years():
+    """Ties keep the first record, empty parameters give NaN/NaT, station-years combine"""
+    print("Testing ties, missing parameters and station-years...")
+    storm_data, _ = make_storm_data()
+    table = storm_peak_table(storm_data)
+
+    wind = table.loc['62091']
+    assert wind['sustained_wind'] == 60.0
+    assert wind['sustained_wind_time'] == pd.Timestamp('2023-12-30 05:00')
+    assert wind['hmax_time'] == pd.Timestamp('2023-12-30 03:00')
+    assert wind['min_pressure'] == 940.0
+    assert wind['min_pressure_time'] == pd.Timestamp('2024-01-02 06:00')
+    assert wind['records'] == 96 and wind['qc_1'] == 94 and wind['qc_4'] == 1 and wind['qc_9'] == 1
+    assert wind['sustained_wind_good'] == 95
+
+    gaps = table.loc['62092']
+    assert np.isnan(gaps['gust_wind']) and pd.isna(gaps['gust_wind_time']) and gaps['gust_wind_good'] == 0
+    assert np.isnan(gaps['max_temperature']) and pd.isna(gaps['min_temperature_time'])
+    assert gaps['hm0'] == 35.0 and pd.isna(gaps['hm0_time'])
+
+    assert np.isnan(table.loc['62093', 'gust_wind']) and table.loc['62093', 'gust_wind_good'] == 0
+
+    for name, *_ in PEAK_PARAMETERS:
+        assert table[name].dtype == 'float64'
+        assert pd.api.types.is_datetime64_any_dtype(table[f'{name}_time'])
+        assert table[f'{name}_good'].dtype == 'int64'
+    assert table['records'].dtype == 'int64'
+
+
+if __name__ == "__main__":
+    test_peak_table_matches_idxmax()
+    test_ties_missing_and_station_years()
+    print("\nTest completed!")
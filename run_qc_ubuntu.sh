@@ -64,7 +64,7 @@ echo ""
 echo "Running QC processing..."
 echo "========================"
 cd "QC"
-python buoy_qc_processor.py
+python buoy_qc_processor.py "$@"
 if [ $? -ne 0 ]; then
     echo "ERROR: QC processing failed"
     cd ..
@@ -50,7 +50,7 @@ echo.
 echo Running QC processing...
 echo ========================
 cd "QC"
-python buoy_qc_processor.py
+python buoy_qc_processor.py %*
 if errorlevel 1 (
     echo ERROR: QC processing failed
     cd ..
@@ -14,26 +14,13 @@ class Command(BaseCommand):
         sys.path.append(qc_scripts_path)
         
         try:
-            from buoy_qc_processor import BuoyQCProcessor
-            processor = BuoyQCProcessor()
+            from qc_config import QCConfig
+            from parameter_metadata import PARAMETER_METADATA
+            processor = QCConfig()
             
             # Create QC parameters from default limits
             self.stdout.write('Creating QC parameters...')
-            parameter_mapping = {
-                'airpressure': {'display_name': 'Air Pressure', 'unit': 'hPa', 'type': 'environmental'},
-                'airtemp': {'display_name': 'Air Temperature', 'unit': '°C', 'type': 'environmental'},
-                'humidity': {'display_name': 'Humidity', 'unit': '%', 'type': 'environmental'},
-                'seatemp_16': {'display_name': 'Sea Temperature (16)', 'unit': '°C', 'type': 'water'},
-                'seatemp_aa': {'display_name': 'Sea Temperature (AA)', 'unit': '°C', 'type': 'water'},
-                'windsp': {'display_name': 'Wind Speed', 'unit': 'knots', 'type': 'environmental'},
-                'windgust': {'display_name': 'Wind Gust', 'unit': 'm/s', 'type': 'environmental'},
-                'winddir': {'display_name': 'Wind Direction', 'unit': '°', 'type': 'environmental'},
-                'hm0': {'display_name': 'Significant Wave Height', 'unit': 'm', 'type': 'wave'},
-                'hmax': {'display_name': 'Maximum Wave Height', 'unit': 'm', 'type': 'wave'},
-                'tp': {'display_name': 'Wave Period', 'unit': 's', 'type': 'wave'},
-                'mdir': {'display_name': 'Mean Wave Direction', 'unit': '°', 'type': 'wave'},
-                'salinity_16': {'display_name': 'Salinity', 'unit': 'ppt', 'type': 'water'}
-            }
+            parameter_mapping = PARAMETER_METADATA
             
             for param_name, param_info in parameter_mapping.items():
                 if param_name in processor.default_qc_limits:
@@ -186,11 +186,14 @@ def run_qc_processing(request):
 
 @api_view(['GET'])
 def download_qc_file(request, station_id, year, file_type):
-    """Download QC files (CSV, PDF, PNG)"""
+    """Download QC files (CSV, Parquet, PDF, PNG)"""
     try:
         # Construct file path based on type
         if file_type == 'csv':
             filename = f'buoy_{station_id}_{year}_qcd.csv'
+        elif file_type == 'parquet':
+            # Typed columnar copy written alongside the CSV
+            filename = f'buoy_{station_id}_{year}_qcd.parquet'
         elif file_type == 'pdf':
             filename = f'buoy_{station_id}_{year}_qc_report.pdf'
         elif file_type == 'png':
@@ -159,8 +159,8 @@ class QCRequestHandler(BaseHTTPRequestHandler):
     def serve_qc_limits_api(self):
         """QC limits API endpoint"""
         try:
-            from buoy_qc_processor import BuoyQCProcessor
-            processor = BuoyQCProcessor()
+            from qc_config import QCConfig
+            processor = QCConfig()
             
             response = {
                 'default_limits': processor.default_qc_limits,
@@ -177,8 +177,8 @@ class QCRequestHandler(BaseHTTPRequestHandler):
     def serve_station_limits_api(self, station_id):
         """Station-specific QC limits"""
         try:
-            from buoy_qc_processor import BuoyQCProcessor
-            processor = BuoyQCProcessor()
+            from qc_config import QCConfig
+            processor = QCConfig()
             
             station_limits = {}
             for param in processor.key_parameters: